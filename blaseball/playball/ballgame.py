@@ -18,19 +18,23 @@ Then you start the game with BallGame.start_game() and run the game through call
 Ballgame sends and receives updates through Messenger, and keeps track of the game state and moves things along
 as-needed.
 
+Give BallGame a numpy Generator and every roll made during its ticks is drawn from that, so the game plays out the
+same for the same seed no matter what else is going on (see util.rng). Without one, it shares the global stream.
+
 """
 
 from decimal import Decimal
 from loguru import logger
-from typing import Union
-from copy import copy
+from numpy.random import Generator
+from typing import Callable, Union
 
 from blaseball.playball.event import Update
-from blaseball.playball.gamestate import GameState, GameTags, GameRules, BaseSummary
+from blaseball.playball.gamestate import GameState, GameTags, GameRules, BaseSummary, to_tenths
 from blaseball.playball.statsmonitor import StatsMonitor
 from blaseball.stats.lineup import Lineup
 from blaseball.stats.stadium import Stadium
 from blaseball.util.messenger import Messenger
+from blaseball.util import rng
 
 
 class GameManagmentUpdate(Update):
@@ -50,15 +54,11 @@ class BallGame:
             home: Lineup,
             away: Lineup,
             stadium: Stadium,
-            rules: GameRules
+            rules: GameRules,
+            generator: Generator = None
     ) -> "BallGame":
         """Create a new ballgame and initialize all required managers and services to support it."""
-        game_messenger = Messenger()
-
-        ballgame = BallGame(all_game_messenger, home, away, stadium, rules)
-        StatsMonitor(game_messenger, ballgame.state)
-
-        return ballgame
+        return BallGame(all_game_messenger, home, away, stadium, rules, generator=generator)
 
     def __init__(
             self,
@@ -68,8 +68,12 @@ class BallGame:
             stadium: Stadium,
             rules: GameRules,
             game_messenger: Messenger = None,  # this game's internal messenger (used for testing)
+            generator: Generator = None,  # this game's own random stream
+            flavour: Generator = None,  # and its stream for feed text rolls, see util.rng
     ):
         self.state = GameState(home, away, stadium, rules)
+        # kept as a stream rather than a bare generator, so rolls drawn ahead of time carry over between ticks
+        self.random_stream = None if generator is None else rng.RandomStream(generator, flavour=flavour)
         self.needs_new_batter = [True, True]
         self.live_game = True
         self.tick_count = 0
@@ -78,7 +82,10 @@ class BallGame:
 
         # all_game_messenger.subscribe(self.send_tick, None)  # TODO
 
+        if game_messenger is None:
+            game_messenger = Messenger()
         self.messenger = game_messenger
+        self.stats_monitor = StatsMonitor(self.messenger, self.state)
 
         self.messenger.subscribe(self.score_runs, GameTags.runs_scored)
         self.messenger.subscribe(self.add_ball, GameTags.ball)
@@ -98,31 +105,36 @@ class BallGame:
                            f"{self.state.teams[1]['pitcher']['team']}!")
         self.messenger.send(GameManagmentUpdate(start_game_text), [GameTags.game_updates, GameTags.game_start])
 
+    def announce(self, build_text: Callable[[], str]) -> None:
+        """Send a text-only Update on game_updates. build_text is only called if something is listening,
+        so games nobody is watching skip writing their feed entirely."""
+        if self.messenger.has_listeners(GameTags.game_updates):
+            self.messenger.send(Update(build_text()), GameTags.game_updates)
+
     def score_runs(self, runs: Union[int, Decimal]):
-        self.state.scores[self.state.offense_i()] += runs
+        self.state.score_tenths[self.state.offense_i()] += to_tenths(runs)
         if runs == 1:
             plural_text = "run"
         else:
             plural_text = "runs"
-        self.messenger.send(Update(f"{runs} {plural_text} scored!"), GameTags.game_updates)
-        self.messenger.send(Update(self.state.score_string()), GameTags.game_updates)
+        self.announce(lambda: f"{runs} {plural_text} scored!")
+        self.announce(self.state.score_string)
 
     def add_ball(self):
         """Add a ball to the count, issue walk if needed"""
         self.state.balls += 1
         if self.state.balls >= self.state.rules.ball_count:
-            self.messenger.send(Update(f"{self.state.count_string()}. {self.state.batter()['name']} draws a walk."),
-                                GameTags.game_updates)
+            self.announce(lambda: f"{self.state.count_string()}. {self.state.batter()['name']} draws a walk.")
             self.messenger.send(self.state.batter(), GameTags.player_walked)
             self.increment_batter()
         else:
-            self.messenger.send(Update("Ball. " + self.state.count_string()), GameTags.game_updates)
+            self.announce(lambda: "Ball. " + self.state.count_string())
 
     def add_foul(self):
         """add a strike to the count, if applicable"""
         if self.state.strikes < self.state.rules.strike_count - 1:
             self.state.strikes += 1
-        self.messenger.send(Update("Foul ball. " + self.state.count_string()), GameTags.game_updates)
+        self.announce(lambda: "Foul ball. " + self.state.count_string())
 
     def add_strike(self, strike_swinging):
         """add a strike to the count, issue out if needed"""
@@ -134,22 +146,22 @@ class BallGame:
             swing_text = "looking"
 
         if self.state.strikes < self.state.rules.strike_count:
-            self.messenger.send(Update(f"Strike {swing_text}. {self.state.count_string()}"), GameTags.game_updates)
+            self.announce(lambda: f"Strike {swing_text}. {self.state.count_string()}")
         else:
-            self.messenger.send(Update(f"{self.state.batter()['name']} struck out {swing_text}."), GameTags.game_updates)
+            self.announce(lambda: f"{self.state.batter()['name']} struck out {swing_text}.")
             self.increment_batter()
             self.messenger.send(1, GameTags.outs)
 
     def player_hit_ball(self, ball):
-        self.increment_batter()
+        if not ball.foul:  # fouls just add to the count, see add_foul
+            self.increment_batter()
 
     def start_at_bat(self):
         self.state.strikes = 0
         self.state.balls = 0
         self.needs_new_batter[self.state.offense_i()] = False
         self.messenger.send(self.state.batter(), GameTags.new_batter)
-        new_player_message = f"{self.state.batter()['name']} stepping up to bat."
-        self.messenger.send(Update(new_player_message), GameTags.game_updates)
+        self.announce(lambda: f"{self.state.batter()['name']} stepping up to bat.")
 
     def increment_batter(self):
         """queue up the next batter."""
@@ -167,8 +179,7 @@ class BallGame:
     def batter_mercy(self):
         """If a pitcher throws 64 pitches against a single batter, something is wrong, so mark them out for a run."""
         logger.warning(f"Batter mercy: {self.state.batter()} vs {self.state.defense()['pitcher']}")
-        self.messenger.send(Update(f"Batter {self.state.batter()} is out on the mercy rule!"),
-                            GameTags.game_updates)
+        self.announce(lambda: f"Batter {self.state.batter()} is out on the mercy rule!")
         self.messenger.send(Decimal("0.9"), GameTags.runs_scored)
         self.messenger.send(1, GameTags.outs)
         self.increment_batter()
@@ -176,15 +187,13 @@ class BallGame:
     def pitcher_mercy(self):
         """If a pitcher fails to retire 64 batters, the inning is over."""
         logger.warning(f"Pitcher mercy: {self.state.defense()['pitcher']} vs {self.state.offense()['team']}")
-        self.messenger.send(Update(f"Pitcher {self.state.defense()['pitcher']} invokes the mercy rule!"),
-                            GameTags.game_updates)
+        self.announce(lambda: f"Pitcher {self.state.defense()['pitcher']} invokes the mercy rule!")
         self.messenger.send(Decimal("0.1") + len(self.state.bases), GameTags.runs_scored)
         self.end_half()
 
     def inning_mercy(self):
         logger.warning(f"Inning mercy: {self.state.away_team['team']} at {self.state.home_team['team']}")
-        self.messenger.send(Update(f"The home team receives a boon to move things along, please."),
-                            GameTags.game_updates)
+        self.announce(lambda: f"The home team receives a boon to move things along, please.")
         self.messenger.send(Decimal("0.1"), GameTags.runs_scored)
 
     def update_basepaths(self, summary: BaseSummary):
@@ -192,16 +201,18 @@ class BallGame:
 
     def send_tick(self):
         """Send a new gamestate tick, calling for the next pitch."""
-        self.tick_count += 1
-        self.batter_mercy_count += 1
-        if self.batter_mercy_count >= 64:
-            self.batter_mercy()
-        if self.needs_new_batter[self.state.offense_i()]:
-            self.start_at_bat()
-
-        new_state = copy(self.state)
-        self.messenger.send(new_state, GameTags.pre_tick)
-        self.messenger.queue(new_state, GameTags.state_ticks)
+        stream = self.random_stream if self.random_stream is not None else rng.get_stream()
+        with rng.using(stream):
+            self.tick_count += 1
+            self.batter_mercy_count += 1
+            if self.batter_mercy_count >= 64:
+                self.batter_mercy()
+            if self.needs_new_batter[self.state.offense_i()]:
+                self.start_at_bat()
+
+            new_state = self.state.copy()
+            self.messenger.send(new_state, GameTags.pre_tick)
+            self.messenger.queue(new_state, GameTags.state_ticks)
 
     def add_outs(self, outs):
         """Add a number of outs, will move game along."""
@@ -217,7 +228,7 @@ class BallGame:
             # we're in the top of the inning
             self.state.inning_half -= 1
             self.messenger.queue(self.state.inning_half, GameTags.new_half)
-        elif self.state.inning > self.state.rules.innings and self.state.scores[0] != self.state.scores[1]:
+        elif self.state.inning > self.state.rules.innings and self.state.score_tenths[0] != self.state.score_tenths[1]:
             self.end_game()
         else:
             self.messenger.send(GameManagmentUpdate(f"Inning {self.state.inning} is now an outing."),
@@ -235,12 +246,12 @@ class BallGame:
         self.state.outs = 0
         self.state.bases = BaseSummary(self.state.stadium.NUMBER_OF_BASES)
         self.messenger.send(self.state.bases, GameTags.bases_update)
-        self.messenger.send(Update(f"{self.state.half_str().title()} of inning {self.state.inning}, "
-                                   f"{self.state.batter()['team']} batting."), GameTags.game_updates)
+        self.announce(lambda: f"{self.state.half_str().title()} of inning {self.state.inning}, "
+                              f"{self.state.batter()['team']} batting.")
 
     def next_inning(self, inning):
         """Start the next inning"""
-        self.messenger.send(Update(f"{self.state.defense()['pitcher']} pitching."), GameTags.game_updates)
+        self.announce(lambda: f"{self.state.defense()['pitcher']} pitching.")
 
     def end_game(self):
         self.live_game = False
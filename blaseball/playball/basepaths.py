@@ -12,9 +12,10 @@ managed by the Basepaths class.
 from blaseball.playball.gamestate import BaseSummary
 from blaseball.stats.players import Player
 from blaseball.stats.stadium import Stadium
+from blaseball.stats import stats as s
 from blaseball.util.geometry import Coord
 
-from numpy.random import normal
+from blaseball.util.rng import normal
 from typing import List, Tuple, Optional, Union
 from collections.abc import MutableMapping
 from loguru import logger
@@ -86,7 +87,7 @@ class Runner:
         self.player = player
         self.basepath_length = basepath_length
 
-        self.speed = calc_speed(player['speed'])
+        self.speed = calc_speed(player[s.speed])
 
         self.base = 0  # last base touched by this player
         self.remainder = 0  # how far down the basepath they've gone, in feet.
@@ -147,8 +148,8 @@ class Runner:
         if base is not None:
             self.base = base
 
-        max_awareness = max(catcher['awareness'], pitcher['awareness'])
-        self.remainder = calc_leadoff(self.player['bravery'], pitcher['throwing'], max_awareness)
+        max_awareness = max(catcher[s.awareness], pitcher[s.awareness])
+        self.remainder = calc_leadoff(self.player[s.bravery], pitcher[s.throwing], max_awareness)
 
         self.tagging_up = False
         self.holding = False
@@ -168,16 +169,16 @@ class Runner:
         duration += hit_duration_bonus
 
         if max_base - min_base < 0:
-            raise RuntimeError(f"{self.player['name']} caught in a pickle between {min_base} and {max_base}!")
+            raise RuntimeError(f"{self.player[s.name]} caught in a pickle between {min_base} and {max_base}!")
 
         if self.tagging_up:
             # player is currently tagging up due to the rules of blaseball (caught fly, etc)
             if self.base == 0:
-                raise RuntimeError(f"{self.player['name']} attempting to tag up with base 0!")
+                raise RuntimeError(f"{self.player[s.name]} attempting to tag up with base 0!")
             elif self.base < min_base:
-                raise RuntimeError(f"{self.player['name']} attempting to tag up to invalid base {min_base}")
+                raise RuntimeError(f"{self.player[s.name]} attempting to tag up to invalid base {min_base}")
             elif self.base > max_base:
-                raise RuntimeError(f"{self.player['name']} attempting to tag up past max base {max_base}, "
+                raise RuntimeError(f"{self.player[s.name]} attempting to tag up past max base {max_base}, "
                                    f"current base {self.base}")
             self.forward = False
             self.force = True
@@ -187,11 +188,11 @@ class Runner:
             # player is in a forced state
             self.force = True
             if self.base > max_base:
-                raise RuntimeError(f"{self.player['name']} more than two bases ahead! {self.base} vs max {max_base}")
+                raise RuntimeError(f"{self.player[s.name]} more than two bases ahead! {self.base} vs max {max_base}")
             elif self.base == max_base:
                 self.forward = False
             elif self.base < min_base - 1:
-                raise RuntimeError(f"{self.player['name']} more than two bases behind! {self.base} vs min {min_base}")
+                raise RuntimeError(f"{self.player[s.name]} more than two bases behind! {self.base} vs min {min_base}")
             elif self.base == min_base - 1:
                 self.forward = True
             return
@@ -209,8 +210,8 @@ class Runner:
             net_time_to_advance = roll_net_advance_time(
                 duration,
                 self.time_to_base(),
-                self.player['timing'],
-                self.player['bravery']
+                self.player[s.timing],
+                self.player[s.bravery]
             )
             self.forward = net_time_to_advance > 0
 
@@ -264,7 +265,7 @@ class Runner:
         """Return the player's current coordinates"""
         start_base = base_locations[self.base]
         next_base = base_locations[self.next_base()]
-        distance_ratio = self.remainder / start_base.distance(next_base)
+        distance_ratio = self.remainder / self.basepath_length
         x = (next_base.x - start_base.x) * distance_ratio + start_base.x
         y = (next_base.y - start_base.y) * distance_ratio + start_base.y
         return Coord(x, y)
@@ -276,10 +277,10 @@ class Runner:
             text = "advancing from"
         else:
             text = "tagging up to"
-        return f"{self.player['name']} {text} base {self.base} with remainder {self.remainder:.0f}"
+        return f"{self.player[s.name]} {text} base {self.base} with remainder {self.remainder:.0f}"
 
     def __repr__(self):
-        return f"<Runner {self.player['name']} on base {self.base} with remainder {self.remainder:.0f}>"
+        return f"<Runner {self.player[s.name]} on base {self.base} with remainder {self.remainder:.0f}>"
 
     def __bool__(self):
         return not self.safe
@@ -410,7 +411,7 @@ class Basepaths(MutableMapping):
             string += f"{i}: "
             for runner in self.runners:
                 if runner.base == i:
-                    string += runner.player['name']
+                    string += runner.player[s.name]
             string += "\r\n"
         return string
 
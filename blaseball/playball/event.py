@@ -18,15 +18,33 @@ and use.
 
 """
 
-from typing import List, Callable, Union, TYPE_CHECKING
+from typing import List, Callable, Optional, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from blaseball.playball.gamestate import GameState
 
 
 class Update:
-    """An update is a single moment, which updates the game state, draws on the image, or adds text."""
+    """An update is a single moment, which updates the game state, draws on the image, or adds text.
+
+    Text can be given up front, or left to build_text: updates that carry their own fields can override that
+    to write their text the first time anybody reads it, so a headless game that never reads its feed never
+    pays for the formatting."""
     def __init__(self, text: str = None):
-        self.text = text
+        self._text = text
+
+    def build_text(self) -> Optional[str]:
+        """Write this update's text from its fields. Only called when text is read and hasn't been set."""
+        return None
+
+    @property
+    def text(self) -> Optional[str]:
+        if self._text is None:
+            self._text = self.build_text()
+        return self._text
+
+    @text.setter
+    def text(self, text: Optional[str]):
+        self._text = text
 
     def __str__(self):
         if self.text is not None:
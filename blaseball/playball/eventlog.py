@@ -0,0 +1,227 @@
+"""
+The event log records a game as a flat table: one fixed-width record for every pitch, swing, hit ball, basepath
+update, run and out, in a NumPy structured array. Unlike the game feed (which is Updates, holding on to Players and
+LiveBalls and text), a log holds nothing but numbers - so a whole season's worth can be kept in memory, saved to disk
+and queried with plain numpy.
+
+Every record starts with the state of the game as its tick began (inning, count, scores, who's batting, pitching,
+and on base), followed by fields for each kind of event - only the ones that match the record's kind are filled in.
+Players are stored by cid, with -1 for nobody, and scores and runs are stored in tenths of a run.
+
+To pull every pitch out of a log:
+    pitches = events[events['kind'] == EventKind.pitch]
+"""
+
+from decimal import Decimal
+from enum import IntEnum
+
+import numpy as np
+
+from blaseball.playball.gamestate import GameState, GameTags, BaseSummary, to_tenths
+from blaseball.playball.hitting import Swing
+from blaseball.playball.liveball import HitBall
+from blaseball.playball.pitching import Pitch
+from blaseball.stats.players import Player
+from blaseball.stats.stadium import Stadium
+from blaseball.util.messenger import Messenger
+
+from typing import Optional, Union
+
+
+class EventKind(IntEnum):
+    pitch = 1
+    swing = 2
+    hit_ball = 3
+    bases_update = 4
+    runs_scored = 5
+    outs = 6
+    new_batter = 7
+    game_over = 8
+
+
+BASE_SLOTS = Stadium.NUMBER_OF_BASES + 1  # home plate, then each base
+
+EVENT_DTYPE = np.dtype([
+    ('game', np.uint32),
+    ('tick', np.uint32),
+    ('kind', np.uint8),
+    # the game as the tick started
+    ('inning', np.uint16),
+    ('half', np.uint8),
+    ('outs', np.uint8),
+    ('balls', np.uint8),
+    ('strikes', np.uint8),
+    ('home_score', np.int32),  # tenths
+    ('away_score', np.int32),  # tenths
+    ('home_at_bat', np.uint8),
+    ('away_at_bat', np.uint8),
+    ('batter', np.int32),
+    ('pitcher', np.int32),
+    ('bases', np.int32, (BASE_SLOTS,)),
+    # pitch
+    ('target', np.float32),
+    ('location', np.float32),
+    ('obscurity', np.float32),
+    ('difficulty', np.float32),
+    ('reduction', np.float32),
+    ('strike', np.bool_),
+    # swing
+    ('swung', np.bool_),
+    ('hit', np.bool_),
+    ('hit_quality', np.float32),
+    # hit ball
+    ('launch_angle', np.float32),
+    ('field_angle', np.float32),
+    ('speed', np.float32),
+    ('foul', np.bool_),
+    ('home_run', np.bool_),
+    # runs scored, outs, new batter and basepath updates
+    ('runs', np.int32),  # tenths
+    ('outs_made', np.uint8),
+    ('player', np.int32),
+    ('runners', np.int32, (BASE_SLOTS,)),
+])
+
+EVENT_HEADER_FIELDS = EVENT_DTYPE.names[:EVENT_DTYPE.names.index('bases') + 1]
+EVENT_PAYLOAD_FIELDS = EVENT_DTYPE.names[len(EVENT_HEADER_FIELDS):]
+
+NO_PLAYER = -1
+_NO_BASES = (NO_PLAYER,) * BASE_SLOTS
+
+# what a record holds in the fields that don't apply to its kind
+BLANK_PAYLOAD = tuple(
+    {'player': NO_PLAYER, 'runners': _NO_BASES}.get(name, 0) for name in EVENT_PAYLOAD_FIELDS
+)
+
+
+def cid_or_none(player: Optional[Player]) -> int:
+    return NO_PLAYER if player is None else player.cid
+
+
+def base_cids(bases: BaseSummary) -> tuple:
+    cids = tuple(cid_or_none(player) for player in bases)
+    return (cids + _NO_BASES)[:BASE_SLOTS]
+
+
+class EventLog:
+    """A listener which records everything that happens in a game into a structured array.
+    Like StatsMonitor, it keeps the last game state it saw, to know who's batting and pitching."""
+    def __init__(self, messenger: Messenger, game_id: int = 0, capacity: int = 1024):
+        self.game_id = game_id
+        self._events = np.zeros(capacity, dtype=EVENT_DTYPE)
+        self._count = 0
+        self.tick = 0
+        self.current_state = None
+        self._header = None
+        self._new_batter = None
+        self.subscribe_all(messenger)
+
+    def subscribe_all(self, messenger: Messenger):
+        messenger.subscribe(self.new_game_state, GameTags.pre_tick, priority=-20)
+        messenger.subscribe(self.record_pitch, GameTags.pitch, priority=-20)
+        messenger.subscribe(self.record_swing, GameTags.swing, priority=-20)
+        messenger.subscribe(self.record_hit_ball, GameTags.hit_ball, priority=-20)
+        messenger.subscribe(self.record_bases, GameTags.bases_update, priority=-20)
+        messenger.subscribe(self.record_runs, GameTags.runs_scored, priority=-20)
+        messenger.subscribe(self.record_outs, GameTags.outs, priority=-20)
+        messenger.subscribe(self.record_new_batter, GameTags.new_batter, priority=-20)
+        messenger.subscribe(self.record_game_over, GameTags.game_over, priority=-20)
+
+    @property
+    def events(self) -> np.ndarray:
+        """Everything recorded so far. This is a view, so copy it if you're going to keep it past the game."""
+        return self._events[:self._count]
+
+    def __len__(self):
+        return self._count
+
+    def of_kind(self, kind: EventKind) -> np.ndarray:
+        events = self.events
+        return events[events['kind'] == kind]
+
+    def save(self, path) -> None:
+        """Write the log to path as a .npy file; read it back with load_events."""
+        np.save(path, self.events, allow_pickle=False)
+
+    def _state_header(self, state: GameState) -> tuple:
+        return (
+            state.inning,
+            state.inning_half,
+            state.outs,
+            state.balls,
+            state.strikes,
+            state.score_tenths[0],
+            state.score_tenths[1],
+            state.at_bat_numbers[0],
+            state.at_bat_numbers[1],
+            state.batter().cid,
+            state.defense()['pitcher'].cid,
+            base_cids(state.bases),
+        )
+
+    def _record(self, kind: EventKind, **fields) -> None:
+        if self._count == len(self._events):
+            self._events = np.resize(self._events, len(self._events) * 2)
+        if self._header is None:
+            self._header = self._state_header(self.current_state)
+        payload = BLANK_PAYLOAD if not fields else tuple(
+            fields.get(name, blank) for name, blank in zip(EVENT_PAYLOAD_FIELDS, BLANK_PAYLOAD)
+        )
+        self._events[self._count] = (self.game_id, self.tick, kind) + self._header + payload
+        self._count += 1
+
+    def new_game_state(self, game_state: GameState):
+        # every event this tick shares the same header, so it's only built once
+        self.tick += 1
+        self.current_state = game_state
+        self._header = self._state_header(game_state)
+        if self._new_batter is not None:
+            self._record(EventKind.new_batter, player=self._new_batter)
+            self._new_batter = None
+
+    def record_pitch(self, pitch: Pitch):
+        self._record(
+            EventKind.pitch,
+            target=pitch.target,
+            location=pitch.location,
+            obscurity=pitch.obscurity,
+            difficulty=pitch.difficulty,
+            reduction=pitch.reduction,
+            strike=pitch.strike,
+        )
+
+    def record_swing(self, swing: Swing):
+        self._record(EventKind.swing, swung=swing.did_swing, hit=swing.hit, hit_quality=swing.hit_quality)
+
+    def record_hit_ball(self, hit_ball: HitBall):
+        self._record(
+            EventKind.hit_ball,
+            launch_angle=hit_ball.live.launch_angle,
+            field_angle=hit_ball.live.field_angle,
+            speed=hit_ball.live.speed,
+            foul=hit_ball.foul,
+            home_run=hit_ball.homerun,
+        )
+
+    def record_bases(self, bases: BaseSummary):
+        self._record(EventKind.bases_update, runners=base_cids(bases))
+
+    def record_runs(self, runs: Union[int, Decimal]):
+        self._record(EventKind.runs_scored, runs=to_tenths(runs))
+
+    def record_outs(self, outs: int):
+        self._record(EventKind.outs, outs_made=outs)
+
+    def record_new_batter(self, batter: Player):
+        # new batters are sent just before the tick they bat in, so they're recorded with that tick
+        self._new_batter = batter.cid
+
+    def record_game_over(self, __=None):
+        # the last tick's header is out of date by now; this records the final score
+        self._header = self._state_header(self.current_state)
+        self._record(EventKind.game_over)
+
+
+def load_events(path) -> np.ndarray:
+    """Read a log written by EventLog.save."""
+    return np.load(path, allow_pickle=False)
@@ -7,8 +7,9 @@ BasePaths - happens in inplay.py.
 from blaseball.playball.liveball import LiveBall
 from blaseball.playball.event import Update
 from blaseball.stats.players import Player
+from blaseball.stats import stats as s
 
-from numpy.random import normal, rand
+from blaseball.util.rng import normal, rand
 
 # TODO: add stats, probably once we do the big stats overhaul
 
@@ -76,24 +77,28 @@ class Catch(Update):
     def __init__(self, ball: LiveBall, fielder: Player, distance: float):
         super().__init__()
 
-        self.reach_odds = calc_reach_odds(distance, fielder['reach'])
-        self.grab_odds = calc_grabbiness_odds(fielder['grabbiness'])
+        self.reach_odds = calc_reach_odds(distance, fielder[s.reach])
+        self.grab_odds = calc_grabbiness_odds(fielder[s.grabbiness])
         self.total_odds = self.reach_odds * self.grab_odds
 
         self.duration = ball.flight_time()
-        self.player_name = fielder['name']
+        self.player_name = fielder[s.name]
 
-        if roll_to_catch(self.total_odds):
-            if ball.catchable:
-                self.text = f"{self.player_name} caught it for a fly out."
-                self.caught = True
-            else:
-                self.text = f"{self.player_name} fields it on the bounce."
-                self.caught = False
+        self.fielded = roll_to_catch(self.total_odds)
+        if self.fielded:
+            self.caught = ball.catchable
         else:
             self.caught = False
             self.duration += roll_error_time(self.total_odds)
 
+    def build_text(self):
+        if not self.fielded:
+            return None
+        elif self.caught:
+            return f"{self.player_name} caught it for a fly out."
+        else:
+            return f"{self.player_name} fields it on the bounce."
+
     def __str__(self):
         descript = "Caught" if self.caught else "Missed"
         return (f"{descript} Catch by {self.player_name} with odds {self.total_odds:.2f} "
@@ -161,24 +166,29 @@ class Throw(Update):
             distance: float
         ):
         self.distance = distance
-        self.throw_odds = roll_throw_odds_modifier(start_player['throwing'], distance)
-        self.grab_odds = calc_grabbiness_odds(end_player['grabbiness'])
+        self.throw_odds = roll_throw_odds_modifier(start_player[s.throwing], distance)
+        self.grab_odds = calc_grabbiness_odds(end_player[s.grabbiness])
 
         self.total_odds = self.throw_odds * self.grab_odds
         self.error = not roll_to_catch(self.total_odds)
 
-        self.duration = calc_throw_duration_base(start_player['throwing'], self.distance)
-        self.duration += calc_decision_time(start_player['grabbiness'])
+        self.duration = calc_throw_duration_base(start_player[s.throwing], self.distance)
+        self.duration += calc_decision_time(start_player[s.grabbiness])
         if self.error:
             self.error_time = roll_error_time(self.total_odds)
             self.duration += self.error_time
         else:
             self.error_time = 0
 
-        self.quick_string = f"from {start_player['name']} to {end_player['name']}"
-        super().__init__(self.description_string(start_player, end_player))
+        self.start_name = start_player[s.name]
+        self.end_name = end_player[s.name]
+        super().__init__()
+
+    @property
+    def quick_string(self):
+        return f"from {self.start_name} to {self.end_name}"
 
-    def description_string(self, start_player: Player, end_player: Player):
+    def build_text(self):
         if self.error:
             if self.error_time > 4:
                 descriptor = "misses it horribly!"
@@ -186,10 +196,10 @@ class Throw(Update):
                 descriptor = "misses it!"
             else:
                 descriptor = "just misses it!"
-            text = f", but {end_player['name'].split(' ')[0]} {descriptor}"
+            text = f", but {self.end_name.split(' ')[0]} {descriptor}"
         else:
             text = ""
-        return f"{start_player['name']} throws to {end_player['name']}{text}"
+        return f"{self.start_name} throws to {self.end_name}{text}"
 
     def __str__(self):
         return f"Throw {self.quick_string} with {self.distance:.0f}', odds {self.total_odds*100:.2f}%," \
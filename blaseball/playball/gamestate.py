@@ -18,7 +18,7 @@ from blaseball.stats.lineup import Lineup
 from blaseball.stats.stadium import Stadium
 from blaseball.util.messenger import Listener
 
-from typing import List, Union
+from typing import List, Tuple, Union
 
 
 @dataclass
@@ -30,6 +30,21 @@ class GameRules:
     innings: int = 9
 
 
+TENTHS = 10  # scores are kept as whole numbers of tenths of a run
+
+
+def to_tenths(runs: Union[int, Decimal]) -> int:
+    """Convert a number of runs (as sent with runs_scored) to tenths of a run."""
+    if type(runs) is int:
+        return runs * TENTHS
+    return int(round(runs * TENTHS))
+
+
+def from_tenths(tenths: int) -> Decimal:
+    """Convert tenths of a run back to runs, for showing to people."""
+    return Decimal(int(tenths)).scaleb(-1)
+
+
 class BaseSummary(Collection):
     """A simple class meant to transmit / update bases without throwing BasePaths around.
     It's basically a constant-length list
@@ -69,13 +84,31 @@ class BaseSummary(Collection):
     def __setitem__(self, key: int, value: Player):
         self.bases[key] = value  # noqa - not sure what this is on about.
 
+    def copy(self) -> "BaseSummary":
+        new_summary = BaseSummary.__new__(BaseSummary)
+        new_summary.number_of_bases = self.number_of_bases
+        new_summary.bases = list(self.bases)
+        return new_summary
+
+    @classmethod
+    def from_players(cls, players: Tuple[Player, ...]) -> "BaseSummary":
+        """Build a summary straight from a list of who's on each base, starting from home."""
+        new_summary = cls.__new__(cls)
+        new_summary.number_of_bases = len(players) - 1
+        new_summary.bases = list(players)
+        return new_summary
+
 
 class GameState:
     """
     This is a single moment of baseball.
 
-    The goal is to generate a BallGameSummary. this gets created and shuffled a lot, so there's a lot of optimization
-    that we're leaving on the table - this is due to its origin as the game manager, in addition to the game state.
+    The goal is to generate a BallGameSummary. This gets created and shuffled a lot: copies (as sent out every tick)
+    share the lineups, stadium and rules but get their own scores, batting order positions and bases, so they don't
+    move on with the game. For keeping lots of moments around, take a GameSnapshot instead.
+
+    Scores are kept in score_tenths as whole tenths of a run, so mercy runs add up exactly without any Decimal
+    arithmetic; scores gives them as Decimals for display.
     """
 
     def __init__(
@@ -111,11 +144,46 @@ class GameState:
         self.balls = balls
 
         self.at_bat_numbers = at_bat_numbers if at_bat_numbers is not None else [0, 0]
-        self.scores = scores if scores is not None else [Decimal('0.0')] * 2
+        self.score_tenths = [to_tenths(score) for score in scores] if scores is not None else [0, 0]
         self.at_bat_count = 0
 
         self.bases = base_summary if base_summary is not None else BaseSummary(total_bases=stadium.NUMBER_OF_BASES)
 
+    def copy(self) -> "GameState":
+        return self.snapshot().to_state()
+
+    __copy__ = copy
+
+    def snapshot(self) -> "GameSnapshot":
+        """Save this moment of the game, to restore later."""
+        return GameSnapshot(self)
+
+    def restore(self, snapshot: "GameSnapshot") -> None:
+        """Put this state back to a saved moment. The lineups, stadium and rules are put back too."""
+        self.home_team = snapshot.home_team
+        self.away_team = snapshot.away_team
+        self.teams = [snapshot.home_team, snapshot.away_team]
+        self.stadium = snapshot.stadium
+        self.rules = snapshot.rules
+        self.inning = snapshot.inning
+        self.inning_half = snapshot.inning_half
+        self.outs = snapshot.outs
+        self.strikes = snapshot.strikes
+        self.balls = snapshot.balls
+        self.at_bat_numbers = list(snapshot.at_bat_numbers)
+        self.score_tenths = list(snapshot.score_tenths)
+        self.at_bat_count = snapshot.at_bat_count
+        self.bases = BaseSummary.from_players(snapshot.bases)
+
+    @property
+    def scores(self) -> List[Decimal]:
+        """Home and away scores in runs. This is a new list each time - add to score_tenths to change the score."""
+        return [from_tenths(tenths) for tenths in self.score_tenths]
+
+    @scores.setter
+    def scores(self, scores: List[Decimal]):
+        self.score_tenths = [to_tenths(score) for score in scores]
+
     def offense_i(self) -> int:
         """Returns the index of the offense for this class' sequence structures"""
         return self.inning_half
@@ -162,17 +230,67 @@ class GameState:
         return f"{self.balls} - {self.strikes}"
 
     def score_string(self):
-        score_h = self.scores[0]
-        if score_h % 1 == 0:
+        score_h, score_a = self.scores
+        if self.score_tenths[0] % TENTHS == 0:
             score_h = f"{score_h:.0f}"
-        score_a = self.scores[1]
-        if score_a % 1 == 0:
+        if self.score_tenths[1] % TENTHS == 0:
             score_a = f"{score_a:.0f}"
         team_h = self.home_team['team']
         team_a = self.away_team['team']
         return f"{team_h}: {score_h} - {team_a}: {score_a}"
 
 
+class GameSnapshot:
+    """A saved moment of a GameState, small and cheap enough to take every pitch.
+
+    Everything that changes over a game is stored as ints and tuples, so a snapshot never changes once it's taken.
+    The lineups, stadium and rules are shared with the state it came from rather than copied, and runners are kept as
+    references to their Players (use base_cids for cids)."""
+    __slots__ = (
+        'home_team', 'away_team', 'stadium', 'rules',
+        'inning', 'inning_half', 'outs', 'strikes', 'balls',
+        'at_bat_numbers', 'score_tenths', 'at_bat_count', 'bases',
+    )
+
+    def __init__(self, state: GameState):
+        self.home_team = state.home_team
+        self.away_team = state.away_team
+        self.stadium = state.stadium
+        self.rules = state.rules
+        self.inning = state.inning
+        self.inning_half = state.inning_half
+        self.outs = state.outs
+        self.strikes = state.strikes
+        self.balls = state.balls
+        self.at_bat_numbers = tuple(state.at_bat_numbers)
+        self.score_tenths = tuple(state.score_tenths)
+        self.at_bat_count = state.at_bat_count
+        self.bases = tuple(state.bases.bases)
+
+    @property
+    def scores(self) -> Tuple[Decimal, ...]:
+        return tuple(from_tenths(tenths) for tenths in self.score_tenths)
+
+    @property
+    def base_cids(self) -> Tuple[int, ...]:
+        """Who's on each base, starting from home, as cids (or None)"""
+        return tuple(None if player is None else player.cid for player in self.bases)
+
+    def to_state(self) -> GameState:
+        """Build a new GameState at this moment."""
+        state = GameState.__new__(GameState)
+        state.restore(self)
+        return state
+
+    def __eq__(self, other):
+        if not isinstance(other, GameSnapshot):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in GameSnapshot.__slots__)
+
+    def __hash__(self):
+        return hash((self.inning, self.inning_half, self.outs, self.strikes, self.balls, self.score_tenths, self.bases))
+
+
 class GameTags(Enum):
     pre_tick = 'state synchronization tick immediately prior to state tick <GameState>'
     state_ticks = 'state ticks <None>'  # used to be <GameState>, but now everything has a reference
@@ -2,7 +2,7 @@
 Controls a player's pre-hit decisions as well as their actual swing attempt.
 """
 
-from numpy.random import normal, rand
+from blaseball.util.rng import normal, rand
 
 from blaseball.playball.gamestate import GameState, GameTags
 from blaseball.playball.pitching import Pitch
@@ -99,6 +99,7 @@ class Swing(Update):
         self.strike = False
         self.ball = False
         self.hit = False
+        self.foul = False  # fouls are decided once the ball lands, see liveball.HitBall
 
         if did_swing:
             if hit_quality < 0:
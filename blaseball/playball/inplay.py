@@ -16,7 +16,7 @@ from blaseball.stats.lineup import Defense
 from blaseball.stats import stats as s
 from blaseball.util.geometry import Coord
 
-from numpy.random import normal, rand
+from blaseball.util.rng import normal, rand
 from typing import List, Tuple
 from loguru import logger
 
@@ -46,13 +46,13 @@ class LiveDefense:
 
     def throw_to_base(self, target_base: int) -> Tuple[Update, float]:
         target_location = self.base_locations[target_base]
-        position, distance = self.defense.closest(target_location)
+        position, distance = self.defense.closest_to_base(self.base_locations, target_base)
         receiver = position.player
 
         if receiver is self.fielder:
             # tag the base - if this returns 0 FieldBall will initiate a rundown.
-            run_time = distance / calc_speed(self.fielder['speed'])
-            return Update(f"{self.fielder['name']} tags base {target_base}"), run_time
+            run_time = distance / calc_speed(self.fielder[s.speed])
+            return Update(f"{self.fielder[s.name]} tags base {target_base}"), run_time
 
         throw = Throw(self.fielder, receiver, distance)
         self.location = target_location
@@ -70,7 +70,7 @@ class LiveDefense:
         This is a percentage, from 0 to +.
         ratio less than 1 means the runner wins, ratio greater than 1 means the fielder wins (assuming no errors."""
         distance = self.location.distance(self.base_locations[runner.next_base()])
-        throw_duration = calc_throw_duration_base(self.fielder['throwing'], distance)
+        throw_duration = calc_throw_duration_base(self.fielder[s.throwing], distance)
         if throw_duration == 0:
             return 100  # avoid div/0 errors
         time_to_base = runner.time_to_base()
@@ -82,7 +82,7 @@ class LiveDefense:
         base_weight = runner.next_base()
 
         # fuzz time estimation
-        time_fuzz = normal(0, LiveDefense.DECISION_FUZZ_STDV * (2 - self.fielder['awareness']))
+        time_fuzz = normal(0, LiveDefense.DECISION_FUZZ_STDV * (2 - self.fielder[s.awareness]))
         # if runner time >>> duration, this evaluates to high. if duration >>> runner time, this evaluate to 0
         # (or negative).
         # if 0 < delta < PROBABILITY_WINDOW this evalutes to somewhere between 0 and 1 continuously
@@ -137,13 +137,13 @@ class LiveDefense:
         if runner.tagging_up:
             base_forward = base + 1
             base_backward = base
-            support_basepeep = self.defense.closest(self.base_locations[base_forward])[0].player
+            support_basepeep = self.defense.closest_to_base(self.base_locations, base_forward)[0].player
             forward_basepeep = support_basepeep
             extra_str = " while tagging up"
         else:
             base_forward = base
             base_backward = base - 1
-            support_basepeep = self.defense.closest(self.base_locations[base_backward])[0].player
+            support_basepeep = self.defense.closest_to_base(self.base_locations, base_backward)[0].player
             forward_basepeep = self.fielder
             extra_str = ""
 
@@ -181,7 +181,7 @@ class LiveDefense:
         return updates, outs, wasted_time
 
     def __str__(self):
-        return f"Fielder, currently {self.fielder['name']} at {self.location}"
+        return f"Fielder, currently {self.fielder[s.name]} at {self.location}"
 
     def __repr__(self):
         return f"<{str(self)}>"
@@ -189,23 +189,38 @@ class LiveDefense:
 
 class CatchOut(Update):
     def __init__(self, fielder: Player, batter: Player):
+        super().__init__()
+        self.fielder = fielder
+        self.batter = batter
+
+    def build_text(self):
         # todo: desribe catch location
-        super().__init__(f"{batter['name']} hit a flyout to {fielder['name']}")
+        return f"{self.batter[s.name]} hit a flyout to {self.fielder[s.name]}"
 
 
 class FieldingOut(Update):
     def __init__(self, fielder: Player, runner: Runner, throw: bool = True):
-        verb = "thrown" if throw else "tagged"
+        super().__init__()
+        self.fielder = fielder
+        self.player = runner.player  # the runner itself keeps moving, so hang on to who and where
+        self.throw = throw
         if runner.forward:
-            base = runner.base + 1
+            self.base = runner.base + 1
         else:
-            base = runner.base
-        super().__init__(f"{runner.player['name']} {verb} out at base {base} by {fielder['name']}.")
+            self.base = runner.base
+
+    def build_text(self):
+        verb = "thrown" if self.throw else "tagged"
+        return f"{self.player[s.name]} {verb} out at base {self.base} by {self.fielder[s.name]}."
 
 
 class RunScored(Update):
     def __init__(self, runner: Player):
-        super().__init__(f"{runner['name']} scored!")
+        super().__init__()
+        self.runner = runner
+
+    def build_text(self):
+        return f"{self.runner[s.name]} scored!"
 
 
 class FieldBall:
@@ -224,7 +239,7 @@ class FieldBall:
             basepaths += batter
 
         distance_to_home = live_ball.ground_location().distance(Coord(0, 0))
-        throw_time = calc_throw_duration_base(live_defense.fielder['throwing'], distance_to_home) - 1
+        throw_time = calc_throw_duration_base(live_defense.fielder[s.throwing], distance_to_home) - 1
         # the minus one is cut it a little short to encourage people make mistakes, it's a magic spice number
         runs, scoring_runners = basepaths.advance_all(catch_duration, throw_time)
         self.runs += runs
@@ -280,7 +295,7 @@ class FieldBall:
             3: "triple!",
             4: "quadruple!!"
         }
-        return Update(f"{runner.player['name']} hit a {BASE_LENGTH[runner.base]}")
+        return Update(f"{runner.player[s.name]} hit a {BASE_LENGTH[runner.base]}")
 
 
 if __name__ == "__main__":
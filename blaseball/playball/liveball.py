@@ -3,7 +3,11 @@ Governs the flight of a ball after it is hit, errored out, etc.
 """
 
 import math
-from numpy.random import normal
+from typing import Tuple
+
+import numpy as np
+
+from blaseball.util.rng import normal
 
 from blaseball.playball.event import Update
 from blaseball.playball.hitting import Swing
@@ -11,6 +15,7 @@ from blaseball.playball.pitching import Pitch
 from blaseball.playball.gamestate import GameState, GameTags, BaseSummary
 from blaseball.playball.manager import Manager
 from blaseball.stats.players import Player
+from blaseball.stats.stadium import Stadium
 from blaseball.util.geometry import Coord
 from blaseball.util.messenger import Messenger
 from blaseball.stats import stats as s
@@ -24,7 +29,15 @@ WIND_RESISTANCE = 16
 
 
 class LiveBall:
-    """A ball live on the field that must be fielded."""
+    """A ball live on the field that must be fielded.
+
+    Where the ball lands and how long it's in the air are worked out once, when it's hit - so change the launch
+    angle, field angle, speed or origin and you'll need a new LiveBall."""
+    __slots__ = (
+        'launch_angle', 'speed', 'catchable', 'field_angle', 'origin',
+        '_theoretical', '_flight_time', '_distance', '_ground_x', '_ground_y'
+    )
+
     def __init__(self, launch_angle, field_angle, speed, origin=Coord(0, 0)):
         if launch_angle < 0:  # hack to handle grounders
             self.launch_angle = -launch_angle  # 0 is flat horizontal, 90 is straight up, can go negative
@@ -38,20 +51,26 @@ class LiveBall:
         self.origin = origin  # the originating point of the ball, from 0,0 for home plate to 1,1 for second base
         # can extend past home base into the field - actual limit depends on the field.
 
+        launch_sin = math.sin(math.radians(self.launch_angle))
+        self._theoretical = self.speed ** 2 * 2 * launch_sin / GRAVITY_MPH * 5280
+        self._flight_time = 2 * self.speed * launch_sin / GRAVITY_MPH * 60 * 60
+        self._distance = self._theoretical - self._flight_time ** 2 * WIND_RESISTANCE
+        # 0 degs is right along first base
+        field_radians = math.radians(self.field_angle)
+        self._ground_x = self._distance * math.cos(field_radians) + self.origin.x
+        self._ground_y = self._distance * math.sin(field_radians) + self.origin.y
+
     def _theoretical_distance(self) -> float:
-        return self.speed ** 2 * 2 * math.sin(math.radians(self.launch_angle)) / GRAVITY_MPH * 5280
+        return self._theoretical
 
     def flight_time(self) -> float:
-        return 2 * self.speed * math.sin(math.radians(self.launch_angle)) / GRAVITY_MPH * 60 * 60
+        return self._flight_time
 
     def distance(self):
-        return self._theoretical_distance() - self.flight_time() ** 2 * WIND_RESISTANCE
+        return self._distance
 
     def ground_location(self) -> Coord:
-        # 0 degs is right along first base
-        pos_x = self.distance() * math.cos(math.radians(self.field_angle)) + self.origin.x
-        pos_y = self.distance() * math.sin(math.radians(self.field_angle)) + self.origin.y
-        return Coord(pos_x, pos_y)  # yes we could initialize with polar coords but we need to handle the origin :c
+        return Coord(self._ground_x, self._ground_y)  # yes we could use polar coords but we need to handle the origin
 
     def __bool__(self):
         return self.speed > 0
@@ -66,10 +85,47 @@ class LiveBall:
         return f"LiveBall({self.launch_angle}, {self.field_angle}, {self.speed})"
 
 
+class LiveBallBatch:
+    """A whole array of hit balls at once, for looking at spray charts or running a lot of balls through a stadium.
+
+    This takes arrays of launch angle, field angle and speed (as LiveBall does, negative launch angles are grounders)
+    and works out the flight of every ball with numpy. Indexing one gives you it back as a LiveBall."""
+    def __init__(self, launch_angles, field_angles, speeds, origin=Coord(0, 0)):
+        launch_angles = np.asarray(launch_angles, dtype=float)
+        speeds = np.asarray(speeds, dtype=float)
+        self.catchable = launch_angles >= 0
+        self.launch_angle = np.abs(launch_angles)
+        self.speed = np.where(self.catchable, speeds, speeds / 2)
+        self.field_angle = np.asarray(field_angles, dtype=float)
+        self.origin = origin
+
+        launch_sin = np.sin(np.radians(self.launch_angle))
+        theoretical_distance = self.speed ** 2 * 2 * launch_sin / GRAVITY_MPH * 5280
+        self.flight_time = 2 * self.speed * launch_sin / GRAVITY_MPH * 60 * 60
+        self.distance = theoretical_distance - self.flight_time ** 2 * WIND_RESISTANCE
+        field_radians = np.radians(self.field_angle)
+        self.x = self.distance * np.cos(field_radians) + origin.x
+        self.y = self.distance * np.sin(field_radians) + origin.y
+
+    def classify(self, stadium: Stadium) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Which balls are foul, which are home runs and which hit the wall - the same calls HitBall makes."""
+        foul = stadium.check_fouls(self.x, self.y)
+        home_run, hit_wall = stadium.check_home_runs(self.x, self.y)
+        return foul, home_run & ~foul, hit_wall & ~foul
+
+    def __len__(self):
+        return len(self.distance)
+
+    def __getitem__(self, index: int) -> LiveBall:
+        launch_angle = self.launch_angle[index] if self.catchable[index] else -self.launch_angle[index]
+        speed = self.speed[index] if self.catchable[index] else self.speed[index] * 2
+        return LiveBall(float(launch_angle), float(self.field_angle[index]), float(speed), self.origin)
+
+
 BASE_LAUNCH_ANGLE = 10  # median launch angle for a 0* batter
 LAUNCH_ANGLE_POWER_FACTOR = 5  # bonus launch angle for a 5* batter
 LAUNCH_ANGLE_BASE_STDEV = 40
-LA_HIT_QUALITY_FACTOR = -0.5  # magic factor for launch angle hit quality,
+LA_HIT_QUALITY_FACTOR = 0.5  # magic factor for launch angle hit quality,
 # higher LA_HIT_QUALITY_FACTOR means hit quality matters less for scaling launch angles with good hits,
 # LAHQF of 1 means a remainder of 1 cuts launch angle stdev in half.
 
@@ -100,11 +156,12 @@ MIN_EXIT_VELOCITY_AVERAGE = 80  # average EV for a player at 0 stars
 MAX_EXIT_VELOCITY_AVERAGE = 120  # max for a juiced player at 10 stars
 EXIT_VELOCITY_RANGE = MAX_EXIT_VELOCITY_AVERAGE - MIN_EXIT_VELOCITY_AVERAGE
 EXIT_VELOCITY_STDEV = 10  # additional fuzz on top of hit quality, should be low
-EXIT_VELOCITY_PITY_FACTOR = -0.8  # the higher this is, the less exit velo is reduced with low hit quality.
-# This is very sensitive:
-# 0 means exit velo is 0 at 0 quality
-# 0.1 means exit velo is 56%%
-# 0.2 means 66%
+EXIT_VELOCITY_PITY_FACTOR = 0.8  # the higher this is, the less exit velo is reduced with low hit quality.
+# This is very sensitive - at 0 quality (1 quality is always 100%):
+# 0 means exit velo is 0
+# 0.1 means exit velo is 55%
+# 0.2 means 64%
+# 0.8 means 82%
 EXIT_VELOCITY_QUALITY_EXPONENT = 1 / 4
 
 
@@ -117,7 +174,9 @@ def roll_exit_velocity(quality, reduction, batter_power) -> float:
     """
     net_power = batter_power - reduction  # can - and often will - be negative!
     exit_velocity_base = MIN_EXIT_VELOCITY_AVERAGE + net_power * EXIT_VELOCITY_RANGE / 2
-    quality_modifier = (quality + EXIT_VELOCITY_PITY_FACTOR) ** EXIT_VELOCITY_QUALITY_EXPONENT
+    quality_modifier = (
+        (quality + EXIT_VELOCITY_PITY_FACTOR) / (1 + EXIT_VELOCITY_PITY_FACTOR)
+    ) ** EXIT_VELOCITY_QUALITY_EXPONENT
     exit_velocity = normal(loc=exit_velocity_base * quality_modifier, scale=EXIT_VELOCITY_STDEV)
     return max(exit_velocity, 0)
 
@@ -129,7 +188,6 @@ class HitBall(Update):
 
         launch_angle = roll_launch_angle(quality, batter[s.power])
         field_angle = roll_field_angle(quality, batter[s.pull])
-        reduction = EXIT_VELOCITY_RANGE * reduction
         exit_velocity = roll_exit_velocity(quality, reduction, batter[s.power])
         self.live = LiveBall(launch_angle=launch_angle, field_angle=field_angle, speed=exit_velocity)
 
@@ -137,7 +195,7 @@ class HitBall(Update):
         self.foul = game.stadium.check_foul(ground_location)
         if self.foul:
             self.homerun = False
-            # don't send foul yet - fielding will have a chance at it.
+            # PitchManager sends foul once this is out of the way - nobody can catch a foul for an out yet
         else:
             self.homerun, hit_wall = game.stadium.check_home_run(ground_location)
             if self.homerun:
@@ -3,8 +3,8 @@ Controls a pitch through the entire pitch process - beginning with an intent, th
 to the pitch.
 """
 
-from scipy.stats import norm
-from numpy.random import normal, rand
+from blaseball.util import rng
+from blaseball.util.rng import normal, rand, inverse_normal_cdf
 from math import tanh
 from typing import List
 
@@ -144,7 +144,7 @@ def calc_ideal_strike_percent(calling_modifier) -> float:
 def calc_target_location(pitcher_accuracy, strike_percent) -> float:
     """reverse the strike percent into a target location"""
     pitcher_stdev = ACCURACY_STDV_SLOPE * pitcher_accuracy + ACCURACY_STDV_INTERCEPT
-    strike_z = norm.ppf(strike_percent)
+    strike_z = inverse_normal_cdf(strike_percent)
     strike_position = strike_z * pitcher_stdev
     called_location = max(0, 1-strike_position)
     return called_location
@@ -248,9 +248,14 @@ class Pitch(Update):
         self.difficulty = difficulty
         self.reduction = reduction
 
-        super().__init__(self.description_string(pitcher))
+        self.pitcher = pitcher
+        # the flavor text rolls its own pitch type and speed from the game's flavour stream (see util.rng), so the
+        # rest of the game sees the same rolls whether or not anybody reads it
+        self.random_stream = rng.get_stream()
 
-    def description_string(self, pitcher: Player):
+        super().__init__()
+
+    def build_text(self):
         if self.location > 1.6:
             loc_text = "to the wide outside"
         elif self.location > 1.2:
@@ -266,7 +271,9 @@ class Pitch(Update):
         else:
             loc_text = "to the far inside"
 
-        text_obscurity = pitcher[s.trickery] * rand()
+        flavour = self.random_stream.flavour
+        text_obscurity = self.pitcher[s.trickery] * flavour.uniform()
+        text_force = self.pitcher[s.force] * 20 + 70 + 10 * flavour.standard_normal()
         if text_obscurity > 1.5:
             pitch_text = "screwball"
         elif text_obscurity > 1:
@@ -282,8 +289,6 @@ class Pitch(Update):
         else:
             pitch_text = "two seam fastball"
 
-        text_force = normal(pitcher[s.force] * 20 + 70, 10)
-
         return f"{text_force:.0f} mph {pitch_text} {loc_text}."
 
     def __str__(self):
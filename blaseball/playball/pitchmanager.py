@@ -4,8 +4,8 @@ This is a Listener that responds to BallGame GameState ticks.
 
 from blaseball.util.messenger import Messenger
 from blaseball.playball.event import Update
-from blaseball.playball.pitching import Pitch
-from blaseball.playball.hitting import Swing
+from blaseball.playball.pitching import build_pitch
+from blaseball.playball.hitting import build_swing
 from blaseball.playball.liveball import HitBall
 from blaseball.playball.inplay import FieldBall
 from blaseball.playball.basepaths import Basepaths
@@ -27,21 +27,25 @@ class PitchManager:
         self.messenger.subscribe(self.player_walk, GameTags.player_walked)
 
     def pitchhit(self, game: GameState):
-        pitch = Pitch(
-            game,
-            game.defense()['pitcher'],
-            game.defense()['catcher'],
-            self.messenger
-        )
+        pitch = build_pitch(game)
+        self.messenger.send(pitch, [GameTags.pitch, GameTags.game_updates])
 
         batter = game.batter()
 
-        swing = Swing(game, pitch, batter, self.messenger)
+        swing = build_swing(game, pitch)
+        self.messenger.send(swing, [GameTags.swing, GameTags.game_updates])
+        if swing.strike:
+            self.messenger.send(swing.did_swing, GameTags.strike)
+        elif swing.ball:
+            self.messenger.send(tags=GameTags.ball)
         if not swing.hit:
             return
 
         hit_ball = HitBall(game, swing.hit_quality, pitch.reduction, batter, self.messenger)
 
+        if hit_ball.foul:
+            self.messenger.send(tags=GameTags.foul)
+            return
         if hit_ball.homerun:
             return
 
@@ -49,8 +53,9 @@ class PitchManager:
         self.basepaths.reset_all(game.defense()['pitcher'], game.defense()['catcher'])
         field_ball = FieldBall(batter, game.defense().defense, hit_ball.live, self.basepaths)
 
-        for update in field_ball.updates:
-            self.messenger.send(update, [GameTags.game_updates])
+        if self.messenger.has_listeners(GameTags.game_updates):
+            for update in field_ball.updates:
+                self.messenger.send(update, [GameTags.game_updates])
 
         if field_ball.runs > 0:
             self.messenger.send(field_ball.runs, [GameTags.runs_scored])
@@ -65,7 +70,8 @@ class PitchManager:
     def player_walk(self, player: Player):
         runs_scored, players_scoring = self.basepaths.walk_batter(player)
         if runs_scored:
-            walk_string = f"{players_scoring[0][s.name]} walked in for a run!"
-            self.messenger.send(Update(walk_string), GameTags.game_updates)
+            if self.messenger.has_listeners(GameTags.game_updates):
+                walk_string = f"{players_scoring[0][s.name]} walked in for a run!"
+                self.messenger.send(Update(walk_string), GameTags.game_updates)
             self.messenger.send(runs_scored, GameTags.runs_scored)
         self.messenger.send(BaseSummary(basepaths=self.basepaths), GameTags.bases_update)
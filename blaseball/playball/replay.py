@@ -0,0 +1,96 @@
+"""
+Replays step back through a finished game using its event log (see eventlog), without playing any of it again.
+
+Every record in an event log carries the whole game state as its tick began, so rebuilding the game as it stood
+before any pitch is just a lookup - there's no need to run the game up to that point. Seeking to an inning is a
+binary search over the pitches.
+
+To replay one game out of a season's worth of events:
+    replay = Replay(events[events['game'] == 3], home, away, stadium, GameRules())
+    state = replay.state_at(replay.seek_inning(7))
+"""
+
+import numpy as np
+
+from blaseball.playball.eventlog import EventKind, NO_PLAYER
+from blaseball.playball.gamestate import GameState, GameRules, BaseSummary
+from blaseball.stats.lineup import Lineup
+from blaseball.stats.players import Player
+from blaseball.stats.stadium import Stadium
+
+
+class Replay:
+    """A finished game, ready to be rebuilt at any pitch. The lineups have to be the ones the game was played with,
+    since the log only has player cids.
+
+    Pitches are numbered from 0 in the order they were thrown; state_at(len(replay)) is the end of the game."""
+    def __init__(self, events: np.ndarray, home: Lineup, away: Lineup, stadium: Stadium, rules: GameRules):
+        self.events = events
+        self.home = home
+        self.away = away
+        self.stadium = stadium
+        self.rules = rules
+        self.players = {player.cid: player for player in home.get_all_players() + away.get_all_players()}
+
+        self.pitches = events[events['kind'] == EventKind.pitch]
+        game_over = events[events['kind'] == EventKind.game_over]
+        self.final = game_over[-1] if len(game_over) else None
+        # innings count up and halves count down (top is 1), so this only ever goes up as the game goes on
+        self._inning_keys = self.pitches['inning'].astype(np.int64) * 2 + 1 - self.pitches['half']
+
+    def __len__(self):
+        return len(self.pitches)
+
+    def pitch(self, pitch_number: int) -> np.void:
+        """The event record for a pitch."""
+        return self.pitches[pitch_number]
+
+    def state_at(self, pitch_number: int) -> GameState:
+        """The game as it stood just before pitch_number was thrown."""
+        if pitch_number == len(self.pitches) and self.final is not None:
+            return self.build_state(self.final)
+        if not 0 <= pitch_number < len(self.pitches):
+            raise IndexError(f"Pitch {pitch_number} out of range for a game of {len(self.pitches)} pitches")
+        return self.build_state(self.pitches[pitch_number])
+
+    def seek_inning(self, inning: int, half: int = 1) -> int:
+        """The first pitch of an inning half (1 for the top, 0 for the bottom)."""
+        pitch_number = int(np.searchsorted(self._inning_keys, inning * 2 + 1 - half))
+        if pitch_number == len(self.pitches) or self._inning_keys[pitch_number] != inning * 2 + 1 - half:
+            raise ValueError(f"The {'top' if half else 'bottom'} of inning {inning} wasn't played in this game")
+        return pitch_number
+
+    def events_for(self, pitch_number: int) -> np.ndarray:
+        """Every record from the tick a pitch was thrown in, in the order they happened."""
+        ticks = self.events['tick']
+        tick = self.pitches[pitch_number]['tick']
+        return self.events[np.searchsorted(ticks, tick, 'left'):np.searchsorted(ticks, tick, 'right')]
+
+    def build_state(self, record: np.void) -> GameState:
+        """Rebuild a GameState from the header of any event record."""
+        bases = BaseSummary(total_bases=self.stadium.NUMBER_OF_BASES)
+        for i, cid in enumerate(record['bases'][:len(bases.bases)]):
+            if cid != NO_PLAYER:
+                bases[i] = self.player(cid)
+
+        state = GameState(
+            self.home,
+            self.away,
+            self.stadium,
+            self.rules,
+            inning=int(record['inning']),
+            inning_half=int(record['half']),
+            outs=int(record['outs']),
+            strikes=int(record['strikes']),
+            balls=int(record['balls']),
+            at_bat_numbers=[int(record['home_at_bat']), int(record['away_at_bat'])],
+            base_summary=bases,
+        )
+        state.score_tenths = [int(record['home_score']), int(record['away_score'])]
+        return state
+
+    def player(self, cid: int) -> Player:
+        try:
+            return self.players[int(cid)]
+        except KeyError:
+            raise KeyError(f"Player c{cid} is in the event log, but not in either lineup") from None
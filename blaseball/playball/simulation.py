@@ -0,0 +1,338 @@
+"""
+Runs batches of games headless - no UI, no printing - for things like balance tuning across whole seasons.
+
+Give run_schedule a league, a schedule of Matchups and a seed, and it plays every game and hands back a BoxScore
+for each. Games can be spread across a pool of worker processes: each worker gets its own copy of the
+playerbase, so games never touch the parent's players. Instead, every BoxScore carries the change in each
+player's performance stats, and merge_results folds those back into the parent playerbase.
+
+Every game gets its own random stream spawned from the schedule seed, and starts from the same player stats no
+matter what ran before it, so results are the same however many workers you use.
+
+Anything that goes wrong inside a game is caught and logged by the game's messenger, so the game carries on - which
+is fine for a game someone is watching, but would quietly make a nonsense box score here. So if any listener raised
+during a game, run_game raises a SimulationError once the game is over.
+
+This can also be run from the command line:
+    python -m blaseball.playball.simulation --teams 4 --games 2 --workers 4 --seed 383
+and with --events season.npy, saves every game's event log (see eventlog) as well.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from blaseball.playball.ballgame import BallGame
+from blaseball.playball.eventlog import EventLog
+from blaseball.playball.gamestate import GameRules
+from blaseball.playball.pitchmanager import PitchManager
+from blaseball.stats import modifiers, stadium, statclasses
+from blaseball.stats.lineup import Lineup
+from blaseball.stats.playerbase import PlayerBase
+from blaseball.stats.players import Player
+from blaseball.stats.teams import League
+from blaseball.util.messenger import Messenger
+from blaseball.util import rng
+
+from typing import Dict, List, Optional, Sequence, Union
+
+
+class SimulationError(RuntimeError):
+    """Something went wrong partway through a game, so its result can't be trusted."""
+
+
+@dataclass
+class Matchup:
+    """One game on a schedule. Rotations pick who pitches: see build_lineup."""
+    home: str
+    away: str
+    home_rotation: int = 0
+    away_rotation: int = 0
+
+
+@dataclass
+class BoxScore:
+    """The result of one game.
+
+    stat_deltas maps player cid to stat name to the change in that performance stat over the game, and only
+    lists players and stats that actually changed."""
+    matchup: Matchup
+    seed: int
+    scores: List[Decimal]  # home, away
+    ticks: int
+    stat_deltas: Dict[int, Dict[str, Union[int, float, Decimal]]]
+    events: Optional[np.ndarray] = None  # the game's event log, if it was recorded
+
+    def winner(self) -> Optional[str]:
+        """The name of the winning team, or None on a tie."""
+        if self.scores[0] > self.scores[1]:
+            return self.matchup.home
+        elif self.scores[1] > self.scores[0]:
+            return self.matchup.away
+        return None
+
+
+LINEUP_POSITIONS = [
+    'pitcher', 'catcher', 'shortstop',
+    'basepeep 1', 'basepeep 2', 'basepeep 3',
+    'fielder 1', 'fielder 2', 'fielder 3',
+    'extra 1'
+]
+
+
+def build_lineup(name: str, roster: Sequence[Player], rotation: int = 0) -> Lineup:
+    """Build a lineup from the first ten players of a roster, rotated so a different player pitches as
+    rotation increases."""
+    starters = list(roster[:len(LINEUP_POSITIONS)])
+    rotation = rotation % len(starters)
+    starters = starters[rotation:] + starters[:rotation]
+
+    new_lineup = Lineup(name)
+    for player, position in zip(starters, LINEUP_POSITIONS):
+        new_lineup.add_player(player, position)
+    return new_lineup
+
+
+def run_game(
+        home: Lineup,
+        away: Lineup,
+        game_stadium: stadium.Stadium,
+        rules: GameRules = None,
+        generator: np.random.Generator = None,
+        messenger: Messenger = None,
+        flavour: np.random.Generator = None
+) -> BallGame:
+    """Play a single game to the end and return the finished BallGame.
+    Pass a messenger to listen in on the game, such as with an EventLog, and a flavour generator to make its feed
+    text repeatable too.
+
+    Raises a SimulationError if anything listening to the game raised along the way."""
+    if rules is None:
+        rules = GameRules()
+
+    ballgame = BallGame(Messenger(), home, away, game_stadium, rules, game_messenger=messenger, generator=generator,
+                        flavour=flavour)
+    PitchManager(ballgame.state, ballgame.messenger)
+
+    ballgame.start_game()
+    while ballgame.live_game:
+        ballgame.send_tick()
+
+    errors = ballgame.messenger.listener_errors
+    if errors:
+        raise SimulationError(
+            f"{errors} exceptions raised during {away.name} at {home.name}, the last being "
+            f"{ballgame.messenger.last_listener_error!r}"
+        ) from ballgame.messenger.last_listener_error
+    return ballgame
+
+
+def play_matchup(
+        pb: PlayerBase,
+        rosters: Dict[str, List[int]],
+        matchup: Matchup,
+        seed: int,
+        game_stadium: stadium.Stadium,
+        rules: GameRules = None,
+        game_id: int = None
+) -> BoxScore:
+    """Play one matchup and report what changed. With a game_id, the box score also carries the game's
+    event log, tagged with that id.
+
+    Every performance stat the game touched is put back afterwards, so each game starts from the same
+    players no matter what ran before it - use merge_results to actually keep the changes."""
+    home = build_lineup(f"{matchup.home} lineup", [pb.players[cid] for cid in rosters[matchup.home]],
+                        matchup.home_rotation)
+    away = build_lineup(f"{matchup.away} lineup", [pb.players[cid] for cid in rosters[matchup.away]],
+                        matchup.away_rotation)
+
+    performance_stats = pb.get_stats_with_kind(statclasses.Kinds.performance)
+    game_players = list(dict.fromkeys(home.get_all_players() + away.get_all_players()))
+    before = {player: [player[stat] for stat in performance_stats] for player in game_players}
+
+    messenger = Messenger()
+    event_log = EventLog(messenger, game_id) if game_id is not None else None
+    ballgame = run_game(
+        home, away, game_stadium, rules, np.random.default_rng(seed), messenger, flavour=rng.spawn(seed, 1)[0]
+    )
+
+    stat_deltas = {}
+    for player, old_values in before.items():
+        player_deltas = {}
+        for stat, old_value in zip(performance_stats, old_values):
+            new_value = player[stat]
+            if new_value != old_value:
+                player_deltas[stat.name] = new_value - old_value
+                player[stat] = old_value
+        if player_deltas:
+            stat_deltas[player.cid] = player_deltas
+
+    events = event_log.events.copy() if event_log is not None else None
+    return BoxScore(matchup, seed, list(ballgame.state.scores), ballgame.tick_count, stat_deltas, events)
+
+
+def merge_results(pb: PlayerBase, results: Sequence[BoxScore]) -> None:
+    """Add the stat changes from a batch of games to the players in pb, then save them to the dataframe."""
+    for box_score in results:
+        for cid, player_deltas in box_score.stat_deltas.items():
+            player = pb.players[cid]
+            for stat_name, delta in player_deltas.items():
+                stat = pb.stats[stat_name]
+                player[stat] += delta
+    pb.save_all_players_to_pb()
+
+
+def round_robin(league: League, games_per_pair: int = 1) -> List[Matchup]:
+    """Every team plays every other team games_per_pair times at home, rotating pitchers as they go."""
+    schedule = []
+    games_played = {team.name: 0 for team in league.teams}
+    for game in range(games_per_pair):
+        for home in league.teams:
+            for away in league.teams:
+                if home is away:
+                    continue
+                schedule += [Matchup(home.name, away.name, games_played[home.name], games_played[away.name])]
+                games_played[home.name] += 1
+                games_played[away.name] += 1
+    return schedule
+
+
+# each worker process keeps its own playerbase and rosters here, set up once by _start_worker
+_worker_context = {}
+
+
+def quiet_logging() -> None:
+    """Only log warnings and errors: games log every step they take, which is far too much for a season."""
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+
+def _start_worker(
+        df: pd.DataFrame,
+        rosters: Dict[str, List[int]],
+        game_stadium: stadium.Stadium,
+        rules: GameRules
+) -> None:
+    from blaseball.stats import stats as s
+    quiet_logging()
+    s.pb.load_dataframe(df)
+    _worker_context.update(pb=s.pb, rosters=rosters, stadium=game_stadium, rules=rules)
+
+
+def _play_in_worker(job: tuple) -> BoxScore:
+    matchup, seed, game_id = job
+    context = _worker_context
+    return play_matchup(
+        context['pb'], context['rosters'], matchup, seed, context['stadium'], context['rules'], game_id
+    )
+
+
+def run_schedule(
+        pb: PlayerBase,
+        league: League,
+        schedule: Sequence[Matchup],
+        seed: int,
+        workers: int = None,
+        game_stadium: stadium.Stadium = None,
+        rules: GameRules = None,
+        record_events: bool = False
+) -> List[BoxScore]:
+    """Play every matchup in the schedule and return their box scores, in schedule order.
+
+    workers is the number of worker processes to use (None for one per CPU); with 0 or 1 the games are played
+    in this process instead. Either way, pb isn't changed - pass the results to merge_results for that.
+    Workers load their copy into the global playerbase, so with workers pb must be stats.pb.
+
+    With record_events, every box score carries its game's event log, with the game's place in the schedule
+    as its game id - see season_events."""
+    if game_stadium is None:
+        game_stadium = stadium.Stadium(stadium.ANGELS_STADIUM)
+    if rules is None:
+        rules = GameRules()
+
+    rosters = {team.name: [player.cid for player in team.players] for team in league.teams}
+    game_ids = range(len(schedule)) if record_events else [None] * len(schedule)
+    jobs = list(zip(schedule, rng.spawn_seeds(seed, len(schedule)), game_ids))
+
+    if workers is not None and workers <= 1:
+        return [
+            play_matchup(pb, rosters, matchup, game_seed, game_stadium, rules, game_id)
+            for matchup, game_seed, game_id in jobs
+        ]
+
+    pb.save_all_players_to_pb()
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_start_worker,
+            initargs=(pb.df, rosters, game_stadium, rules)
+    ) as executor:
+        return list(executor.map(_play_in_worker, jobs))
+
+
+def standings(results: Sequence[BoxScore]) -> pd.DataFrame:
+    """Wins, losses, ties, and runs for and against each team, best record first."""
+    table = {}
+    for box_score in results:
+        for team, runs_for, runs_against in [
+            (box_score.matchup.home, box_score.scores[0], box_score.scores[1]),
+            (box_score.matchup.away, box_score.scores[1], box_score.scores[0]),
+        ]:
+            row = table.setdefault(team, {'wins': 0, 'losses': 0, 'ties': 0, 'runs for': 0, 'runs against': 0})
+            row['runs for'] += runs_for
+            row['runs against'] += runs_against
+            if runs_for > runs_against:
+                row['wins'] += 1
+            elif runs_for < runs_against:
+                row['losses'] += 1
+            else:
+                row['ties'] += 1
+    return pd.DataFrame.from_dict(table, orient='index').sort_values('wins', ascending=False)
+
+
+def season_events(results: Sequence[BoxScore]) -> np.ndarray:
+    """Every recorded event from a batch of games, as one array (see eventlog)."""
+    return np.concatenate([box_score.events for box_score in results if box_score.events is not None])
+
+
+def main(argv: Sequence[str] = None) -> None:
+    from blaseball.stats import stats as s
+    from data import teamdata
+
+    parser = argparse.ArgumentParser(description="Play a round robin between freshly generated teams.")
+    parser.add_argument('--teams', type=int, default=4, help="number of teams in the league")
+    parser.add_argument('--games', type=int, default=1, help="home games each team plays against each other")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--seed', type=int, default=383, help="seed for the whole schedule")
+    parser.add_argument('--events', default=None, help="save every game's event log to this .npy file")
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    rng.seed(args.seed)
+    # the trait deck was shuffled on import, before we had a seed
+    modifiers.default_personality_deck.shuffle()
+    league = League(s.pb, teamdata.TEAMS_99[:args.teams])
+    schedule = round_robin(league, args.games)
+
+    start = perf_counter()
+    results = run_schedule(s.pb, league, schedule, args.seed, args.workers, record_events=args.events is not None)
+    duration = perf_counter() - start
+    merge_results(s.pb, results)
+
+    print(standings(results))
+    print(f"\r\n{len(results)} games in {duration:.1f} s ({len(results) / duration:.2f} games/s), "
+          f"{sum(box_score.ticks for box_score in results)} ticks total.")
+    if args.events is not None:
+        events = season_events(results)
+        np.save(args.events, events, allow_pickle=False)
+        print(f"{len(events)} events ({events.nbytes / 1024:,.0f} KiB) saved to {args.events}")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,8 @@ class StatsMonitor:
         batter[s.total_launch_angle] += swing.live.launch_angle
         batter[s.total_field_angle] += swing.live.field_angle
 
+        if swing.foul:
+            batter[s.total_fouls] += 1
         if swing.homerun:
             batter[s.total_home_runs] += 1
 
@@ -9,10 +9,13 @@ from blaseball.stats.teams import Team
 from blaseball.stats.stadium import Stadium
 from blaseball.util.geometry import Coord
 
+import numpy as np
+
 from collections.abc import Collection, MutableMapping
-from typing import Union, List, Tuple
-from math import atan, radians
-from random import shuffle
+from typing import Union, List, Sequence, Tuple
+from math import atan, hypot, radians
+from operator import itemgetter
+from blaseball.util.rng import shuffle
 
 
 def place_basepeep(instance, base_count) -> Coord:
@@ -78,13 +81,15 @@ class Defense(MutableMapping):
     "Where is every player? Who is the closest to x location?"
     "Who is the shortstop?"
 
-    There's a lot of optimization here if we're making a TON of calls to this, because these lookups are all
-    iterative except for the position one, but we could in the future pre-generate and manage mulitple lookup dicts.
+    Closest-player lookups are asked for on every catch and throw, so the defense keeps where everyone is standing
+    (as a list and as arrays) and who's closest to each base, and only works them out again when positions change.
+    If you move a Position by setting its location directly, call reset_layout afterwards.
     """
 
     def __init__(self):
         self.positions = {}
         self.groups = {}  # a defense group is a set of positions that represent a group
+        self.reset_layout()
 
     def add(self, position: str, player: Player, location: Coord = None):
         new_position = Position(position, player, location)
@@ -94,6 +99,25 @@ class Defense(MutableMapping):
                 self.groups[new_position.group] += [new_position]
             else:
                 self.groups[new_position.group] = [new_position]
+        self.reset_layout()
+
+    def reset_layout(self) -> None:
+        """Forget where everyone is standing, so it's worked out again on the next lookup."""
+        self._layout = None
+        self._layout_x = None
+        self._layout_y = None
+        self._base_tables = {}
+
+    def _get_layout(self) -> List[Tuple[Position, float, float]]:
+        if self._layout is None:
+            self._layout = [
+                (position, position.location.x, position.location.y)
+                for position in self.positions.values()
+                if position.location is not None
+            ]
+            self._layout_x = np.array([x for __, x, __ in self._layout])
+            self._layout_y = np.array([y for __, __, y in self._layout])
+        return self._layout
 
     def all_positions(self) -> List[Position]:
         """List all players as a list in sensible order."""
@@ -102,15 +126,46 @@ class Defense(MutableMapping):
     def all_players(self) -> List[Player]:
         return [__.player for __ in self.all_positions()]
 
-    def rank_closest(self, coord: Coord) -> List[Tuple[Position, float]]:
-        closest = [(self[position], coord.distance(self[position].location))
-                   for position in self
-                   if self[position].location is not None]
-        closest.sort(key=lambda x: x[1])
-        return closest
+    def rank_closest(self, coord: Coord, count: int = None) -> List[Tuple[Position, float]]:
+        """Every position (or just the nearest count of them) and how far it is from coord, closest first."""
+        x, y = coord.x, coord.y
+        ranked = sorted(
+            ((position, hypot(px - x, py - y)) for position, px, py in self._get_layout()),
+            key=itemgetter(1)
+        )
+        return ranked if count is None else ranked[:count]
 
     def closest(self, coord: Coord) -> Tuple[Position, float]:
-        return self.rank_closest(coord)[0]
+        # with only a dozen positions, a plain loop beats setting up numpy - that's saved for closest_to_many
+        x, y = coord.x, coord.y
+        closest_position, closest_distance = None, None
+        for position, position_x, position_y in self._get_layout():
+            distance = hypot(position_x - x, position_y - y)
+            if closest_distance is None or distance < closest_distance:
+                closest_position, closest_distance = position, distance
+        if closest_position is None:
+            raise IndexError("No positions on this defense have a location")
+        return closest_position, closest_distance
+
+    def closest_to_base(self, base_locations: Sequence[Coord], base: int) -> Tuple[Position, float]:
+        """closest for one of a stadium's bases. Bases don't move, so this is only worked out once per set of bases
+        until the defense changes."""
+        key = tuple(base_locations)
+        table = self._base_tables.get(key)
+        if table is None:
+            table = [self.closest(location) for location in base_locations]
+            self._base_tables[key] = table
+        return table[base]
+
+    def closest_to_many(self, x: np.ndarray, y: np.ndarray) -> Tuple[List[Position], np.ndarray]:
+        """closest for a whole array of spots at once: returns the closest position to each, and how far away it is.
+        """
+        layout = self._get_layout()
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        distances = np.hypot(self._layout_x[:, np.newaxis] - x, self._layout_y[:, np.newaxis] - y)
+        nearest = np.argmin(distances, axis=0)
+        return [layout[i][0] for i in nearest], distances[nearest, np.arange(len(x))]
 
     def find(self, player: Union[str, Player]) -> Position:
         """Finds a player's position based on that player's player object, CID, or name."""
@@ -138,11 +193,13 @@ class Defense(MutableMapping):
         if key not in self.positions:
             raise KeyError(f"Could not locate key {key} in positions dictionary!")
         self.positions[key] = value
+        self.reset_layout()
 
     def __delitem__(self, key: str) -> None:
         if key not in self.positions:
             raise KeyError(f"Could not locate key {key} in positions dictionary!")
         del(self.positions[key])
+        self.reset_layout()
 
     def __iter__(self):
         return iter(self.positions)
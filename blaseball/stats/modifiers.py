@@ -2,7 +2,7 @@
 Defines Modifiers - special things that affect a player, meant to be distinct and/or temporary
 """
 
-from random import shuffle
+from blaseball.util.rng import shuffle
 from collections.abc import Mapping
 from typing import Union, Dict, List, TYPE_CHECKING
 if TYPE_CHECKING:
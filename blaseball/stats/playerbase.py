@@ -6,16 +6,346 @@ The indexes are player CIDs, and the columns are stat names
 
 """
 from collections.abc import MutableMapping, Hashable
+from collections import defaultdict
+import heapq
 
 import pandas as pd
+import numpy as np
 from numpy import integer
 from loguru import logger
 
-from typing import TYPE_CHECKING, Union, List, Dict
+from typing import TYPE_CHECKING, Union, List, Dict, Optional, Sequence, Iterable
 if TYPE_CHECKING:
     from blaseball.stats import statclasses, players
 
 
+class WeightMatrix:
+    """Every Weight of a single Kind, compiled into one dense coefficient matrix.
+
+    Rows are the input stats and columns are the weights, so a (players x inputs) block of stat values times
+    the matrix gives every weight for every player in a single multiply. These are built lazily by
+    PlayerBase.get_weight_matrix and thrown away whenever a weight of that kind changes.
+    """
+    def __init__(self, weights: List['statclasses.Weight']):
+        self.weights = list(weights)
+        self.weight_set = set(self.weights)
+        self.weight_slots = [weight.slot for weight in self.weights]
+        self.inputs = []
+        for weight in self.weights:
+            for stat in weight.stats:
+                if stat not in self.inputs:
+                    self.inputs += [stat]
+        input_index = {stat: i for i, stat in enumerate(self.inputs)}
+
+        self.coefficients = np.zeros((len(self.inputs), len(self.weights)))
+        for i, weight in enumerate(self.weights):
+            for stat, value in weight.stats.items():
+                self.coefficients[input_index[stat], i] = value
+
+        total_weights = np.array([sum(weight.stats.values()) + weight.extra_weight for weight in self.weights])
+        self._zero_weight = total_weights == 0
+        self._divisors = np.where(self._zero_weight, 1.0, total_weights)
+        self._defaults = np.array([weight.default for weight in self.weights], dtype=float)
+
+    def _normalize(self, totals: np.ndarray) -> np.ndarray:
+        """Mirrors Weight.calculate_value: a zero total is 0, a zero weight is the default."""
+        results = np.where(self._zero_weight, self._defaults, totals / self._divisors)
+        return np.where(totals == 0, 0.0, results)
+
+    def calculate_row(self, values: Sequence[float]) -> np.ndarray:
+        """Calculate every weight for one player, given that player's values for self.inputs"""
+        return self._normalize(np.asarray(values, dtype=float) @ self.coefficients)
+
+    def calculate_columns(self, df: pd.DataFrame) -> np.ndarray:
+        """Calculate every weight for every player in df, as a (players x weights) array."""
+        if len(self.inputs) == 0:
+            return np.zeros((len(df.index), len(self.weights)))
+        values = df[[stat.name for stat in self.inputs]].to_numpy(dtype=float)
+        return self._normalize(values @ self.coefficients)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+
+class StatGraph:
+    """The stat-level dependency graph for a playerbase, so writing a stat only makes the stats that actually
+    read it stale.
+
+    Each dependent stat (any stat whose kind has base dependencies) reads the stats listed by its
+    Stat.get_dependencies, or if it doesn't declare any, every stat of every kind its kind depends on. From
+    that this works out:
+    - stale_on_write: indexed by slot, the slots of every stat that goes stale when that stat is written
+    - order: every dependent stat, sorted so each comes after everything it reads. Ties go to the kind with
+      fewer layers of base dependencies, then to slot order.
+    - plan: order as recalculation steps of (stat or WeightMatrix, slots), where each kind's WeightMatrix
+      stands in for all of its weights.
+
+    These are built lazily by PlayerBase.get_stat_graph and thrown away whenever a stat or weight changes.
+    """
+    def __init__(self, pb: 'PlayerBase'):
+        self.kind_rank = {}
+        for kind in pb.recalculation_order:
+            self._rank_kind(pb, kind)
+
+        stats = [stat for stat in pb.stats_by_slot if stat is not None]
+        self.dependencies = {}
+        for stat in stats:
+            dependency_kinds = pb.dependencies[stat.kind]
+            if not dependency_kinds:
+                continue
+            declared = stat.get_dependencies()
+            if declared is None:
+                self.dependencies[stat] = [x for x in stats if x.kind in dependency_kinds]
+                continue
+            for dependency in declared:
+                if dependency.kind != stat.kind and dependency.kind not in dependency_kinds:
+                    raise RuntimeError(f"Stat {stat} depends on {dependency}, "
+                                       f"but {stat.kind} does not depend on {dependency.kind}!")
+            # skip anything that's since been removed from the playerbase
+            self.dependencies[stat] = [
+                x for x in dict.fromkeys(declared) if pb.stats.get(x.name) is x
+            ]
+
+        dependents = defaultdict(list)
+        for stat, stat_dependencies in self.dependencies.items():
+            for dependency in stat_dependencies:
+                dependents[dependency] += [stat]
+
+        self.order = self._sort(dependents)
+        self.dependent_slots = frozenset(stat.slot for stat in self.order)
+
+        # everything downstream of a stat comes after it in order, so walking backwards means a stat's
+        # dependents are always finished before it is
+        self.stale_on_write = [frozenset()] * len(pb.stats_by_slot)
+        base_stats = [stat for stat in stats if stat not in self.dependencies]
+        for stat in list(reversed(self.order)) + base_stats:
+            stale_slots = set()
+            for dependent in dependents[stat]:
+                stale_slots.add(dependent.slot)
+                stale_slots |= self.stale_on_write[dependent.slot]
+            self.stale_on_write[stat.slot] = frozenset(stale_slots)
+
+        self.plan = []
+        planned_matrices = set()
+        for stat in self.order:
+            weight_matrix = pb.get_weight_matrix(stat.kind)
+            if weight_matrix is not None and stat in weight_matrix.weight_set:
+                # the matrix only reads other kinds, which are all done by now
+                if weight_matrix not in planned_matrices:
+                    planned_matrices.add(weight_matrix)
+                    self.plan += [(weight_matrix, frozenset(weight_matrix.weight_slots))]
+            else:
+                self.plan += [(stat, frozenset([stat.slot]))]
+
+    def _rank_kind(self, pb: 'PlayerBase', kind: 'statclasses.Kinds') -> int:
+        if kind not in self.kind_rank:
+            self.kind_rank[kind] = 1 + max(
+                (self._rank_kind(pb, dependency) for dependency in pb.dependencies[kind]), default=-1
+            )
+        return self.kind_rank[kind]
+
+    def _sort(self, dependents: Dict['statclasses.Stat', List['statclasses.Stat']]) -> List['statclasses.Stat']:
+        """Kahn's algorithm over the dependent stats, taking the lowest (kind rank, slot) that's ready."""
+        waiting_on = {
+            stat: sum(1 for x in stat_dependencies if x in self.dependencies)
+            for stat, stat_dependencies in self.dependencies.items()
+        }
+        ready = [(self.kind_rank[stat.kind], stat.slot, stat) for stat, count in waiting_on.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            __, __, stat = heapq.heappop(ready)
+            order += [stat]
+            for dependent in dependents[stat]:
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    heapq.heappush(ready, (self.kind_rank[dependent.kind], dependent.slot, dependent))
+        if len(order) < len(waiting_on):
+            cycle = [stat for stat, count in waiting_on.items() if count > 0]
+            raise RuntimeError(f"Stat dependency cycle between {cycle}!")
+        return order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+class StatArray:
+    """An optional home for every player's stat cache, in place of a dict per player.
+
+    Numeric stats live in one contiguous NumPy structured array, with a row per player and a field per stat.
+    Everything else (names, descriptors, Decimals) goes in a side table of object arrays. Players hold a StatRow
+    view into this instead of a dict; turn it on with PlayerBase.use_array_store().
+
+    Each stat's field takes the type of its dataframe column if dtypes are given, otherwise like the dataframe
+    a stat's default sets the type: an int default makes an int field, which will truncate any float written to it.
+    """
+    def __init__(self, stats: Iterable['statclasses.Stat'], capacity: int = 64, dtypes: pd.Series = None):
+        self.stats = list(stats)
+        self._field_types = {}  # stat -> numpy type, or None for the side table
+        for stat in self.stats:
+            if dtypes is not None and stat.name in dtypes.index:
+                self._field_types[stat] = self._dtype_field_type(dtypes[stat.name])
+            else:
+                self._field_types[stat] = self._field_type(stat)
+        self.rows = {}  # cid -> row
+        self._free_rows = []  # rows given up by removed players, handed out again before any new ones
+        self._rows_used = 0  # every row below this has been handed out at some point
+        self.capacity = capacity
+        self.values = None  # the structured array of numeric stats
+        self.objects = {}  # stat -> object array, for non-numeric stats
+        self.columns = {}  # stat -> the 1D array (field view or object array) that holds that stat
+        self._reallocate(self.stats, capacity)
+
+    @staticmethod
+    def _field_type(stat: 'statclasses.Stat') -> Optional[type]:
+        """The numpy type for a stat's field, or None if it belongs in the side table."""
+        if isinstance(stat.default, (bool, np.bool_)):
+            return None
+        elif isinstance(stat.default, (int, np.integer)):
+            return np.int64
+        elif isinstance(stat.default, (float, np.floating)):
+            return np.float64
+        else:
+            return None
+
+    @staticmethod
+    def _dtype_field_type(dtype: np.dtype) -> Optional[type]:
+        if pd.api.types.is_bool_dtype(dtype):
+            return None
+        elif pd.api.types.is_integer_dtype(dtype):
+            return np.int64
+        elif pd.api.types.is_float_dtype(dtype):
+            return np.float64
+        else:
+            return None
+
+    def _reallocate(self, stats: List['statclasses.Stat'], capacity: int):
+        """Rebuild the storage for this set of stats and capacity, keeping any values already stored."""
+        numeric_stats = [stat for stat in stats if self._field_types[stat] is not None]
+        new_values = np.zeros(capacity, dtype=[(stat.name, self._field_types[stat]) for stat in numeric_stats])
+        new_objects = {stat: np.empty(capacity, dtype=object) for stat in stats if stat not in numeric_stats}
+
+        used = self._rows_used
+        for stat in numeric_stats:
+            if stat in self.columns:
+                new_values[stat.name][0:used] = self.columns[stat][0:used]
+            else:
+                new_values[stat.name][0:used] = stat.default
+        for stat, column in new_objects.items():
+            if stat in self.columns:
+                column[0:used] = self.columns[stat][0:used]
+            else:
+                column[0:used] = stat.default
+
+        self.stats = list(stats)
+        self.capacity = capacity
+        self.values = new_values
+        self.objects = new_objects
+        self.columns = {
+            stat: (self.values[stat.name] if stat in numeric_stats else self.objects[stat]) for stat in self.stats
+        }
+
+    def add_row(self, cid: int) -> int:
+        """Add a row of default values for a player, returning the row index"""
+        if cid in self.rows:
+            raise KeyError(f"CID {cid} already has a row in this StatArray!")
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._rows_used >= self.capacity:
+                self._reallocate(self.stats, self.capacity * 2)
+            row = self._rows_used
+            self._rows_used += 1
+        self.rows[cid] = row
+        for stat, column in self.columns.items():
+            column[row] = stat.default
+        return row
+
+    def remove_row(self, cid: int):
+        """Give up a player's row, so the next new player can have it. Their StatRow is invalid after this."""
+        self._free_rows += [self.rows.pop(cid)]
+
+    def add_stat(self, stat: 'statclasses.Stat'):
+        self._field_types[stat] = self._field_type(stat)
+        self._reallocate(self.stats + [stat], self.capacity)
+
+    def remove_stat(self, stat: 'statclasses.Stat'):
+        self._reallocate([x for x in self.stats if x != stat], self.capacity)
+        del self._field_types[stat]
+
+    def clear(self):
+        """Drop every row. Existing StatRows are invalid after this."""
+        self.rows = {}
+        self._free_rows = []
+        self._rows_used = 0
+
+    def set_column(self, stat: 'statclasses.Stat', cids: Iterable[int], values: Iterable):
+        """Write a whole stat for many players at once"""
+        rows = np.fromiter((self.rows[cid] for cid in cids), dtype=np.int64)
+        self.columns[stat][rows] = values
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class StatRow(MutableMapping):
+    """A single player's stats in a StatArray, as a stat -> value mapping. This stands in for a Player's
+    _stats_cache dict when the playerbase uses an array store."""
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store: StatArray, row: int):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, stat: 'statclasses.Stat'):
+        return self.store.columns[stat][self.row]
+
+    def __setitem__(self, stat: 'statclasses.Stat', value):
+        self.store.columns[stat][self.row] = value
+
+    def __delitem__(self, stat: 'statclasses.Stat'):
+        raise KeyError(f"Can't remove {stat} from a single StatRow; use PlayerBase.remove_stat")
+
+    def __iter__(self) -> iter:
+        return iter(self.store.columns)
+
+    def __len__(self) -> int:
+        return len(self.store.columns)
+
+
+class SlotCache(MutableMapping):
+    """The default per-player stat cache: a plain list of values indexed by Stat.slot, presented as a
+    stat -> value mapping. Players read and write slot_values directly on their hot path."""
+    __slots__ = ('pb', 'slot_values')
+
+    def __init__(self, pb: 'PlayerBase', slot_values: list):
+        self.pb = pb
+        self.slot_values = slot_values
+
+    def _slot(self, stat: Union['statclasses.Stat', str]) -> int:
+        if isinstance(stat, str):
+            stat = self.pb.stats[stat]
+        return stat.slot
+
+    def __getitem__(self, stat: Union['statclasses.Stat', str]):
+        return self.slot_values[self._slot(stat)]
+
+    def __setitem__(self, stat: Union['statclasses.Stat', str], value):
+        slot = self._slot(stat)
+        if slot >= len(self.slot_values):
+            self.slot_values += [None] * (slot + 1 - len(self.slot_values))
+        self.slot_values[slot] = value
+
+    def __delitem__(self, stat: 'statclasses.Stat'):
+        raise KeyError(f"Can't remove {stat} from a single SlotCache; use PlayerBase.remove_stat")
+
+    def __iter__(self) -> iter:
+        return (stat for stat in self.pb.stats_by_slot[0:len(self.slot_values)] if stat is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for __ in self)
+
+
 class PlayerBase(MutableMapping):
     """this class contains the whole set of players and contains operations
     to execute actions on batches of players
@@ -41,8 +371,11 @@ class PlayerBase(MutableMapping):
         # players and stats hash to their index and column headers respectively
 
         self.stats = {}  # dict of Stats
+        self.stats_by_slot = []  # every stat indexed by its Stat.slot; removed stats leave a None behind
         self._default_stat_list = []
         self.players = {}  # dict of Players
+        # by default each player caches its own stats in a dict; see use_array_store() for the alternative
+        self.array_store = None
 
         # each time you add a column, you increase the fragmentation of the dataframe
         # the correct way to bulk add columns is all at once in a vectorized operation
@@ -66,21 +399,79 @@ class PlayerBase(MutableMapping):
             for dependency in self.dependencies[kind]:
                 self.dependents[dependency] += [kind]
 
+        # lookup indexes for the get_stats_with_* functions, kept up to date by add_stat, remove_stat, and
+        # reindex_stat (for attributes like abbreviation that get set after the stat is added)
+        self._stats_by_kind = defaultdict(list)
+        self._stats_by_personality = defaultdict(list)
+        self._stats_by_category = defaultdict(list)
+        self._stats_by_abbreviation = {}
+
+        # weights are compiled per kind into a WeightMatrix on first use; see get_weight_matrix()
+        self._weights = defaultdict(list)
+        self._weight_matrices = {}
+        # and the stat dependency graph is built on first use too; see get_stat_graph()
+        self._stat_graph = None
+
         logger.debug("Initialized new playerbase.")
 
-    def create_blank_stale_dict(self, state=True):
-        """Creates a fresh blank stale dictionary. If state is True, this dict starts entirely stale.
+    def create_blank_stale_set(self, state=True) -> set:
+        """Creates a fresh set of stale stat slots. If state is True, every dependent stat starts stale.
         Otherwise, it starts fresh."""
-        stale_dict = {kind: False for kind in self.recalculation_order}
         if state:
-            for kind in self.base_dependencies.keys():
-                stale_dict[kind] = True
-        return stale_dict
+            return set(self.get_stat_graph().dependent_slots)
+        return set()
 
     def get_default_stat_dict(self):
         """Creates a fresh blank stats cache dictionary."""
         return {stat: stat.default for stat in self.stats.values()}
 
+    def new_stats_cache(self, cid: int) -> MutableMapping:
+        """Creates a fresh stats cache for a player: a SlotCache of defaults, or a StatRow if using an array store."""
+        if self.array_store is None:
+            return SlotCache(self, [None if stat is None else stat.default for stat in self.stats_by_slot])
+        else:
+            return StatRow(self.array_store, self.array_store.add_row(cid))
+
+    def use_array_store(self) -> None:
+        """Switch this playerbase over to keeping every player's stat cache in a single StatArray,
+        which cuts per-player memory a lot for large leagues. Existing players are moved over.
+
+        This can't be switched back off."""
+        if self.array_store is not None:
+            return
+        # an empty dataframe's columns are all object, so only trust its dtypes once it has some players in it
+        dtypes = self.df.dtypes if len(self.df.index) > 0 else None
+        self.array_store = StatArray(self.stats.values(), dtypes=dtypes)
+        for player in self.players.values():
+            old_cache = player._stats_cache
+            player._stats_cache = self.new_stats_cache(player.cid)
+            player._slot_values = None
+            for stat, value in old_cache.items():
+                player._stats_cache[stat] = value
+
+    def _release_player(self, cid: int) -> 'players.Player':
+        """Take a player out of players, and out of the array store if there is one. The player keeps its last
+        stat values in a cache of its own, and anything it hadn't saved to the dataframe yet is dropped."""
+        player = self.players.pop(cid)
+        if self.array_store is not None:
+            row = player._stats_cache
+            player._stats_cache = SlotCache(
+                self, [None if stat is None else row[stat] for stat in self.stats_by_slot]
+            )
+            player._slot_values = player._stats_cache.slot_values
+            self.array_store.remove_row(cid)
+        player._dirty_stats.clear()
+        player.pb_is_stale = False
+        return player
+
+    def _write_column_to_caches(self, stat: 'statclasses.Stat', players_in_order: List['players.Player'], values):
+        """Push a column of freshly calculated values into the players' caches."""
+        if self.array_store is not None:
+            self.array_store.set_column(stat, [player.cid for player in players_in_order], values)
+        else:
+            for player, value in zip(players_in_order, values):
+                player._stats_cache[stat] = value
+
     def new_player(self, player: 'players.Player'):
         if len(self._pending_stats) > 0:
             self.write_stats_to_dataframe()
@@ -88,10 +479,74 @@ class PlayerBase(MutableMapping):
         self.players[player.cid] = player
         self.df.loc[player.cid] = self._default_stat_list
 
+    def create_players(self, count: int) -> List['players.Player']:
+        """Create and initialize count new players at once, returning them in cid order.
+
+        This is equivalent to count rounds of Player(pb) and initialize(), but each stat is rolled for every new
+        player in one go (see Stat.calculate_initial_column) and the new rows are added to the dataframe in a
+        single concat instead of growing it a row at a time. Use this for anything bigger than a handful of players.
+        """
+        # players imports playerbase, so this can't live at the top of the module
+        from blaseball.stats.players import Player
+
+        if len(self._pending_stats) > 0:
+            self.write_stats_to_dataframe()
+
+        new_players = [Player(self, cid=Player.new_cid()) for __ in range(count)]
+        for player in new_players:
+            self.players[player.cid] = player
+
+        new_df = pd.DataFrame(
+            {column: [self.stats[column].default] * count for column in self.df.columns},
+            index=[player.cid for player in new_players]
+        )
+        base_stats = [stat for stat in self.stats.values() if not self.dependencies[stat.kind]]
+        for stat in base_stats:
+            new_df[stat.name] = stat.calculate_initial_column(new_df)
+
+        if len(self.df.index) == 0:
+            self.df = new_df
+        else:
+            self.df = pd.concat([self.df, new_df])
+
+        for stat in base_stats:
+            self._write_column_to_caches(stat, new_players, new_df[stat.name].tolist())
+        for player in new_players:
+            player._dirty_stats.clear()
+            player.pb_is_stale = False
+
+        self.recalculate_all()
+        return new_players
+
     def clear_players(self) -> None:
         """Remove all players in a playerbase."""
         self.df.drop(self.df.index, inplace=True)
         self.players = {}
+        if self.array_store is not None:
+            self.array_store.clear()
+
+    def load_dataframe(self, df: pd.DataFrame) -> None:
+        """Replace all players with the ones in df, which must have a column for every stat - say, a copy of
+        another process's playerbase. Players are created for any new rows, and every player reloads from df."""
+        # players imports playerbase, so this can't live at the top of the module
+        from blaseball.stats.players import Player
+
+        self.df = df.copy()
+        self._pending_stats = []
+        for cid in [cid for cid in self.players if cid not in self.df.index]:
+            self._release_player(cid)
+        for cid in self.df.index:
+            if cid not in self.players:
+                self.players[cid] = Player(self, cid)
+        # to_dict gives plain python values, same as freshly rolled players have - unlike df.at, which gives
+        # numpy scalars that don't always behave the same
+        rows = self.df.to_dict('index')
+        for player in self.players.values():
+            for stat_name, value in rows[player.cid].items():
+                player._stats_cache[stat_name] = value
+            player._dirty_stats.clear()
+            player.pb_is_stale = False
+        self.recalculate_all()
 
     def write_stats_to_dataframe(self):
         """Writes all cached stats in _pending_stats to the dataframe columns"""
@@ -99,9 +554,24 @@ class PlayerBase(MutableMapping):
         self._pending_stats = []
 
     def save_all_players_to_pb(self):
+        """Write every stale player's changed stats back to the dataframe.
+
+        Players track which of their stats are dirty, so this gathers those cells up by stat and writes each
+        column in one assignment, rather than one df.at per player per stat."""
+        dirty_columns = defaultdict(lambda: ([], []))
         for player in self.players.values():
             if player.pb_is_stale:
-                player.save_to_pb()
+                player.recalculate()
+                for slot in player._dirty_stats:
+                    stat = self.stats_by_slot[slot]
+                    cids, values = dirty_columns[stat]
+                    cids += [player.cid]
+                    values += [player._stats_cache[stat]]
+                player._dirty_stats.clear()
+                player.pb_is_stale = False
+
+        for stat, (cids, values) in dirty_columns.items():
+            self.df.loc[cids, stat.name] = values
 
     def __len__(self) -> int:
         if len(self.players) != len(self.df.index):
@@ -162,10 +632,13 @@ class PlayerBase(MutableMapping):
 
     def __delitem__(self, key: Union[int, 'players.Player']) -> None:
         """Remove a player from the playerbase"""
-        if isinstance(key, players.Player):
+        # players imports playerbase, so this can't live at the top of the module
+        from blaseball.stats.players import Player
+
+        if isinstance(key, Player):
             key = key.cid
 
-        del self.players[key]
+        self._release_player(key)
         self.df.drop(key, inplace=True)
 
     def __str__(self) -> str:
@@ -192,19 +665,41 @@ class PlayerBase(MutableMapping):
     def __iter__(self) -> iter:
         return iter(self.players.values())
 
-    def recalculate_all(self):
-        for kind in self.recalculation_order:
-            if self.dependencies[kind]:
-                for stat in self.get_stats_with_kind(kind):
-                    self.df[stat] = [stat.calculate_value(cid) for cid in self.df.index]
-        for player in self.players.values():
-            player._stale_dict = self.create_blank_stale_dict(False)
+    def recalculate_all(self, vectorized: bool = True):
+        """Recalculate every dependent stat for every player.
+
+        By default this works a column at a time (see Stat.calculate_column) straight from the dataframe,
+        so stale players are saved first, and each new column is pushed back into the player caches as it's
+        finished so stats later in the stat graph's plan (see get_stat_graph) see the new values.
+        vectorized=False forces the old per-player path, and is mostly useful for comparison."""
+        self.save_all_players_to_pb()
+        players_in_order = [self.players[cid] for cid in self.df.index]
+        # every step only reads stats from earlier steps, which are pushed into the caches as they're done,
+        # so nothing a step reads through a player is ever actually stale
+        for player in players_in_order:
+            player._stale_stats.clear()
+        for step, __ in self.get_stat_graph().plan:
+            if isinstance(step, WeightMatrix) and vectorized:
+                weight_columns = step.calculate_columns(self.df)
+                for i, weight in enumerate(step.weights):
+                    self.df[weight.name] = weight_columns[:, i]
+                    self._write_column_to_caches(weight, players_in_order, weight_columns[:, i].tolist())
+            else:
+                for stat in (step.weights if isinstance(step, WeightMatrix) else [step]):
+                    if vectorized:
+                        self.df[stat.name] = stat.calculate_column()
+                    else:
+                        self.df[stat.name] = [stat.calculate_value(cid) for cid in self.df.index]
+                    self._write_column_to_caches(stat, players_in_order, self.df[stat.name].tolist())
 
     def add_stat(self, stat: 'statclasses.Stat'):
         """This adds a stat to the playerbase. This is called by the Stat's init method!!"""
         if stat.kind not in self.recalculation_order:
             raise RuntimeError(f"Invalid stat kind! {stat.kind} not in {self.recalculation_order}!")
         self.stats[stat.name] = stat
+        stat.slot = len(self.stats_by_slot)
+        self.stats_by_slot += [stat]
+        self._index_stat(stat)
 
         if len(self.df) == 0:
             self._pending_stats += [stat.name]
@@ -212,44 +707,130 @@ class PlayerBase(MutableMapping):
             self.df[stat.name] = stat.default
 
         self._default_stat_list += [stat.default]
+        if self.array_store is not None:
+            self.array_store.add_stat(stat)
+        self.invalidate_stat_graph()
         for player in self.players.values():
             player.add_stat(stat)
 
     def remove_stat(self, stat: 'statclasses.Stat'):
         del self.stats[stat.name]
+        self.stats_by_slot[stat.slot] = None
+        self._unindex_stat(stat)
+        if stat in self._weights[stat.kind]:
+            self._weights[stat.kind].remove(stat)
+            self.invalidate_weights(stat.kind)
+        self.invalidate_stat_graph()
+        for player in self.players.values():
+            player._dirty_stats.discard(stat.slot)
+            player._stale_stats.discard(stat.slot)
+        if self.array_store is not None:
+            self.array_store.remove_stat(stat)
         column_pos = list(self.df.columns).index(stat.name)
         self.df.drop(columns=[stat.name], inplace=True)
         self._default_stat_list.pop(column_pos)
 
+    def add_weight(self, weight: 'statclasses.Weight'):
+        """Register a Weight so it can be compiled into its kind's WeightMatrix. Called by Weight's init."""
+        self._weights[weight.kind] += [weight]
+        self.invalidate_weights(weight.kind)
+
+    def invalidate_weights(self, kind: 'statclasses.Kinds'):
+        """Drop the compiled WeightMatrix for kind; call this whenever a weight of that kind changes."""
+        self._weight_matrices.pop(kind, None)
+        self.invalidate_stat_graph()
+
+    def invalidate_stat_graph(self):
+        """Drop the stat dependency graph; call this whenever what any stat depends on changes."""
+        self._stat_graph = None
+
+    def get_stat_graph(self) -> StatGraph:
+        """Get the stat dependency graph, building it if needed."""
+        if self._stat_graph is None:
+            self._stat_graph = StatGraph(self)
+        return self._stat_graph
+
+    def get_weight_matrix(self, kind: 'statclasses.Kinds') -> Optional[WeightMatrix]:
+        """Get the compiled WeightMatrix for all weights of a kind, compiling it if needed.
+
+        Returns None if there are no weights of that kind, or if any of them take a stat of their own kind
+        as an input, since those have to be calculated one at a time in order."""
+        if kind not in self._weight_matrices:
+            weights = self._weights[kind]
+            same_kind_inputs = any(stat.kind == kind for weight in weights for stat in weight.stats)
+            if len(weights) == 0 or same_kind_inputs:
+                self._weight_matrices[kind] = None
+            else:
+                self._weight_matrices[kind] = WeightMatrix(weights)
+        return self._weight_matrices[kind]
+
     # stat indexing functions
+    @staticmethod
+    def _index_keys(stat: 'statclasses.Stat') -> tuple:
+        # only ratings have a personality and category:
+        return stat.kind, getattr(stat, 'personality', None), getattr(stat, 'category', None), stat.abbreviation
+
+    def _index_stat(self, stat: 'statclasses.Stat'):
+        kind, personality, category, abbreviation = self._index_keys(stat)
+        for index, key in [
+            (self._stats_by_kind, kind),
+            (self._stats_by_personality, personality),
+            (self._stats_by_category, category)
+        ]:
+            if key is not None and stat not in index[key]:
+                index[key] += [stat]
+                # keep these in the same order as self.stats
+                index[key].sort(key=lambda x: x.slot)
+        if abbreviation is not None:
+            self._stats_by_abbreviation[abbreviation] = stat
+
+    def _unindex_stat(self, stat: 'statclasses.Stat'):
+        for index in [self._stats_by_kind, self._stats_by_personality, self._stats_by_category]:
+            for stats in index.values():
+                if stat in stats:
+                    stats.remove(stat)
+        for abbreviation in [x for x, y in self._stats_by_abbreviation.items() if y is stat]:
+            del self._stats_by_abbreviation[abbreviation]
+
+    def reindex_stat(self, stat: 'statclasses.Stat'):
+        """Update the stat lookup indexes for a stat. Call this whenever a stat's kind, personality, category,
+        or abbreviation changes after it's been added."""
+        if stat.name in self.stats:
+            self._unindex_stat(stat)
+            self._index_stat(stat)
+
     def get_stats_with_kind(self, kind: 'statclasses.Kinds') -> List['statclasses.Stat']:
-        stats = [x for x in self.stats.values() if x.kind == kind]
-        if len(stats) == 0:
+        stats = self._stats_by_kind.get(kind)
+        if not stats:
             raise KeyError(f"Could not locate any stats with kind {kind}!")
-        return stats
+        return list(stats)
 
     def get_stats_with_personality(self, personality: 'statclasses.Stat') -> List['statclasses.Stat']:
-        # this lazily evaluates so we should only call x.personality if it has it:
-        ratings = [x for x in self.stats.values() if hasattr(x, 'personality') and x.personality == personality]
-        if len(ratings) == 0:
+        ratings = self._stats_by_personality.get(personality)
+        if not ratings:
             raise KeyError(f"Could not locate any stats with personality {personality}!")
-        return ratings
+        return list(ratings)
 
     def get_stats_with_category(self, category: 'statclasses.Stat') -> List['statclasses.Stat']:
-        stats = [x for x in self.stats.values() if hasattr(x, 'category') and x.category == category]
-        if len(stats) == 0:
+        stats = self._stats_by_category.get(category)
+        if not stats:
             raise KeyError(f"Could not locate any stats with category {category}!")
-        return stats
+        return list(stats)
+
+    def get_stat_with_abbreviation(self, abbreviation: str) -> Optional['statclasses.Stat']:
+        """Get the stat with this abbreviation, or None if there isn't one."""
+        return self._stats_by_abbreviation.get(abbreviation)
 
     def get_stats_by_name(self, identifier: str) -> List['statclasses.Stat']:
         if identifier in self.stats:
             return [self.stats[identifier]]
 
-        stats = [x for x in self.stats.values() if x.abbreviation == identifier]
+        if identifier in self._stats_by_abbreviation:
+            return [self._stats_by_abbreviation[identifier]]
+
+        stats = [self.stats[x] for x in self.stats if identifier in x]
         if len(stats) == 0:
-            stats = [self.stats[x] for x in self.stats if identifier in x]
-            if len(stats) == 0:
-                raise KeyError(f"Could not locate any stats with identifier {identifier}!")
+            raise KeyError(f"Could not locate any stats with identifier {identifier}!")
         return stats
 
     def verify(self) -> None:
@@ -6,7 +6,6 @@ It handles its own caching, and you should feel comfortable passing Players arou
 
 """
 
-import random
 from collections.abc import Mapping
 from typing import Union, List
 
@@ -16,6 +15,7 @@ import pandas as pd
 
 from blaseball.stats import playerbase, statclasses, modifiers
 from blaseball.stats import stats as s
+from blaseball.util import rng
 
 
 class Player(Mapping):
@@ -31,6 +31,8 @@ class Player(Mapping):
     player_class_id = 1000  # unique ID for each generation of a player,
     # used to verify uniqueness
 
+    __slots__ = ('pb', 'cid', '_stale_stats', '_stats_cache', '_slot_values', 'pb_is_stale', '_dirty_stats', 'modifiers')
+
     @staticmethod
     def new_cid() -> int:
         """Generates a new, unique CID for a player."""
@@ -46,9 +48,14 @@ class Player(Mapping):
             # this player was already created as a row
             self.cid = cid
 
-        self._stale_dict = pb.create_blank_stale_dict()
-        self._stats_cache = pb.get_default_stat_dict()
+        self._stale_stats = pb.create_blank_stale_set()  # slots of dependent stats that need recalculating
+        self._stats_cache = pb.new_stats_cache(self.cid)  # a SlotCache, or a StatRow if pb uses an array store
+        # the list behind a SlotCache, indexed by Stat.slot, for the fast path in __getitem__ and __setitem__
+        self._slot_values = getattr(self._stats_cache, 'slot_values', None)
         self.pb_is_stale = True
+        # slots of stats whose cached value hasn't been written to the playerbase yet;
+        # see PlayerBase.save_all_players_to_pb
+        self._dirty_stats = {stat.slot for stat in self._stats_cache}
 
         # this does not use self.add_modifier! This is called before stats get initialized - the personality four
         # use Personality which looks backwards at this list to retroactively calculate the effects of traits
@@ -59,15 +66,18 @@ class Player(Mapping):
         """Adds a stat to a player - this should be called by playerbase, since otherwise you'll get out of sync
         with PlayerBase's stat listings."""
         self._stats_cache[stat] = stat.default
+        self._dirty_stats.add(stat.slot)
         self.pb_is_stale = True
-        for kind in self.pb.dependents[stat.kind]:
-            self._stale_dict[kind] = True
+        stat_graph = self.pb.get_stat_graph()
+        self._stale_stats.update(stat_graph.stale_on_write[stat.slot])
+        if stat.slot in stat_graph.dependent_slots:
+            self._stale_stats.add(stat.slot)
 
     @staticmethod
     def roll_traits() -> List[modifiers.Modifier]:
         """Create random traits for this player."""
         trait_list = []
-        for i in range(0, random.randrange(3, 6)):
+        for i in range(0, rng.integers(3, 6)):
             trait_list += [modifiers.default_personality_deck.draw()]
         return trait_list
 
@@ -102,16 +112,32 @@ class Player(Mapping):
         """Player keeps a cache of all derived stats. If a derived stat's dependent updates, the derived stat becomes
         stale and any time that stat is read results in a recalculation.
 
-        This function recalculates all stale derived stats and updates this player's cache, refreshing all stale
-        Kinds.
+        This function recalculates only the stale derived stats and updates this player's cache, walking the
+        playerbase's stat graph plan so everything is recalculated after the stats it reads.
+
+        Weights are calculated all at once from their kind's compiled WeightMatrix if any of them are stale, and
+        each step is marked fresh as soon as it's done so later steps read it from the cache instead of
+        recalculating it.
         """
+        if not self._stale_stats:
+            return
         self.pb_is_stale = True
-        for kind in self.pb.recalculation_order:
-            if self._stale_dict[kind]:
-                for stat in self.pb.get_stats_with_kind(kind):
-                    self._stats_cache[stat] = stat.calculate_value(self.cid)
-        for kind in self._stale_dict:
-            self._stale_dict[kind] = False
+        for step, slots in self.pb.get_stat_graph().plan:
+            if self._stale_stats.isdisjoint(slots):
+                continue
+            if isinstance(step, playerbase.WeightMatrix):
+                values = step.calculate_row([self[stat] for stat in step.inputs])
+                for weight, value in zip(step.weights, values.tolist()):
+                    self._stats_cache[weight] = value
+            else:
+                self._stats_cache[step] = step.calculate_value(self.cid)
+            self._dirty_stats.update(slots)
+            self._stale_stats.difference_update(slots)
+        self._stale_stats.clear()
+
+    def is_stale(self, stat: statclasses.Stat) -> bool:
+        """Whether this player's cached value for a dependent stat needs recalculating."""
+        return stat.slot in self._stale_stats
 
     def get_modifier_total(self, stat: Union[str, statclasses.Stat]):
         """Get the total effect of all modifiers for a stat.
@@ -154,16 +180,21 @@ class Player(Mapping):
                 # catch dependent stat errors
                 pass
 
-        self._stale_dict = self.pb.create_blank_stale_dict(True)
+        self._stale_stats = self.pb.create_blank_stale_set(True)
         self.recalculate()
 
     def save_to_pb(self):
-        """Writes the stored cache to the playerbase"""
+        """Writes any changed stats in the stored cache to the playerbase.
+
+        If you're saving more than a couple of players, use PlayerBase.save_all_players_to_pb instead, which
+        writes a column at a time."""
         self.recalculate()
         # this doesn't work due to a weird pandas bug?
         # self.pb.df.loc[self.cid] = self._stats_cache
-        for stat in self._stats_cache:
+        for slot in self._dirty_stats:
+            stat = self.pb.stats_by_slot[slot]
             self.pb.df.at[self.cid, stat.name] = self._stats_cache[stat]
+        self._dirty_stats.clear()
         self.pb_is_stale = False
 
     def load_from_pb(self):
@@ -172,6 +203,7 @@ class Player(Mapping):
         Because a player is the source of general truth, this is used less than save_to_pb()"""
         for stat in self._stats_cache:
             self._stats_cache[stat] = self.pb.df.at[self.cid, stat]
+        self._dirty_stats.clear()
 
     def stat_row(self) -> pd.Series:
         """Get this player's stats as a pandas series."""
@@ -183,20 +215,22 @@ class Player(Mapping):
         Get a stat or stat-by-name, using relevant caches
 
         How does getting a stat work exactly?
-        - first, check if _stale_dict says this stat's kind is stale
+        - first, check if this stat's slot is in _stale_stats
         - if it's stale, calculate, otherwise use the stats cache
-        - you can only have stale dict flip stale for calculatable kinds, so all non-dependent stats will
-          always hit the stats cache.
+        - only dependent stats ever go stale, so all non-dependent stats will always hit the stats cache.
 
         Note that at no point will you hit playerbase - if you need to pull stats from playerbase to player
         you'll need to use load_from_pb.
 
-        This does work for strings, but it's slower than passing stat classes.
+        This does work for strings, but it's slower than passing stat classes. Stats are read by their slot
+        straight out of the cache list where possible.
         """
         if isinstance(item, statclasses.Stat):
-            if self._stale_dict[item.kind]:
+            if item.slot in self._stale_stats:
                 # cached value is stale
                 return item.calculate_value(self.cid)
+            elif self._slot_values is not None:
+                return self._slot_values[item.slot]
             else:
                 return self._stats_cache[item]
         elif item == 'cid':
@@ -214,9 +248,12 @@ class Player(Mapping):
         if isinstance(item, statclasses.Stat):
             if item.kind in self.pb.base_dependencies:
                 raise RuntimeError(f"Tried to set dependent stat {item} on player {self}!")
-            self._stats_cache[item] = value
-            for kind in self.pb.dependents[item.kind]:
-                self._stale_dict[kind] = True
+            if self._slot_values is not None:
+                self._slot_values[item.slot] = value
+            else:
+                self._stats_cache[item] = value
+            self._dirty_stats.add(item.slot)
+            self._stale_stats.update(self.pb.get_stat_graph().stale_on_write[item.slot])
             self.pb_is_stale = True
         else:
             self[self.pb.stats[item]] = value
@@ -2,16 +2,87 @@
 
 This is vastly premature, so mostly it just holds some coordinate data."""
 
+import math
+from dataclasses import dataclass
+from functools import lru_cache
 
-from blaseball.util.geometry import Coord
+import numpy as np
 from shapely.geometry import Polygon
 
-from typing import Tuple
+from blaseball.util.geometry import Coord, to_polygon
+
+from typing import Sequence, Tuple
 
 
 ANGELS_STADIUM = [330, 365, 396, 389, 330]
 
 
+@dataclass(frozen=True, eq=False)
+class StadiumGeometry:
+    """All the fixed geometry of a stadium: the field, the bases, the mound and the wall lookup table.
+
+    Nothing here changes once it's built, so it's built once per set of dimensions (see stadium_geometry) and every
+    Stadium with those dimensions shares it - across every game, and in every worker process, since pickling one
+    just sends the dimensions and it's looked up again on the other side. Don't modify anything in here."""
+    distances: Tuple[float, ...]
+    points: Tuple[Coord, ...]  # home plate, then the wall points from the right field line round to the left
+    polygon: Polygon
+    base_coords: Tuple[Coord, ...]  # 0 - 3 and then 0 again
+    base_distances: np.ndarray  # base_distances[i, j] is how far base i is from base j (indexes as base_coords)
+    mound: Coord
+    foul_line_angles: Tuple[float, float]  # the right field and left field lines
+    wall_step: float
+    wall_lines: Tuple[Tuple[float, float, float], ...]
+    wall_line_array: np.ndarray
+
+    def __reduce__(self):
+        return stadium_geometry, (self.distances,)
+
+
+def stadium_geometry(distances: Sequence[float]) -> StadiumGeometry:
+    """The shared geometry for a stadium with these wall distances (left field first)."""
+    return _build_geometry(tuple(distances))
+
+
+@lru_cache(maxsize=None)
+def _build_geometry(distances: Tuple[float, ...]) -> StadiumGeometry:
+    points = [Stadium.HOME_PLATE]
+    # here's a fun quibble:
+    # stadium dimensions are traditionally reported left to right - left field first.
+    # but our geometry has 0 degrees pointing down right field
+    # so our points should be clockwise, so we need to reverse the coordinate input
+    # hence the "distances[::-1]"
+    for i, distance in enumerate(distances[::-1]):
+        points += [Coord(distance, 90 * i / (len(distances)-1), True)]
+
+    base_coords = tuple(Stadium.BASE_LOCATIONS + [Stadium.HOME_PLATE])
+    base_distances = np.array([[start.distance(end) for end in base_coords] for start in base_coords])
+    base_distances.flags.writeable = False
+
+    # The wall is a straight segment between each pair of neighbouring points, and they're evenly spaced by
+    # angle - so the wall segment behind any field angle is just angle // wall_step, and how far out the wall
+    # is along that angle comes straight from the segment's line (the set of points where nx * x + ny * y = c).
+    wall_lines = []
+    for start, end in zip(points[1:], points[2:]):
+        normal_x, normal_y = end.y - start.y, start.x - end.x
+        wall_lines += [(normal_x, normal_y, normal_x * start.x + normal_y * start.y)]
+    wall_line_array = np.array(wall_lines)
+    wall_line_array.flags.writeable = False
+
+    return StadiumGeometry(
+        distances=distances,
+        points=tuple(points),
+        polygon=to_polygon(points),
+        base_coords=base_coords,
+        base_distances=base_distances,
+        mound=Stadium.PITCHING_MOUND,
+        foul_line_angles=(Stadium.FIRST_BASE.theta(), Stadium.THIRD_BASE.theta()),
+        wall_step=90 / (len(distances) - 1),
+        wall_lines=tuple(wall_lines),
+        wall_line_array=wall_line_array,
+    )
+
+
 class Stadium:
     NUMBER_OF_BASES = 3  # not counting home
     BASEPATH_LENGTH = 90
@@ -27,33 +98,74 @@ class Stadium:
     WALLS_BONUS = 10
 
     def __init__(self, distances):
-        self.points = [Stadium.HOME_PLATE]
-        # here's a fun quibble:
-        # stadium dimensions are traditionally reported left to right - left field first.
-        # but our geometry has 0 degrees pointing down right field
-        # so our points should be clockwise, so we need to reverse the coordinate input
-        # hence the "distances[::-1]"
-        for i, distance in enumerate(distances[::-1]):
-            self.points += [Coord(distance, 90 * i / (len(distances)-1), True)]
-        self.polygon = Polygon(self.points)
-
-        self.base_coords = Stadium.BASE_LOCATIONS + [Stadium.HOME_PLATE]
+        self.geometry = stadium_geometry(distances)
+        self.points = self.geometry.points
+        self.polygon = self.geometry.polygon
+        self.base_coords = self.geometry.base_coords
 
         self.walls = Stadium.WALLS_BONUS
 
+        self.wall_step = self.geometry.wall_step
+        self.wall_lines = self.geometry.wall_lines
+        self._wall_line_array = self.geometry.wall_line_array
+
+    def __reduce__(self):
+        return Stadium, (self.geometry.distances,)
+
+    def wall_distance(self, angle: float) -> float:
+        """How far the outfield wall is from home plate along a field angle in degrees (0 to 90)."""
+        segment = min(max(int(angle // self.wall_step), 0), len(self.wall_lines) - 1)
+        normal_x, normal_y, offset = self.wall_lines[segment]
+        radians = math.radians(angle)
+        return offset / (normal_x * math.cos(radians) + normal_y * math.sin(radians))
+
+    def in_fair_territory(self, x, y):
+        """Whether a spot is strictly between the foul lines - works on arrays as well as single spots.
+        This checks against the actual first and last wall points (which, rounding being what it is, aren't quite
+        on the axes), and not by angle, so it agrees with the field polygon right up to the lines."""
+        first_x, first_y = self.points[1].x, self.points[1].y
+        last_x, last_y = self.points[-1].x, self.points[-1].y
+        return (first_x * y - first_y * x > 0) & (x * last_y - y * last_x > 0)
+
     def check_home_run(self, location: Coord) -> Tuple[bool, bool]:
-        """Check if a ball is a home run and if it hit the wall"""
-        outside = not self.polygon.contains(location)
-        hit_wall = outside & self.polygon.contains(location.move_towards(self.points[0], self.walls))
-        if hit_wall:
-            outside = False
-        return outside, hit_wall
+        """Check if a ball is a home run and if it hit the wall (landing within the wall bonus of the wall counts as
+        hitting it, and isn't a home run). Anything outside the field counts as out of the park, as do the foul lines.
+        """
+        if not self.in_fair_territory(location.x, location.y):
+            return True, False
+        distance = math.hypot(location.x, location.y)
+        wall = self.wall_distance(math.degrees(math.atan2(location.y, location.x)))
+        if distance < wall:
+            return False, False
+        hit_wall = 0 < distance - self.walls < wall
+        return not hit_wall, hit_wall
+
+    def check_home_runs(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """check_home_run for a whole array of landing spots at once: returns home run and hit wall arrays."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        angles = np.degrees(np.arctan2(y, x))
+        distances = np.hypot(x, y)
+        segments = np.clip(np.floor_divide(angles, self.wall_step).astype(int), 0, len(self.wall_lines) - 1)
+        normal_x, normal_y, offset = self._wall_line_array[segments].T
+        radians = np.radians(angles)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            walls = offset / (normal_x * np.cos(radians) + normal_y * np.sin(radians))
+
+        in_fair_territory = self.in_fair_territory(x, y)
+        beyond_wall = ~in_fair_territory | (distances >= walls)
+        hit_wall = in_fair_territory & beyond_wall & (distances - self.walls > 0) & (distances - self.walls < walls)
+        return beyond_wall & ~hit_wall, hit_wall
 
     def check_foul(self, location: Coord) -> bool:
-        """Check if a batted ball is foul.
-        Right now with simple fielding, this just checks field angle against the stadium field angle.
+        """Check if a batted ball is foul: anywhere that isn't strictly between the foul lines.
+        Right now with simple fielding, this is just the landing spot - not where the ball crossed the bases.
         """
-        return 0 >= location.theta() >= self.THIRD_BASE.theta()
+        return not self.in_fair_territory(location.x, location.y)
+
+    def check_fouls(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """check_foul for a whole array of landing spots at once."""
+        return ~self.in_fair_territory(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
 
 
 if __name__ == "__main__":
@@ -61,6 +173,6 @@ if __name__ == "__main__":
     print(int(s.polygon.area))
     print(int(s.polygon.length))
 
-    print(s.polygon.contains(Coord(550, 200)))
-    print(s.polygon.contains(Coord(360, 100)))
-    print(s.polygon.contains(Coord(100, 100)))
\ No newline at end of file
+    print(s.polygon.contains(Coord(550, 200).to_point()))
+    print(s.polygon.contains(Coord(360, 100).to_point()))
+    print(s.polygon.contains(Coord(100, 100).to_point()))
\ No newline at end of file
@@ -7,8 +7,10 @@ point?
 """
 
 from enum import Enum, auto
-from typing import Union, Callable, Dict, Tuple, List, Optional
-from numpy.random import rand
+from typing import Union, Callable, Dict, Tuple, List, Optional, Iterable
+import numpy as np
+import pandas as pd
+from blaseball.util.rng import rand
 
 from loguru import logger
 
@@ -32,6 +34,10 @@ class Kinds(Enum):
     test = auto()  # stats in the test group are only for use in testing and shouldn't be used anywehre else.
     test_dependent = auto()  # a test that depends on test
 
+    # Enum hashes by name in python, which is slow for something looked up on every stat read.
+    # members are singletons, so identity hashing is equivalent.
+    __hash__ = object.__hash__
+
 
 # A "dependency" is a list of all kinds that a kind depends on.
 # ie: a rating stat depends on its base_rating.
@@ -60,9 +66,10 @@ BASE_DEPENDENCIES_TEST = {
     Kinds.test_dependent: [Kinds.test]
 }
 
-# recalculation order matters for stats which depend on other stats, so it's defined here.
-# Stats which share a Kind are recalculated in the order they are first created - usually the order they are
-# defined in stats.py
+# these list every valid kind for a playerbase. Recalculation order is worked out by the playerbase from the
+# stat dependency graph (see PlayerBase.get_stat_graph), so the order here doesn't matter - a stat is always
+# recalculated after every stat it depends on, and otherwise kinds go in base dependency order and stats which
+# share a Kind go in the order they are first created - usually the order they are defined in stats.py
 
 RECALCULATION_ORDER_GLOBAL = [
     Kinds.character,
@@ -103,7 +110,8 @@ class Stat:
             default=None,
             initial_function=None,
             value_function=None,
-            playerbase: PlayerBase = None
+            playerbase: PlayerBase = None,
+            initial_column_function=None
     ):
         self.name = name
 
@@ -122,13 +130,23 @@ class Stat:
         # floats in it later!!
         self.initial_function = initial_function
         self.value_function = value_function
+        # optional batch version of initial_function, f(playerbase, new_df); see calculate_initial_column
+        self.initial_column_function = initial_column_function
 
+        self.slot = None  # a small int index for this stat, assigned by the playerbase in add_stat
         self._linked_playerbase = playerbase
         playerbase.add_stat(self)
 
     def __getitem__(self, player_index: int):
         return self._linked_playerbase[player_index][self]
 
+    def get_dependencies(self) -> Optional[List['Stat']]:
+        """The stats this stat is calculated from, for the playerbase's stat dependency graph.
+
+        None means nothing was declared, so a dependent stat is assumed to read every stat of every kind its
+        own kind depends on."""
+        return None
+
     def calculate_initial(self, player_index):
         """Calculate the initial value for this based on its default value.
         Default can be function with parameters 'playerbase df' and 'cid'"""
@@ -137,6 +155,19 @@ class Stat:
         else:
             return self.default
 
+    def calculate_initial_column(self, new_df: pd.DataFrame) -> Iterable:
+        """Calculate the initial value for a batch of new players at once, for PlayerBase.create_players.
+
+        new_df holds the new players' rows (indexed by cid), which aren't in the playerbase dataframe yet,
+        with every stat rolled so far filled in. Falls back to initial_function once per player if there's no
+        initial_column_function."""
+        if self.initial_column_function is not None:
+            return self.initial_column_function(self._linked_playerbase, new_df)
+        elif self.initial_function is not None:
+            return [self.initial_function(self._linked_playerbase, cid) for cid in new_df.index]
+        else:
+            return [self.default] * len(new_df.index)
+
     def calculate_value(self, player_index):
         """Calculate the current value for this stat based on its current value"""
         if self.value_function is not None:
@@ -145,13 +176,22 @@ class Stat:
             logger.debug(f"abstract calculate_value called for {self}")
             return self._linked_playerbase.df.at[player_index, self]
 
+    def calculate_column(self) -> Iterable:
+        """Calculate the current value of this stat for every player in the playerbase at once,
+        in dataframe index order.
+
+        This is the slow fallback, which calls calculate_value once per player. Stats which can be
+        computed straight from dataframe columns should override this."""
+        return [self.calculate_value(cid) for cid in self._linked_playerbase.df.index]
+
     def abbreviate(self, abbreviation: str):
         """Add an abbreviation for this stat, making sure it's not clobbering an exsiting one."""
-        for stat in self._linked_playerbase.stats.values():
-            if stat.abbreviation == abbreviation:
-                raise KeyError(f"Duplicate Abbreviation {abbreviation}! "
-                               f"Collision between {stat.name} and {self.name}")
+        stat = self._linked_playerbase.get_stat_with_abbreviation(abbreviation)
+        if stat is not None:
+            raise KeyError(f"Duplicate Abbreviation {abbreviation}! "
+                           f"Collision between {stat.name} and {self.name}")
         self.abbreviation = abbreviation
+        self._linked_playerbase.reindex_stat(self)
 
     def weight(self, weight: "Weight", value: float):
         """Add this stat to a Weight"""
@@ -181,6 +221,13 @@ class Calculatable(Stat):
     """
     A Calculatable is any stat that depends on other stats for its value.
     For instance, a players Batting Average depends on Hits and At-Bats.
+
+    value_formula calculates a single player's value as f(playerbase, cid). column_formula is optional,
+    and calculates the whole column at once as f(playerbase) from the playerbase dataframe - if provided,
+    it's used by PlayerBase.recalculate_all instead of calling value_formula once per player.
+
+    dependencies lists the stats the formulas read. It's optional, but without it the stat goes stale
+    whenever anything of a kind it depends on changes.
     """
     def __init__(
             self,
@@ -188,14 +235,28 @@ class Calculatable(Stat):
             kind: Kinds,
             value_formula: Callable = None,
             playerbase: PlayerBase = None,
+            column_formula: Callable = None,
+            dependencies: Optional[List[Stat]] = None,
     ):
+        # set before adding the stat, since the playerbase may rebuild its stat graph as soon as it's added
+        self.dependencies = None if dependencies is None else list(dependencies)
         super().__init__(name, kind, -1.0, None, value_formula, playerbase)
+        self.column_formula = column_formula
 
         if len(self._linked_playerbase.df) > 0:
             # create default values
             initial_values = [self.calculate_initial(i) for i in self._linked_playerbase.df.index]
             self._linked_playerbase.df[name] = initial_values
 
+    def calculate_column(self) -> Iterable:
+        if self.column_formula is not None:
+            return self.column_formula(self._linked_playerbase)
+        else:
+            return super().calculate_column()
+
+    def get_dependencies(self) -> Optional[List[Stat]]:
+        return self.dependencies
+
 
 class Weight(Stat):
     """a Weight is a special stat meant to represent a weighted average of several other stats.
@@ -204,6 +265,10 @@ class Weight(Stat):
 
      Because it is created in advance, it starts stale; so the initial value is set to something
      obvious and breaking. Make sure it is recalculated prior to use.
+
+     The playerbase compiles every Weight of a Kind into a single WeightMatrix, so anything that changes
+     the weighting (add() or setting extra_weight) has to invalidate it - use those rather than editing
+     self.stats directly.
      """
     def __init__(
             self,
@@ -211,23 +276,53 @@ class Weight(Stat):
             kind: Kinds = Kinds.weight,
             playerbase: PlayerBase = None
     ):
+        # set before adding the stat, since the playerbase may rebuild its stat graph as soon as it's added
+        self.stats = {}
         super().__init__(name, kind, -1.0, None, None, playerbase)
 
-        self.stats = {}
-        self.extra_weight = 0
+        self._extra_weight = 0
+        self._compiled = None  # (stats, values, total weight), rebuilt by _compile()
+        self._linked_playerbase.add_weight(self)
+
+    @property
+    def extra_weight(self) -> float:
+        return self._extra_weight
+
+    @extra_weight.setter
+    def extra_weight(self, value: float):
+        self._extra_weight = value
+        self._invalidate()
 
     def add(self, stat: Stat, value: Union[float, int]):
         """Add a stat to the total weight.
-        To add extra weight, access the attribute directly."""
+        To add extra weight, set extra_weight."""
         self.stats[stat] = float(value)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._compiled = None
+        self._linked_playerbase.invalidate_weights(self.kind)
+
+    def get_dependencies(self) -> Optional[List[Stat]]:
+        return list(self.stats)
+
+    def _compile(self) -> Tuple[Tuple[Stat, ...], Tuple[float, ...], float]:
+        if self._compiled is None:
+            self._compiled = (
+                tuple(self.stats.keys()),
+                tuple(self.stats.values()),
+                sum(self.stats.values()) + self.extra_weight
+            )
+        return self._compiled
 
     def calculate_initial(self, player_index):
         logger.debug(f"Initial call for Weight {self.name} called!")
         return self.default
 
     def calculate_value(self, player_index):
-        weight = sum(self.stats.values()) + self.extra_weight
-        total = sum([self._linked_playerbase[player_index][stat] * self.stats[stat] for stat in self.stats])
+        stats, values, weight = self._compile()
+        player = self._linked_playerbase[player_index]
+        total = sum([player[stat] * value for stat, value in zip(stats, values)])
         if total == 0:
             return 0
         elif weight == 0:
@@ -235,6 +330,21 @@ class Weight(Stat):
         else:
             return total / weight
 
+    def calculate_column(self) -> np.ndarray:
+        """Calculates this weight for every player as a single matrix multiply of the
+        component stat columns against the weight values."""
+        stats, values, weight = self._compile()
+        df = self._linked_playerbase.df
+        if len(stats) == 0:
+            return np.zeros(len(df.index))
+
+        stat_columns = df[[stat.name for stat in stats]].to_numpy(dtype=float)
+        totals = stat_columns @ np.array(values)
+        if weight == 0:
+            return np.where(totals == 0, 0.0, self.default)
+        else:
+            return np.where(totals == 0, 0.0, totals / weight)
+
     def nice_string(self) -> str:
         nice = self.name + ":"
         for v, s in sorted(zip(self.stats.values(), self.stats.keys()), reverse=True, key=lambda x: x[0]):
@@ -263,10 +373,11 @@ class Descriptor(Stat):
     ):
         if default is None:
             default = f"{name.upper()}_DEFAULT"
-        super().__init__(name, kind, default, None, None, playerbase)
-
+        # set before adding the stat, since the playerbase may rebuild its stat graph as soon as it's added
         self.weights = {}
         self.all = None
+        super().__init__(name, kind, default, None, None, playerbase)
+
         self.secondary_threshold = 0.0  # what percentage of the primary stat the next biggest needs to be counted.
 
     def add_weight(
@@ -282,10 +393,25 @@ class Descriptor(Stat):
         -- these second layer dicts must either be strings or float-keyed dicts
         """
         self.weights[stat] = value
+        self._linked_playerbase.invalidate_stat_graph()
 
     def add_all(self, value: Union[str, Dict]):
         """Add an 'all stats' weight option"""
         self.all = value
+        self._linked_playerbase.invalidate_stat_graph()
+
+    def get_dependencies(self) -> Optional[List[Stat]]:
+        """Every stat used as a key anywhere in the (possibly nested) weights."""
+        dependencies = []
+        pending = [self.weights, self.all]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                for key, sub_value in value.items():
+                    if isinstance(key, Stat) and key not in dependencies:
+                        dependencies += [key]
+                    pending += [sub_value]
+        return dependencies
 
     @staticmethod
     def _parse_value_dict(value_dict: Dict[float, str], value: float) -> str:
@@ -425,8 +551,28 @@ class Rating(Stat):
             playerbase=playerbase
         )
 
-        self.personality = personality  # the personality stat that governs this stat (applies to ratings)
-        self.category = category  # the stat category this applies to
+        self._personality = personality  # the personality stat that governs this stat (applies to ratings)
+        self._category = category  # the stat category this applies to
+        self._linked_playerbase.reindex_stat(self)
+
+    # personality and category are often set after init, so these keep the playerbase's lookup indexes up to date
+    @property
+    def personality(self) -> Optional[Stat]:
+        return self._personality
+
+    @personality.setter
+    def personality(self, value: Optional[Stat]):
+        self._personality = value
+        self._linked_playerbase.reindex_stat(self)
+
+    @property
+    def category(self) -> Optional[Stat]:
+        return self._category
+
+    @category.setter
+    def category(self, value: Optional[Stat]):
+        self._category = value
+        self._linked_playerbase.reindex_stat(self)
 
     def calculate_initial(self, player_index):
         """
@@ -441,6 +587,13 @@ class Rating(Stat):
         else:
             return rand() * scale_factor
 
+    def calculate_initial_column(self, new_df: pd.DataFrame) -> np.ndarray:
+        """Rolls this stat for a batch of new players, using the personality values already rolled in new_df."""
+        personality_values = new_df[self.personality.name].to_numpy(dtype=float)
+        scale_factors = np.clip(personality_values, 0.5, 1.0)
+        rolls = rand(len(personality_values)) * scale_factors
+        return np.where(personality_values > 1, rolls + personality_values - 1, rolls)
+
     def calculate_value(self, player_index):
         """Modifiers are calculated and saved by the player class!"""
         return self._linked_playerbase.df.at[player_index, self]
@@ -471,11 +624,18 @@ def build_averaging(
         else:
             return total_stat[cid] / count_stat[cid]
 
+    def averaging_column(pb_):
+        counts = pb_.df[count_stat.name].to_numpy(dtype=float)
+        totals = pb_.df[total_stat.name].to_numpy(dtype=float)
+        return np.divide(totals, counts, out=np.zeros_like(totals), where=counts != 0)
+
     averaging_stat = Calculatable(
         average_stat_name,
         average_kind,
         averaging_function,
-        playerbase=playerbase
+        playerbase=playerbase,
+        column_formula=averaging_column,
+        dependencies=[count_stat, total_stat]
     )
 
     return averaging_stat, total_stat
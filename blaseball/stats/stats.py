@@ -12,12 +12,12 @@ little dangerous, and causes some issues in test, but we're commmited at this po
 Also be aware that actual logic for the stats classes is in statclasses.py.
 """
 
-import random
-from numpy.random import normal as numpy_normal
+import numpy as np
 import functools
 from decimal import Decimal
 
 from blaseball.stats import statclasses
+from blaseball.util import rng
 from data import playerdata, playerdescriptors
 
 
@@ -28,21 +28,29 @@ pb = statclasses.all_base
 def _generate_name(df, cid) -> str:
     """Creates a random name from the playerdata lists.
     Guaranteed to be great."""
-    first_name = random.choice(playerdata.PLAYER_FIRST_NAMES)
-    last_name = random.choice(playerdata.PLAYER_LAST_NAMES)
+    first_name = rng.choice(playerdata.PLAYER_FIRST_NAMES)
+    last_name = rng.choice(playerdata.PLAYER_LAST_NAMES)
     return f"{first_name} {last_name}".title()
 
 
-name = statclasses.Stat('name', statclasses.Kinds.character, "Wyatt Mason", _generate_name)
+def _generate_name_column(pb_, new_df) -> list:
+    first_names = rng.choice(playerdata.PLAYER_FIRST_NAMES, len(new_df.index))
+    last_names = rng.choice(playerdata.PLAYER_LAST_NAMES, len(new_df.index))
+    return [f"{first_name} {last_name}".title() for first_name, last_name in zip(first_names, last_names)]
+
+
+name = statclasses.Stat(
+    'name', statclasses.Kinds.character, "Wyatt Mason", _generate_name, initial_column_function=_generate_name_column
+)
 name.abbreviate("NAME")
 
 
 def _generate_number(df, cid) -> int:
     """dumb fun function to create a player number based partially on CID"""
-    unusual = random.random() < 0.10
+    unusual = rng.rand() < 0.10
 
-    low_thresh = max(random.randrange(-20, 20, 2), (-20 if unusual else 0))
-    high_thresh = random.randrange(45, random.randrange(50, (1000 if unusual else 100)))
+    low_thresh = max(rng.choice(range(-20, 20, 2)), (-20 if unusual else 0))
+    high_thresh = int(rng.integers(45, rng.integers(50, (1000 if unusual else 100))))
     base = cid % 100
 
     if (base < high_thresh) and (base > low_thresh) and not unusual:
@@ -53,7 +61,23 @@ def _generate_number(df, cid) -> int:
         return ones + tens
 
 
-number = statclasses.Stat('number', statclasses.Kinds.character, -100, _generate_number)
+def _generate_number_column(pb_, new_df) -> np.ndarray:
+    """_generate_number for a whole batch of players at once"""
+    player_count = len(new_df.index)
+    unusual = rng.rand(player_count) < 0.10
+
+    low_thresh = np.maximum(rng.choice(np.arange(-20, 20, 2), player_count), np.where(unusual, -20, 0))
+    high_thresh = rng.integers(45, rng.integers(50, np.where(unusual, 1000, 100)))
+    base = new_df.index.to_numpy() % 100
+
+    ones = base % 10
+    tens = (((base % high_thresh) + low_thresh) / 10).astype(int) * 10
+    return np.where((base < high_thresh) & (base > low_thresh) & ~unusual, base, ones + tens)
+
+
+number = statclasses.Stat(
+    'number', statclasses.Kinds.character, -100, _generate_number, initial_column_function=_generate_number_column
+)
 number.abbreviate("#")
 
 team = statclasses.Stat('team', statclasses.Kinds.character, "DETROIT DEFAULT")
@@ -64,14 +88,20 @@ team.abbreviate("TEAM")
 
 def _calculate_initial_personality(playerbase, player_index, source_stat):
     stat_modifier = playerbase.players[player_index].get_modifier_total(source_stat)
-    return random.random() + stat_modifier
+    return rng.rand() + stat_modifier
+
+
+def _calculate_initial_personality_column(playerbase, new_df, source_stat):
+    stat_modifiers = [playerbase.players[cid].get_modifier_total(source_stat) for cid in new_df.index]
+    return rng.rand(len(new_df.index)) + np.array(stat_modifiers, dtype=float)
 
 
 determination = statclasses.Stat(
     "determination",
     statclasses.Kinds.personality,
     1.0,
-    functools.partial(_calculate_initial_personality, source_stat="determination")
+    functools.partial(_calculate_initial_personality, source_stat="determination"),
+    initial_column_function=functools.partial(_calculate_initial_personality_column, source_stat="determination")
 )
 determination.abbreviate("DTR")
 
@@ -79,7 +109,8 @@ enthusiasm = statclasses.Stat(
     "enthusiasm",
     statclasses.Kinds.personality,
     1.0,
-    functools.partial(_calculate_initial_personality, source_stat="enthusiasm")
+    functools.partial(_calculate_initial_personality, source_stat="enthusiasm"),
+    initial_column_function=functools.partial(_calculate_initial_personality_column, source_stat="enthusiasm")
 )
 enthusiasm.abbreviate("ENT")
 
@@ -87,7 +118,8 @@ stability = statclasses.Stat(
     "stability",
     statclasses.Kinds.personality,
     1.0,
-    functools.partial(_calculate_initial_personality, source_stat="stability")
+    functools.partial(_calculate_initial_personality, source_stat="stability"),
+    initial_column_function=functools.partial(_calculate_initial_personality_column, source_stat="stability")
 )
 stability.abbreviate("STB")
 
@@ -95,7 +127,8 @@ insight = statclasses.Stat(
     "insight",
     statclasses.Kinds.personality,
     1.0,
-    functools.partial(_calculate_initial_personality, source_stat="insight")
+    functools.partial(_calculate_initial_personality, source_stat="insight"),
+    initial_column_function=functools.partial(_calculate_initial_personality_column, source_stat="insight")
 )
 insight.abbreviate("INS")
 
@@ -114,7 +147,12 @@ total_defense_fielding.display_name = "total defence - fielding"
 total_defense = statclasses.Calculatable(
     'total defense',
     statclasses.Kinds.total_weight,
-    value_formula=lambda df, cid: max(total_defense_pitching[cid], total_defense_fielding[cid])
+    value_formula=lambda df, cid: max(total_defense_pitching[cid], total_defense_fielding[cid]),
+    column_formula=lambda pb_: np.maximum(
+        pb_.df[total_defense_pitching.name].to_numpy(dtype=float),
+        pb_.df[total_defense_fielding.name].to_numpy(dtype=float)
+    ),
+    dependencies=[total_defense_pitching, total_defense_fielding]
 )
 
 total_defense.abbreviate("TDE")
@@ -444,18 +482,24 @@ fingers = statclasses.Stat('fingers', statclasses.Kinds.character, 9)
 
 
 def _roll_clutch(pb_, cid):
-    return random.random()
+    return rng.rand()
 
 
-clutch = statclasses.Stat('clutch', statclasses.Kinds.character, 0.2, initial_function=_roll_clutch)
+clutch = statclasses.Stat(
+    'clutch',
+    statclasses.Kinds.character,
+    0.2,
+    initial_function=_roll_clutch,
+    initial_column_function=lambda pb_, new_df: rng.rand(len(new_df.index))
+)
 clutch.abbreviate("CLT")
 
 
 def _roll_pull(pb_, cid):
-    handedness = random.choice([55, 55, 55, 45])
+    handedness = rng.choice([55, 55, 55, 45])
     temp_pull = -1
     while 0 < temp_pull < 90:
-        temp_pull = numpy_normal(handedness, 10)
+        temp_pull = rng.normal(handedness, 10)
     return temp_pull
 
 
@@ -481,7 +525,15 @@ def calc_at_bats(df, cid):
     return plate_appearances[cid] - (walks[cid] + sacrifice_hits[cid] + hit_by_pitch[cid])
 
 
-at_bats = statclasses.Calculatable('at bats', statclasses.Kinds.derived, calc_at_bats)
+def calc_at_bats_column(pb_):
+    df = pb_.df
+    return df[plate_appearances.name] - (df[walks.name] + df[sacrifice_hits.name] + df[hit_by_pitch.name])
+
+
+at_bats = statclasses.Calculatable(
+    'at bats', statclasses.Kinds.derived, calc_at_bats, column_formula=calc_at_bats_column,
+    dependencies=[plate_appearances, walks, sacrifice_hits, hit_by_pitch]
+)
 at_bats.display_name = 'at-bats'
 
 
@@ -519,7 +571,14 @@ total_hits = statclasses.Stat('total hits', statclasses.Kinds.performance, 0)
 hit_rate = statclasses.Calculatable(
     "hit rate not BA",
     statclasses.Kinds.averaging,
-    value_formula=lambda df, cid: total_hits[cid] / pitches_seen[cid] if pitches_seen[cid] > 0 else 0
+    value_formula=lambda df, cid: total_hits[cid] / pitches_seen[cid] if pitches_seen[cid] > 0 else 0,
+    column_formula=lambda pb_: np.divide(
+        pb_.df[total_hits.name].to_numpy(dtype=float),
+        pb_.df[pitches_seen.name].to_numpy(dtype=float),
+        out=np.zeros(len(pb_.df.index)),
+        where=pb_.df[pitches_seen.name].to_numpy(dtype=float) > 0
+    ),
+    dependencies=[total_hits, pitches_seen]
 )
 
 strike_rate, total_strikes_against = statclasses.build_averaging(
@@ -48,14 +48,10 @@ class League(Sequence):
     """
     def __init__(self, pb: playerbase.PlayerBase, team_names: [str] = None) -> None:
         self.teams = []
-        for team_name in team_names:
-            team_comp = []
-            for __ in range(Settings.players_per_team):
-                new_player = players.Player(pb)
-                new_player.initialize()
-                team_comp += [new_player]
+        new_players = pb.create_players(len(team_names) * Settings.players_per_team)
+        for i, team_name in enumerate(team_names):
+            team_comp = new_players[i * Settings.players_per_team:(i + 1) * Settings.players_per_team]
             self.teams += [Team(team_name, team_comp)]
-        pb.recalculate_all()
 
     def __len__(self) -> int:
         return len(self.teams)
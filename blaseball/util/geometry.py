@@ -1,28 +1,29 @@
 """
-We were using sympy for geometry handling, but there were too many quirks - so we're switching to Shapely.
-Luckily, we were already wrapping Sympy, so shapely just has to drop in here.
+We were using sympy for geometry handling, but there were too many quirks - so we switched to Shapely.
 
-It probably would make more sense to use shapely objects directly, or inherit directly, but
-we can deal with that later.
+Coords used to be shapely Points, but every one of those is a GEOS geometry - and a ball in play makes dozens of
+them, checking distances to fielders and bases. So now a Coord is just a pair of floats with the arithmetic done in
+python, and shapely only comes in for actual shapes (like a stadium's field): use to_point to hand a Coord over.
 """
 
-from typing import List
-from shapely.geometry import Point, Polygon, LineString
+from typing import List, Tuple
+from shapely.geometry import Point, Polygon
 import math
 
 DEGSY = u'\N{DEGREE SIGN}'
 
 
-class Coord(Point):  # noqa - we don't really care about the abstract methods here.
+class Coord:
+    __slots__ = ('x', 'y')
+
     def __init__(self, a, b, polar=False):
         """Create a new coordinate; a = x and b = y if polar is false, else a = radius and b = degrees"""
         if polar:
-            x = a * math.cos(math.radians(b))
-            y = a * math.sin(math.radians(b))
+            self.x = a * math.cos(math.radians(b))
+            self.y = a * math.sin(math.radians(b))
         else:
-            x = a
-            y = b
-        super().__init__(x, y)
+            self.x = a
+            self.y = b
 
     def theta(self):
         if self.x == 0:
@@ -35,11 +36,36 @@ class Coord(Point):  # noqa - we don't really care about the abstract methods he
         else:
             return math.degrees(math.atan(self.y / self.x))
 
+    def distance(self, other: "Coord") -> float:
+        return math.hypot(other.x - self.x, other.y - self.y)
+
     def move_towards(self, location: "Coord", distance: float) -> "Coord":
         """Returns a coord that's equal to this point moved distance towards another point.
-        Can move past the other point."""
-        line = LineString([self, location])
-        return line.interpolate(distance)
+        Stops at the other point; a negative distance counts back from the other point instead."""
+        length = self.distance(location)
+        if distance < 0:
+            distance += length
+        if length == 0 or distance <= 0:
+            return Coord(self.x, self.y)
+        if distance >= length:
+            return Coord(location.x, location.y)
+        ratio = distance / length
+        return Coord(self.x + (location.x - self.x) * ratio, self.y + (location.y - self.y) * ratio)
+
+    def to_tuple(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+    def to_point(self) -> Point:
+        """This coord as a shapely Point, for checking against shapely shapes."""
+        return Point(self.x, self.y)
+
+    def __eq__(self, other):
+        if not isinstance(other, Coord):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
 
     def __bool__(self):
         return self.x != 0 or self.y != 0
@@ -51,6 +77,11 @@ class Coord(Point):  # noqa - we don't really care about the abstract methods he
         return F"<Coords(x: {self.x:.3f} y: {self.y:.3f}) θ: {self.theta():.1f}{DEGSY}>"
 
 
+def to_polygon(points: List[Coord]) -> Polygon:
+    """Build a shapely polygon from a list of coords."""
+    return Polygon([point.to_tuple() for point in points])
+
+
 if __name__ == "__main__":
     p1 = Coord(0, 0)
     print(p1)
@@ -61,5 +92,5 @@ if __name__ == "__main__":
     p3 = Coord(60.5, 45, True)
     print(p3)
 
-    pg = Polygon([p1, p2, p3])
+    pg = to_polygon([p1, p2, p3])
     print(f"Area: {pg.area} and perimeter: {pg.length}")
@@ -40,14 +40,28 @@ what you want.
 
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
-import inspect
+import sys
+from time import perf_counter
 from loguru import logger
 
 from typing import Callable, Union, List, Type, Optional
 
 
+class QueueMetrics:
+    """Running totals for a messenger's event queue, to spot feeds that queue far more than they should."""
+    def __init__(self):
+        self.messages = 0  # everything ever queued
+        self.peak_depth = 0  # the most messages waiting at once
+        self.drains = 0  # times the queue was emptied
+        self.drain_time = 0.0  # seconds spent emptying it, including everything the messages set off
+
+    def __str__(self):
+        return (f"{self.messages} queued messages, peak depth {self.peak_depth}, "
+                f"{self.drains} drains taking {self.drain_time * 1000:.1f} ms")
+
+
 class Messenger:
     """A go-between for many-to-many communication between parts of the program.
 
@@ -58,10 +72,13 @@ class Messenger:
     """
     running_id = 1
 
-    def __init__(self):
+    def __init__(self, max_queue_depth: int = None):
         """
         Creates an empty messenger. Because most of the configuration occurs on subscribe, an
         empty messenger isn't different from another empty messenger.
+
+        If max_queue_depth is set, queueing a message when that many are already waiting raises a
+        QueueOverflowError instead - usually a sign that some listener is queueing itself in a loop.
         """
         # listeners is a dictionary of list of tuples:
         """
@@ -71,7 +88,15 @@ class Messenger:
         }
         """
         self.listeners = defaultdict(list)
-        self._queue = []
+        # the functions to call for a tag, or a tuple of tags, in the order to call them. Built on first send
+        # and thrown out whenever subscriptions change, so send doesn't have to sort or dedupe anything.
+        self._dispatch = {}
+        self._queue = deque()
+        self.max_queue_depth = max_queue_depth
+        self.queue_metrics = QueueMetrics()
+        # listener exceptions are logged and swallowed by send, so count them here for anyone who needs to know
+        self.listener_errors = 0
+        self.last_listener_error = None
         self._broadcasting = False
         self.id = Messenger.running_id
         Messenger.running_id += 1
@@ -86,6 +111,7 @@ class Messenger:
                 raise ValueError(f"Function '{function}' already subscribed to tag {tag}!")
             self.listeners[tag] += [(priority, function)]
             self.listeners[tag].sort(key=lambda x: x[0], reverse=True)
+        self._dispatch.clear()
 
     def unsubscribe(self, function: Callable, tags: Union[Enum, List[Enum]] = "") -> None:
         """Unsubscribe the function from the tags."""
@@ -96,6 +122,7 @@ class Messenger:
             for priority_tuple in self.listeners[tag]:
                 if priority_tuple[1] == function:
                     self.listeners[tag].remove(priority_tuple)
+        self._dispatch.clear()
 
     def queue(self, argument=None, tags: Union[Enum, List[Enum]] = "", execute: bool = True) -> None:
         """
@@ -107,54 +134,89 @@ class Messenger:
         Where send() is fire-and-forget, to be used when you don't care what happens, queue is used
         to preserve execution order.
         """
-        self._queue += [(argument, tags)]
+        pending = self._queue
+        metrics = self.queue_metrics
+        if self.max_queue_depth is not None and len(pending) >= self.max_queue_depth:
+            raise QueueOverflowError(f"{len(pending)} messages already queued on {self!r}, "
+                                     f"dropping {argument} on tags '{tag_string(as_tag_list(tags))}'")
+        pending.append((argument, tags))
+        metrics.messages += 1
+        if len(pending) > metrics.peak_depth:
+            metrics.peak_depth = len(pending)
 
         if self._broadcasting or not execute:
             return
 
         self._broadcasting = True
-        while len(self._queue) > 0:
-            self.send(*self._queue.pop(0))
-        self._broadcasting = False
+        start = perf_counter()
+        try:
+            popleft = pending.popleft
+            send = self.send
+            while pending:
+                send(*popleft())
+        except BaseException:
+            # whatever's left was queued behind a message that blew up - don't leave it for the next caller
+            pending.clear()
+            raise
+        finally:
+            self._broadcasting = False
+            metrics.drains += 1
+            metrics.drain_time += perf_counter() - start
 
     def send(self, argument=None, tags: Union[Enum, List[Enum]] = ""):
         """Send argument to all listeners subscribed on tags.
         One final reminder that this basically acts as a distributed function call - read the docs
         in messenger for several concerns.
         """
-        sent = set()
-
-        if tags == "":
+        key = tuple(tags) if isinstance(tags, list) else tags
+        recipients = self._dispatch.get(key)
+        if recipients is None:
+            recipients = self._compile_dispatch(key, argument)
+
+        for recipient in recipients:
+            try:
+                if argument is None:
+                    recipient()
+                else:
+                    recipient(argument)
+            except Exception as err:
+                # a bare exception is a dangerous thing, but in this case we genuinely
+                # want messenger to be a "firewall"
+                if isinstance(err, (BreakerError, QueueOverflowError)):
+                    raise
+                self.listener_errors += 1
+                self.last_listener_error = err
+
+                caller = sys._getframe(1)  # messenger.send(), caller
+                logger.exception(f"{type(err).__name__}: {str(err)}. "
+                                 f"Exception raised while processing tags '{tag_string(as_tag_list(tags))}' "
+                                 f"from function {caller.f_code.co_name}")
+
+    def has_listeners(self, tags: Union[Enum, List[Enum]]) -> bool:
+        """True if a message sent on tags would reach anyone. Use this to skip building messages
+        nobody is going to read."""
+        key = tuple(tags) if isinstance(tags, list) else tags
+        recipients = self._dispatch.get(key)
+        if recipients is None:
+            recipients = self._compile_dispatch(key, None)
+        return len(recipients) > 0
+
+    def _compile_dispatch(self, key, argument) -> tuple:
+        """Work out who gets a message sent on key (a tag, or a tuple of tags) and cache it: every listener on
+        each tag in order, by priority, and only once even if they're subscribed to more than one of the tags."""
+        if key == "":
             if len(self.listeners) > 1 or "" not in self.listeners:
                 raise KeyError(f"Tag required for messenger with tagged subscribers. "
                                f"Received argument: {argument} of type {type(argument)}")
 
-        if not isinstance(tags, list):
-            tags = [tags]
-
-        for tag in tags:
+        recipients = {}
+        for tag in (key if isinstance(key, tuple) else [key]):
             if tag in self.listeners:
-                recipients = [priority_tuple[1] for priority_tuple in self.listeners[tag]]
-                for recipient in recipients:
-                    if recipient not in sent:
-                        try:
-                            if argument is None:
-                                recipient()
-                            else:
-                                recipient(argument)
-                        except Exception as err:
-                            # a bare exception is a dangerous thing, but in this case we genuinely
-                            # want messenger to be a "firewall"
-                            if isinstance(err, BreakerError):
-                                raise
-
-                            caller = inspect.stack()[1]  # respond(), messenger.send(), caller
-                            logger.exception(f"{type(err).__name__}: {str(err)}. "
-                                             f"Exception raised while processing tags '{tag_string(tags)}' "
-                                             f"from function {caller.function}")
-                        finally:
-                            sent.add(recipient)
-
+                for priority_tuple in self.listeners[tag]:
+                    recipients.setdefault(priority_tuple[1])
+        recipients = tuple(recipients)
+        self._dispatch[key] = recipients
+        return recipients
 
     def __str__(self):
         total_listeners = sum([len(self.listeners[key]) for key in self.listeners])
@@ -164,6 +226,10 @@ class Messenger:
         return f"<Messenger ID {self.id}>"
 
 
+def as_tag_list(tags: Union[Enum, List[Enum]]) -> List[Enum]:
+    return tags if isinstance(tags, list) else [tags]
+
+
 def tag_string(tags: List[Optional[Enum]]):
     if tags[0] is None:
         return ""
@@ -180,13 +246,35 @@ class Listener:
         pass
 
 
+class CallerInfo:
+    """Where a message came from: a cheap stand-in for inspect's FrameInfo, which reads source files off disk
+    for the whole stack. This keeps the caller's code object but not the frame, so it doesn't keep all of the
+    caller's locals alive - anything else is looked up when asked for."""
+    __slots__ = ['code', 'lineno']
+
+    def __init__(self, frame):
+        self.code = frame.f_code
+        self.lineno = frame.f_lineno
+
+    @property
+    def function(self) -> str:
+        return self.code.co_name
+
+    @property
+    def filename(self) -> str:
+        return self.code.co_filename
+
+    def __repr__(self):
+        return f"CallerInfo({self.function}, {self.filename}:{self.lineno})"
+
+
 class ReceivedArgument:
     """I can't believe I'm doing this, but it's basically a namedtuple with a str method"""
     def __init__(self, argument=None):
-        callers = inspect.stack()[2:4]  # respond(), messenger.send(), caller
+        sender = sys._getframe(2)  # respond(), messenger.send(), caller
         self.argument = argument
-        self.tags = callers[0].frame.f_locals['tags']
-        self.great_grand_caller = callers[1]
+        self.tags = as_tag_list(sender.f_locals['tags'])
+        self.great_grand_caller = CallerInfo(sender.f_back)
 
     def __str__(self):
         return f"[{tag_string(self.tags)}] {self.great_grand_caller.function}: {self.argument}"
@@ -209,6 +297,12 @@ class BreakerError(TypeError):
     pass
 
 
+class QueueOverflowError(RuntimeError):
+    """Raised when a messenger's queue goes past its max_queue_depth.
+    Like BreakerError, this gets through messenger's firewall instead of being logged and ignored."""
+    pass
+
+
 class CircuitBreaker(Listener):
     def __init__(self, messenger: Messenger, tags: Union[Enum, List[Enum]], types: Union[Type, List[Type]]):
         if not isinstance(types, list):
@@ -8,7 +8,7 @@ from blaseball.playball import gamestate
 from blaseball.util import messenger
 from data import teamdata
 
-from random import shuffle
+from blaseball.util.rng import shuffle
 
 
 team_names = teamdata.TEAMS_99
@@ -0,0 +1,248 @@
+"""
+All of the game's randomness is drawn through here, so that a game (or a freshly generated league) can be played
+back exactly from a seed.
+
+Rolls come from whichever RandomStream is active, not numpy or python's global random state. Out of the box
+that's one unseeded stream for the whole process; seed() replaces it, and using() swaps another one in for a
+while - this is how a BallGame keeps its own stream, so games don't share random state with each other or with
+whatever else is running in the process.
+
+A single numpy call costs about a microsecond however many numbers it draws, and a pitch rolls a dozen or so
+one at a time. So a RandomStream draws uniforms and normals from its numpy Generator in blocks, and hands them
+out one at a time until the block runs out. Arrays of rolls (as used in player generation) still go straight
+to the generator.
+
+Rolls that only colour the game feed, like the speed a pitch is announced at, come from a stream's flavour stream
+instead. It's spun up the first time anything reads feed text, so a game rolls the same whether or not anyone is
+watching, and headless games never draw them at all.
+
+Modules that roll should import the functions they need directly:
+    from blaseball.util.rng import normal, rand
+so tests can keep patching blaseball.playball.hitting.rand and friends module by module. The functions mirror
+the numpy.random ones they replace.
+"""
+
+from contextlib import contextmanager
+from math import inf, nan
+from statistics import NormalDist
+
+import numpy as np
+from numpy.random import Generator, SeedSequence
+
+from typing import Iterator, List, Sequence
+
+
+BLOCK_SIZE = 1024  # rolls drawn at a time
+
+
+class RandomStream:
+    """A numpy Generator, plus blocks of uniform and standard normal rolls drawn from it ahead of time."""
+    def __init__(self, generator: Generator = None, block_size: int = BLOCK_SIZE, flavour: Generator = None):
+        if generator is None:
+            generator = np.random.default_rng()
+        self.generator = generator
+        self.block_size = block_size
+        self._uniforms = iter(())
+        self._normals = iter(())
+        self._flavour_generator = flavour  # unseeded if not given
+        self._flavour = None
+
+    @property
+    def flavour(self) -> 'RandomStream':
+        """The stream for rolls that only go into feed text, set up the first time it's asked for."""
+        if self._flavour is None:
+            self._flavour = RandomStream(self._flavour_generator, self.block_size)
+        return self._flavour
+
+    def uniform(self) -> float:
+        """The next roll in [0, 1)"""
+        roll = next(self._uniforms, None)
+        if roll is None:
+            self._uniforms = iter(self.generator.random(self.block_size).tolist())
+            roll = next(self._uniforms)
+        return roll
+
+    def standard_normal(self) -> float:
+        """The next roll from a normal distribution with mean 0 and standard deviation 1"""
+        roll = next(self._normals, None)
+        if roll is None:
+            self._normals = iter(self.generator.standard_normal(self.block_size).tolist())
+            roll = next(self._normals)
+        return roll
+
+
+_active = RandomStream()
+
+
+def get_stream() -> RandomStream:
+    """The stream rolls are currently drawn from."""
+    return _active
+
+
+def get_generator() -> Generator:
+    """The numpy generator behind the active stream."""
+    return _active.generator
+
+
+def set_stream(stream: RandomStream) -> RandomStream:
+    """Draw all rolls from stream from now on. Returns the stream that was active before."""
+    global _active
+    previous = _active
+    _active = stream
+    return previous
+
+
+@contextmanager
+def using(stream: RandomStream) -> Iterator[RandomStream]:
+    """Draw rolls from stream for the duration of a with block, then switch back."""
+    previous = set_stream(stream)
+    try:
+        yield stream
+    finally:
+        set_stream(previous)
+
+
+def seed(seed_value: int) -> None:
+    """Replace the active stream with a fresh one seeded from seed_value."""
+    set_stream(RandomStream(np.random.default_rng(seed_value), flavour=spawn(seed_value, 1)[0]))
+
+
+def spawn(seed_value: int, count: int) -> List[Generator]:
+    """Build count independent generators from one seed, such as one for each game in a schedule.
+    The same seed and count always give the same generators."""
+    return [np.random.default_rng(child) for child in SeedSequence(seed_value).spawn(count)]
+
+
+def spawn_seeds(seed_value: int, count: int) -> List[int]:
+    """Like spawn, but hand back plain integer seeds - handy when the generators have to be built somewhere
+    else, like a worker process."""
+    return [int(child.generate_state(1)[0]) for child in SeedSequence(seed_value).spawn(count)]
+
+
+def rand(*shape: int):
+    """A uniform roll in [0, 1); with a shape, an array of them (as numpy.random.rand)"""
+    if shape:
+        return _active.generator.random(shape)
+    return _active.uniform()
+
+
+def normal(loc=0.0, scale=1.0, size=None):
+    """A roll from a normal distribution (as numpy.random.normal)"""
+    if size is not None:
+        return _active.generator.normal(loc, scale, size)
+    if scale < 0:
+        raise ValueError("scale < 0")
+    return loc + scale * _active.standard_normal()
+
+
+def integers(low, high=None, size=None):
+    """Random integers in [low, high), or [0, low) if high is None (as numpy.random.randint)"""
+    return _active.generator.integers(low, high, size)
+
+
+def choice(options: Sequence, size: int = None):
+    """Pick an item from options - or, with a size, an array of size items (as numpy.random.choice).
+    Single picks keep the item's own type instead of converting it to a numpy scalar."""
+    if size is None:
+        return options[int(_active.generator.integers(len(options)))]
+    return np.asarray(options)[_active.generator.integers(len(options), size=size)]
+
+
+def shuffle(items: list) -> None:
+    """Shuffle a list in place."""
+    _active.generator.shuffle(items)
+
+
+_standard_normal_inv_cdf = NormalDist().inv_cdf
+
+
+def _inverse_normal_cdf(p: float) -> float:
+    if 0 < p < 1:
+        return _standard_normal_inv_cdf(p)
+    if p == 0:
+        return -inf
+    if p == 1:
+        return inf
+    return nan
+
+
+# The same rational approximation NormalDist.inv_cdf uses (Wichura's AS241), highest power first, for working
+# through whole arrays at once: one pair of polynomials for the middle of the distribution, and two for the tails.
+_CENTRAL_NUMERATOR = (
+    2.5090809287301226727e+3, 3.3430575583588128105e+4, 6.7265770927008700853e+4, 4.5921953931549871457e+4,
+    1.3731693765509461125e+4, 1.9715909503065514427e+3, 1.3314166789178437745e+2, 3.3871328727963666080e+0
+)
+_CENTRAL_DENOMINATOR = (
+    5.2264952788528545610e+3, 2.8729085735721942674e+4, 3.9307895800092710610e+4, 2.1213794301586595867e+4,
+    5.3941960214247511077e+3, 6.8718700749205790830e+2, 4.2313330701600911252e+1, 1.0
+)
+_NEAR_TAIL_NUMERATOR = (
+    7.74545014278341407640e-4, 2.27238449892691845833e-2, 2.41780725177450611770e-1, 1.27045825245236838258e+0,
+    3.64784832476320460504e+0, 5.76949722146069140550e+0, 4.63033784615654529590e+0, 1.42343711074968357734e+0
+)
+_NEAR_TAIL_DENOMINATOR = (
+    1.05075007164441684324e-9, 5.47593808499534494600e-4, 1.51986665636164571966e-2, 1.48103976427480074590e-1,
+    6.89767334985100004550e-1, 1.67638483018380384940e+0, 2.05319162663775882187e+0, 1.0
+)
+_FAR_TAIL_NUMERATOR = (
+    2.01033439929228813265e-7, 2.71155556874348757815e-5, 1.24266094738807843860e-3, 2.65321895265761230930e-2,
+    2.96560571828504891230e-1, 1.78482653991729133580e+0, 5.46378491116411436990e+0, 6.65790464350110377720e+0
+)
+_FAR_TAIL_DENOMINATOR = (
+    2.04426310338993978564e-15, 1.42151175831644588870e-7, 1.84631831751005468180e-5, 7.86869131145613259100e-4,
+    1.48753612908506148525e-2, 1.36929880922735805310e-1, 5.99832206555887937690e-1, 1.0
+)
+
+
+SMALL_ARRAY = 256  # arrays shorter than this are quicker through the scalar version
+
+
+def _polynomial(coefficients: Sequence[float], x: np.ndarray) -> np.ndarray:
+    total = coefficients[0] * x + coefficients[1]
+    for coefficient in coefficients[2:]:
+        total = total * x + coefficient
+    return total
+
+
+def _inverse_normal_cdf_array(p) -> np.ndarray:
+    p = np.asarray(p, dtype=float)
+    q = p - 0.5
+    r = 0.180625 - q * q
+    x = _polynomial(_CENTRAL_NUMERATOR, r) * q / _polynomial(_CENTRAL_DENOMINATOR, r)
+
+    tails = ~(np.abs(q) <= 0.425)
+    if tails.any():
+        tail_p = p[tails]
+        tail_q = q[tails]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.sqrt(-np.log(np.where(tail_q <= 0, tail_p, 1 - tail_p)))
+            near = r - 1.6
+            far = r - 5.0
+            tail_x = np.where(
+                r <= 5.0,
+                _polynomial(_NEAR_TAIL_NUMERATOR, near) / _polynomial(_NEAR_TAIL_DENOMINATOR, near),
+                _polynomial(_FAR_TAIL_NUMERATOR, far) / _polynomial(_FAR_TAIL_DENOMINATOR, far)
+            )
+        tail_x = np.where(tail_q < 0, -tail_x, tail_x)
+        tail_x[tail_p == 0] = -inf
+        tail_x[tail_p == 1] = inf
+        tail_x[~((tail_p >= 0) & (tail_p <= 1))] = nan
+        x[tails] = tail_x
+    return x
+
+
+def inverse_normal_cdf(p):
+    """The z-score that a fraction p of a standard normal distribution falls below (as scipy.stats.norm.ppf,
+    including -inf/inf at 0 and 1 and nan outside them). Takes a float or an array of them.
+
+    This is python's own NormalDist.inv_cdf - Wichura's rational approximation, good to about 1e-15 - which
+    costs a tenth of a microsecond to scipy's hundred or so, and doesn't need scipy imported at all. Arrays go
+    through the same approximation in numpy, a polynomial at a time over the whole array."""
+    if isinstance(p, (np.ndarray, list, tuple)):
+        p = np.asarray(p, dtype=float)
+        if p.size < SMALL_ARRAY:
+            # each numpy step costs about a microsecond however short the array, so a handful of values is
+            # quicker one at a time
+            return np.array([_inverse_normal_cdf(x) for x in p.ravel().tolist()]).reshape(p.shape)
+        return _inverse_normal_cdf_array(p)
+    return _inverse_normal_cdf(p)
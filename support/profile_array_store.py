@@ -0,0 +1,29 @@
+"""Compares per-player memory and stat read speed for the default dict caches vs PlayerBase.use_array_store().
+Each run builds its league in a fresh process, since the array store can't be switched off again."""
+import subprocess
+import sys
+
+RUN = """
+import tracemalloc
+from timeit import timeit
+from loguru import logger
+logger.remove()
+from blaseball.stats import stats as s
+
+if {array}:
+    s.pb.use_array_store()
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+new_players = s.pb.create_players({count})
+after = tracemalloc.take_snapshot()
+used = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+tracemalloc.stop()
+
+player = new_players[0]
+reads = timeit(lambda: player[s.power], number=100000) / 100000
+print(f"{{'array' if {array} else 'dict ':5}} store: {{used / {count} / 1024:.1f}} KiB per player "
+      f"(dataframe included), {{reads * 1e9:.0f}} ns per stat read")
+"""
+
+for array in [False, True]:
+    subprocess.run([sys.executable, "-c", RUN.format(array=array, count=5000)], check=True)
@@ -0,0 +1,95 @@
+import cProfile
+import pstats
+from timeit import timeit
+
+import numpy as np
+from loguru import logger
+
+from blaseball.util import rng
+from blaseball.stats import modifiers
+
+logger.remove()
+
+# quickteams builds its league on import, so seed first to get the same players every run
+rng.seed(383)
+modifiers.default_personality_deck.shuffle()
+
+from blaseball.playball.basepaths import Basepaths  # noqa: E402
+from blaseball.playball.inplay import FieldBall  # noqa: E402
+from blaseball.playball.liveball import LiveBall, LiveBallBatch  # noqa: E402
+from blaseball.util import quickteams  # noqa: E402
+from blaseball.util.geometry import Coord  # noqa: E402
+
+g = quickteams.game_state
+
+# a spread of balls across the whole field: grounders, line drives, pop ups and fly balls, fair and foul
+balls = [
+    LiveBall(launch_angle, field_angle, speed)
+    for launch_angle in (-10, 10, 25, 40, 70)
+    for field_angle in (-5, 15, 45, 75, 95)
+    for speed in (60, 90, 120)
+]
+basepaths = Basepaths(g.stadium)
+batter = g.batter()
+defense = g.defense().defense
+pitcher = g.defense()['pitcher']
+catcher = g.defense()['catcher']
+
+
+def ball_in_play(ball: LiveBall):
+    """What PitchManager and HitBall do with a ball once it's hit."""
+    landing = ball.ground_location()
+    if g.stadium.check_foul(landing) or g.stadium.check_home_run(landing)[0]:
+        return None
+    basepaths.reset_all(pitcher, catcher)
+    return FieldBall(batter, defense, ball, basepaths)
+
+
+def all_balls():
+    for ball in balls:
+        ball_in_play(ball)
+
+
+ROUNDS = 40
+duration = timeit(all_balls, number=ROUNDS) / (ROUNDS * len(balls))
+print(f"ball in play: {duration * 1e6:.1f} us each ({1 / duration:,.0f} balls/s)")
+
+COORDS = 200000
+a, b = Coord(30, 40), Coord(200, 150)
+print(f"Coord(): {timeit(lambda: Coord(3, 4), number=COORDS) / COORDS * 1e6:.3f} us, "
+      f"distance(): {timeit(lambda: a.distance(b), number=COORDS) / COORDS * 1e6:.3f} us, "
+      f"move_towards(): {timeit(lambda: a.move_towards(b, 10), number=COORDS) / COORDS * 1e6:.3f} us")
+
+landings = [ball.ground_location() for ball in balls]
+landing_x = np.array([landing.x for landing in landings] * 100)
+landing_y = np.array([landing.y for landing in landings] * 100)
+CHECKS = 100
+home_run_time = timeit(lambda: [g.stadium.check_home_run(landing) for landing in landings], number=CHECKS)
+home_run_time /= CHECKS * len(landings)
+batch_time = timeit(lambda: g.stadium.check_home_runs(landing_x, landing_y), number=CHECKS) / (CHECKS * len(landing_x))
+print(f"check_home_run(): {home_run_time * 1e6:.3f} us, check_home_runs(): {batch_time * 1e6:.3f} us per landing")
+
+BATCH = 100000
+generator = np.random.default_rng(383)
+launch_angles = generator.uniform(-30, 80, BATCH)
+field_angles = generator.uniform(-10, 100, BATCH)
+speeds = generator.uniform(40, 130, BATCH)
+batch_time = timeit(lambda: LiveBallBatch(launch_angles, field_angles, speeds).classify(g.stadium), number=5)
+single_time = timeit(
+    lambda: [g.stadium.check_home_run(LiveBall(*ball).ground_location()) for ball in
+             zip(launch_angles[:1000], field_angles[:1000], speeds[:1000])],
+    number=5
+)
+print(f"LiveBall + check_home_run: {single_time / 5000 * 1e6:.3f} us, "
+      f"LiveBallBatch + classify: {batch_time / (5 * BATCH) * 1e6:.3f} us per ball")
+
+profiler = cProfile.Profile()
+profiler.enable()
+
+for __ in range(10):
+    all_balls()
+
+profiler.disable()
+stats = pstats.Stats(profiler).sort_stats('tottime')
+
+stats.print_stats(15)
@@ -0,0 +1,37 @@
+import cProfile
+import pstats
+from timeit import timeit
+
+from loguru import logger
+
+from blaseball.stats import stats as s
+from blaseball.stats.players import Player
+
+logger.remove()
+
+
+def one_at_a_time(count):
+    for __ in range(count):
+        new_player = Player(s.pb)
+        new_player.initialize()
+    s.pb.recalculate_all()
+
+
+for count in [100, 1000]:
+    s.pb.clear_players()
+    single = timeit(lambda: one_at_a_time(count), number=1)
+    s.pb.clear_players()
+    batch = timeit(lambda: s.pb.create_players(count), number=1)
+    print(f"{count} players: one at a time {single * 1000:.0f} ms, create_players {batch * 1000:.0f} ms "
+          f"({single / batch:.1f}x)")
+
+s.pb.clear_players()
+profiler = cProfile.Profile()
+profiler.enable()
+
+s.pb.create_players(1000)
+
+profiler.disable()
+stats = pstats.Stats(profiler).sort_stats('tottime')
+
+stats.print_stats(20)
@@ -1,20 +1,46 @@
 import cProfile
 import pstats
+from timeit import timeit
 
-from blaseball.playball.pitching import Pitch
-from blaseball.util import quickteams
+from loguru import logger
+from scipy.stats import norm
+
+from blaseball.playball.pitching import build_pitch
+from blaseball.playball.hitting import build_swing
+from blaseball.util import quickteams, rng
+
+logger.remove()
 
 g = quickteams.game_state
-m = quickteams.messenger
-pitcher = g.defense()['pitcher']
-catcher = g.defense()['catcher']
+rng.seed(383)
+
+
+def pitch_and_swing():
+    pitch = build_pitch(g)
+    return build_swing(g, pitch)
+
+
+PITCHES = 20000
+duration = timeit(pitch_and_swing, number=PITCHES)
+print(f"pitch + swing: {PITCHES / duration:,.0f} pitches/s ({duration / PITCHES * 1e6:.1f} us each)")
+
+ROLLS = 200000
+rand_time = timeit(rng.rand, number=ROLLS) / ROLLS
+normal_time = timeit(lambda: rng.normal(1, 2), number=ROLLS) / ROLLS
+print(f"rand(): {rand_time * 1e6:.3f} us, normal(): {normal_time * 1e6:.3f} us")
+
+PPFS = 2000
+scipy_time = timeit(lambda: norm.ppf(0.63), number=PPFS) / PPFS
+inverse_time = timeit(lambda: rng.inverse_normal_cdf(0.63), number=PPFS) / PPFS
+print(f"scipy norm.ppf: {scipy_time * 1e6:.2f} us, inverse_normal_cdf: {inverse_time * 1e6:.3f} us "
+      f"({scipy_time / inverse_time:.0f}x)")
 
 profiler = cProfile.Profile()
 profiler.enable()
 
-pitches_1000 = [Pitch(g, pitcher, catcher, m) for __ in range(1000)]
+pitches_1000 = [pitch_and_swing() for __ in range(1000)]
 
 profiler.disable()
 stats = pstats.Stats(profiler).sort_stats('tottime')
 
-stats.print_stats()
+stats.print_stats(15)
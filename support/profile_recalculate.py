@@ -0,0 +1,62 @@
+import cProfile
+import pstats
+from timeit import timeit
+
+from loguru import logger
+
+from blaseball.stats import stats as s
+from blaseball.stats.teams import League
+from data import teamdata
+
+logger.remove()
+
+league = League(s.pb, teamdata.TEAMS_99)
+print(f"{len(s.pb)} players x {len(s.pb.stats)} stats")
+
+per_player = timeit(lambda: s.pb.recalculate_all(vectorized=False), number=5) / 5
+vectorized = timeit(lambda: s.pb.recalculate_all(vectorized=True), number=5) / 5
+print(f"per-player recalculate_all: {per_player * 1000:.1f} ms")
+print(f"vectorized recalculate_all: {vectorized * 1000:.1f} ms ({per_player / vectorized:.1f}x)")
+
+test_player = next(iter(s.pb.players.values()))
+
+
+def recalculate_one():
+    test_player._stale_stats = s.pb.create_blank_stale_set(True)
+    test_player.recalculate()
+
+
+single = timeit(recalculate_one, number=200) / 200
+print(f"single player recalculate: {single * 1000:.3f} ms")
+
+
+def pitch_and_recalculate():
+    # what StatsMonitor.update_pitch does to a pitcher, then a read of one of the averages
+    test_player[s.pitches_thrown] += 1
+    test_player[s.total_pitch_difficulty] += 0.5
+    test_player.recalculate()
+    return test_player[s.average_pitch_difficulty]
+
+
+pitch = timeit(pitch_and_recalculate, number=2000) / 2000
+print(f"single pitch update and recalculate: {pitch * 1000:.3f} ms")
+
+
+def dirty_and_save():
+    for player in s.pb.players.values():
+        player[s.power] = player[s.power]
+    s.pb.save_all_players_to_pb()
+
+
+dirty_save = timeit(dirty_and_save, number=5) / 5
+print(f"save_all_players_to_pb, every player dirty: {dirty_save * 1000:.1f} ms")
+
+profiler = cProfile.Profile()
+profiler.enable()
+
+s.pb.recalculate_all()
+
+profiler.disable()
+stats = pstats.Stats(profiler).sort_stats('tottime')
+
+stats.print_stats(20)
@@ -0,0 +1,41 @@
+"""Times the player stat reads that make up a single pitch: pitch calling, the pitch itself, the swing, and a
+fielder's catch attempt."""
+from timeit import timeit
+
+from loguru import logger
+
+from blaseball.stats import stats as s
+
+logger.remove()
+
+pitcher, catcher, batter, on_deck, fielder = s.pb.create_players(5)
+
+
+def read_pitch_stats():
+    # pitching.calc_pitch_calling / roll_pitch / Pitch
+    batter[s.total_offense] - on_deck[s.total_offense]
+    batter[s.power], batter[s.discipline]
+    catcher[s.calling], pitcher[s.accuracy]
+    pitcher[s.accuracy], catcher[s.calling], pitcher[s.trickery], pitcher[s.force], pitcher[s.trickery]
+    # hitting.Swing
+    batter[s.discipline], batter[s.contact]
+    # fielding.Catch
+    fielder[s.reach], fielder[s.grabbiness], fielder[s.name]
+
+
+def read_pitch_stats_by_name():
+    for player, stat in [
+        (batter, 'total offense'), (on_deck, 'total offense'), (batter, 'power'), (batter, 'discipline'),
+        (catcher, 'calling'), (pitcher, 'accuracy'), (pitcher, 'accuracy'), (catcher, 'calling'),
+        (pitcher, 'trickery'), (pitcher, 'force'), (pitcher, 'trickery'), (batter, 'discipline'),
+        (batter, 'contact'), (fielder, 'reach'), (fielder, 'grabbiness'), (fielder, 'name'),
+    ]:
+        player[stat]
+
+
+reads_per_pitch = 16
+number = 20000
+by_stat = timeit(read_pitch_stats, number=number) / number
+by_name = timeit(read_pitch_stats_by_name, number=number) / number
+print(f"stat reads per pitch, by Stat: {by_stat * 1e6:.2f} us ({by_stat / reads_per_pitch * 1e9:.0f} ns per read)")
+print(f"stat reads per pitch, by name: {by_name * 1e6:.2f} us ({by_name / reads_per_pitch * 1e9:.0f} ns per read)")
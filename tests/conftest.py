@@ -8,7 +8,7 @@ import pytest
 
 from blaseball.stats import statclasses, playerbase, stats, players, teams, stadium, lineup
 from blaseball.playball import gamestate, pitching, basepaths, inplay, pitchmanager, ballgame, statsmonitor
-from blaseball.util import messenger
+from blaseball.util import messenger, rng
 from support.mock_functions import FunctionPatcher
 from support.loggercapture import LoggerCapture
 from data import teamdata
@@ -56,6 +56,7 @@ class RunningSeed:
 def seed_randoms():
     numpy.random.seed(RunningSeed.running_seed)
     random.seed(RunningSeed.running_seed)
+    rng.seed(RunningSeed.running_seed)
     RunningSeed.running_seed += 1
 
 
@@ -240,6 +241,26 @@ def ballgame_1(league_2, stadium_cut_lf, messenger_1):
     return test_ballgame
 
 
+@pytest.fixture(scope='function')
+def ballgame_2(generate_league_2, stadium_a):
+    home_lineup = lineup.Lineup("Home Lineup")
+    home_lineup.generate(generate_league_2[0])
+    away_lineup = lineup.Lineup("Away Lineup")
+    away_lineup.generate(generate_league_2[1])
+
+    return ballgame.BallGame(messenger.Messenger(), home_lineup, away_lineup, stadium_a, gamestate.GameRules())
+
+
+@pytest.fixture(scope='function')
+def force_foul(patcher):
+    """Every pitch gets swung at and hit, and every hit lands foul, out past third base."""
+    patcher.patch('blaseball.playball.hitting.roll_for_swing_decision', lambda swing_chance: True)
+    patcher.patch('blaseball.playball.hitting.roll_hit_quality', lambda net_contact: 2)
+    patcher.patch('blaseball.playball.liveball.roll_launch_angle', lambda quality, batter_power: 20)
+    patcher.patch('blaseball.playball.liveball.roll_field_angle', lambda quality, batter_pull: 120)
+    patcher.patch('blaseball.playball.liveball.roll_exit_velocity', lambda quality, reduction, batter_power: 80)
+
+
 @pytest.fixture(scope='function')
 def gamestate_1(league_2):
     state = gamestate.GameState(
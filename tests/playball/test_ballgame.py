@@ -1,6 +1,8 @@
 import pytest
 
 from blaseball.playball.gamestate import GameState, GameTags
+from blaseball.playball.liveball import HitBall
+from blaseball.util.messenger import Messenger
 
 from decimal import Decimal
 
@@ -39,6 +41,22 @@ class TestBallGame:
         assert len(count_store_all) == 2
         assert "Foul ball. 0 - 2" in count_store_all[0].text
 
+    def test_player_hit_foul(self, ballgame_2, force_foul, patcher):
+        incremented = []
+        patcher.patch('blaseball.playball.ballgame.BallGame.increment_batter', lambda self: incremented.append(self))
+        batter = ballgame_2.state.batter()
+
+        foul = HitBall(ballgame_2.state, 2, 0, batter, Messenger())
+        assert foul.foul
+        ballgame_2.player_hit_ball(foul)
+        assert incremented == []
+
+        patcher.patch('blaseball.playball.liveball.roll_field_angle', lambda quality, batter_pull: 45)
+        fair = HitBall(ballgame_2.state, 2, 0, batter, Messenger())
+        assert not fair.foul
+        ballgame_2.player_hit_ball(fair)
+        assert incremented == [ballgame_2]
+
     def test_add_strike(self, ballgame_1, count_store_all):
         ballgame_1.needs_new_batter = [False, False]
         assert ballgame_1.state.strikes == 0
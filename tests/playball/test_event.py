@@ -23,4 +23,23 @@ class TestEvent:
 
         test_event += event.Update("test 2")
         assert test_event.feed_text() == ['test update', 'test 2']
-    
\ No newline at end of file
+
+    def test_update_lazy_text(self):
+        class CountingUpdate(event.Update):
+            built = 0
+
+            def build_text(self):
+                CountingUpdate.built += 1
+                return "built text"
+
+        lazy_update = CountingUpdate()
+        assert CountingUpdate.built == 0
+        assert lazy_update.text == "built text"
+        assert str(lazy_update) == "built text"
+        assert CountingUpdate.built == 1
+
+        set_update = CountingUpdate("given text")
+        assert set_update.text == "given text"
+        set_update.text = "new text"
+        assert set_update.text == "new text"
+        assert CountingUpdate.built == 1
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from blaseball.playball.eventlog import EventLog, EventKind, EVENT_DTYPE, NO_PLAYER, load_events, to_tenths
+from blaseball.playball.gamestate import GameTags
+from blaseball.playball.liveball import LiveBall
+from blaseball.playball.simulation import build_lineup, run_game
+from blaseball.util.messenger import Messenger, CountStore
+
+
+@pytest.fixture(scope='class')
+def logged_game(generate_league_2, stadium_a):
+    home = build_lineup("Home Lineup", generate_league_2[0].players)
+    away = build_lineup("Away Lineup", generate_league_2[1].players)
+    messenger = Messenger()
+    event_log = EventLog(messenger, game_id=7, capacity=16)
+    pitches = CountStore(messenger, GameTags.pitch, items_to_store=0)
+    runs = []
+    messenger.subscribe(runs.append, GameTags.runs_scored)
+    game = run_game(home, away, stadium_a, generator=np.random.default_rng(383), messenger=messenger)
+    return game, event_log, pitches, runs
+
+
+class TestEventLog:
+    def test_records(self, logged_game):
+        game, event_log, pitches, runs = logged_game
+        events = event_log.events
+        assert events.dtype == EVENT_DTYPE
+        assert len(event_log) == len(events) > 16  # grew past its starting capacity
+        assert (events['game'] == 7).all()
+        assert (np.diff(events['tick'].astype(int)) >= 0).all()
+
+        assert len(event_log.of_kind(EventKind.pitch)) == pitches.count
+        assert len(event_log.of_kind(EventKind.swing)) == pitches.count
+        assert event_log.of_kind(EventKind.runs_scored)['runs'].sum() == sum(to_tenths(run) for run in runs)
+
+        # every swing that makes contact puts a ball in the air, foul or not
+        hit_balls = len(event_log.of_kind(EventKind.hit_ball))
+        assert hit_balls == event_log.of_kind(EventKind.swing)['hit'].sum()
+        assert hit_balls > 0
+        fouls = event_log.of_kind(EventKind.hit_ball)['foul']
+        assert fouls.any() and not fouls.all()
+        assert not (fouls & event_log.of_kind(EventKind.hit_ball)['home_run']).any()
+        assert len(event_log.of_kind(EventKind.new_batter)) > 1
+
+    def test_record_hit_ball(self, logged_game):
+        game, __, pitches, runs = logged_game
+        event_log = EventLog(Messenger())
+        event_log.new_game_state(game.state)
+        hit_ball = SimpleNamespace(live=LiveBall(30, 20, 100), foul=False, homerun=True)
+        event_log.record_hit_ball(hit_ball)
+        assert len(event_log) == 1
+        hit = event_log.events[-1]
+        assert hit['kind'] == EventKind.hit_ball
+        assert (hit['launch_angle'], hit['field_angle'], hit['speed']) == (30, 20, 100)
+        assert hit['home_run'] and not hit['foul']
+        assert (hit['runners'] == NO_PLAYER).all() and hit['player'] == NO_PLAYER
+
+    def test_header(self, logged_game):
+        game, event_log, pitches, runs = logged_game
+        first_pitch = event_log.of_kind(EventKind.pitch)[0]
+        assert first_pitch['inning'] == 1
+        assert first_pitch['balls'] == first_pitch['strikes'] == first_pitch['outs'] == 0
+        assert first_pitch['home_score'] == first_pitch['away_score'] == 0
+        assert (first_pitch['bases'] == NO_PLAYER).all()
+        assert NO_PLAYER != first_pitch['batter'] != first_pitch['pitcher'] != NO_PLAYER
+
+        events = event_log.events
+        new_batters = np.flatnonzero(events['kind'] == EventKind.new_batter)
+        following = events[new_batters[:-1] + 1]
+        assert (following['batter'] == events[new_batters[:-1]]['player']).all()
+
+        game_over = event_log.of_kind(EventKind.game_over)
+        assert len(game_over) == 1
+        assert game_over['home_score'][0] == to_tenths(game.state.scores[0])
+        assert game_over['away_score'][0] == to_tenths(game.state.scores[1])
+
+    def test_save_load(self, logged_game, tmp_path):
+        game, event_log, pitches, runs = logged_game
+        path = tmp_path / "game.npy"
+        event_log.save(path)
+        loaded = load_events(path)
+        assert loaded.dtype == EVENT_DTYPE
+        assert (loaded == event_log.events).all()
@@ -1,4 +1,10 @@
-from blaseball.playball.gamestate import GameState, GameRules, BaseSummary
+from copy import copy
+from decimal import Decimal
+
+import pytest
+
+from blaseball.playball.gamestate import GameState, GameRules, BaseSummary, to_tenths, from_tenths
+from blaseball.playball.simulation import build_lineup
 from blaseball.stats.lineup import Lineup
 
 
@@ -98,4 +104,54 @@ class TestGameState:
         assert rollover
         assert gamestate_1.at_bat_numbers == [4, 0]
         gamestate_1.increment_batting_order(3)
-        assert gamestate_1.at_bat_numbers == [4, 3]
\ No newline at end of file
+        assert gamestate_1.at_bat_numbers == [4, 3]
+
+    def test_snapshot(self, generate_league_2, stadium_a):
+        home = build_lineup("Home Lineup", generate_league_2[0].players)
+        away = build_lineup("Away Lineup", generate_league_2[1].players)
+        state = GameState(home, away, stadium_a, GameRules())
+        state.outs = 2
+        state.score_tenths[1] += 1
+        state.bases[2] = state.batter()
+
+        snapshot = state.snapshot()
+        assert snapshot.home_team is home and snapshot.stadium is stadium_a
+        assert snapshot.base_cids[2] == state.batter().cid
+        with pytest.raises(AttributeError):
+            snapshot.extra = True
+
+        state.outs = 0
+        state.score_tenths[1] += 10
+        state.increment_batting_order()
+        state.bases = BaseSummary(stadium_a.NUMBER_OF_BASES)
+        assert snapshot.outs == 2 and snapshot.scores[1] == Decimal("0.1") and snapshot.at_bat_numbers == (0, 0)
+
+        state.restore(snapshot)
+        assert state.snapshot() == snapshot
+        assert (state.outs, state.scores, state.bases[2]) == (2, [Decimal("0.0"), Decimal("0.1")], away.batting_order[0])
+
+        copied = copy(state)
+        copied.score_tenths[0] += 10
+        copied.at_bat_numbers[1] += 1
+        assert state.scores[0] == 0 and state.at_bat_numbers[1] == 0
+        assert snapshot.to_state().snapshot() == snapshot
+
+    def test_score_tenths(self, generate_league_2, stadium_a):
+        assert to_tenths(3) == 30
+        assert to_tenths(Decimal("0.9")) == 9
+        assert to_tenths(Decimal("0.1") + 2) == 21
+        assert str(from_tenths(0)) == "0.0"
+        assert str(from_tenths(21)) == "2.1"
+
+        home = build_lineup("Home Lineup", generate_league_2[0].players)
+        away = build_lineup("Away Lineup", generate_league_2[1].players)
+        state = GameState(home, away, stadium_a, GameRules(), scores=[Decimal("1.0"), Decimal("0.0")])
+        assert state.score_tenths == [10, 0]
+
+        runs = [Decimal("0.9"), 1, Decimal("0.1"), Decimal("0.1") + 3, 2] * 20
+        decimal_total = Decimal("0.0")
+        for run in runs:
+            decimal_total += run
+            state.score_tenths[1] += to_tenths(run)
+        assert state.scores == [Decimal("1.0"), decimal_total]
+        assert state.score_string().endswith(f": {decimal_total:.0f}")
@@ -3,6 +3,8 @@ import pytest
 import math
 import statistics
 
+import numpy as np
+
 from blaseball.playball import liveball, gamestate
 from blaseball.stats.stadium import Stadium
 from blaseball.util.geometry import Coord
@@ -62,6 +64,32 @@ class TestLiveBall:
         assert isinstance(str(ball), str)
 
 
+class TestLiveBallBatch:
+    def test_batch_matches_live_ball(self, stadium_a):
+        generator = np.random.default_rng(383)
+        launch_angles = generator.uniform(-30, 80, 500)
+        field_angles = generator.uniform(-10, 100, 500)
+        speeds = generator.uniform(40, 130, 500)
+        batch = liveball.LiveBallBatch(launch_angles, field_angles, speeds)
+        fouls, home_runs, hit_walls = batch.classify(stadium_a)
+        assert len(batch) == 500
+        assert home_runs.any() and hit_walls.any()
+        assert fouls.any() and not fouls.all()
+
+        for i in range(len(batch)):
+            ball = liveball.LiveBall(launch_angles[i], field_angles[i], speeds[i])
+            location = ball.ground_location()
+            assert (batch.x[i], batch.y[i]) == pytest.approx((location.x, location.y))
+            assert batch.flight_time[i] == pytest.approx(ball.flight_time())
+            assert batch.catchable[i] == ball.catchable
+            assert batch[i].ground_location() == location
+
+            foul = stadium_a.check_foul(location)
+            assert fouls[i] == foul
+            if not foul:
+                assert (home_runs[i], hit_walls[i]) == stadium_a.check_home_run(location)
+
+
 class TestHitBall:
     @staticmethod
     def print_launch_angle_array(launch_angles, title) -> None:
@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
 import statistics
 
-from blaseball.playball.gamestate import GameTags
+from blaseball.playball.gamestate import GameRules, GameState, GameTags
 from blaseball.playball import pitching
+from blaseball.stats import lineup
 from blaseball.stats import stats as s
+from blaseball.util import rng
 
 
 # note: this was written mostly avoiding parameterize, relying on comparisons instead. compare test_hitting
@@ -209,6 +212,26 @@ class TestPitching:
         print(f"1 / 1mill pitch deviation: {max(deviations)}")
         print(f"Average pitch devation: {statistics.mean(deviations)}")
 
+    @pytest.mark.parametrize('read_text', [False, True])
+    def test_pitch_text_rolls(self, generate_league_2, stadium_a, read_text):
+        home = lineup.Lineup("Home Lineup")
+        home.generate(generate_league_2[0])
+        away = lineup.Lineup("Away Lineup")
+        away.generate(generate_league_2[1])
+        state = GameState(home, away, stadium_a, GameRules())
+
+        stream = rng.RandomStream(np.random.default_rng(5), flavour=np.random.default_rng(6))
+        with rng.using(stream):
+            pitch = pitching.build_pitch(state)
+            if read_text:
+                assert " mph " in pitch.text
+            next_rolls = [rng.rand(), rng.normal()]
+        assert (stream._flavour is not None) == read_text
+
+        with rng.using(rng.RandomStream(np.random.default_rng(5))):
+            pitching.build_pitch(state)
+            assert [rng.rand(), rng.normal()] == next_rolls
+
     def test_check_strike(self):
         assert not pitching.check_strike(1.01, 1)
         assert pitching.check_strike(1.05, 2)
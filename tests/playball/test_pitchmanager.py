@@ -1,7 +1,8 @@
 from blaseball.playball.pitching import Pitch
 from blaseball.playball.hitting import Swing
 from blaseball.playball.gamestate import GameTags, BaseSummary
-from blaseball.util.messenger import Printer
+from blaseball.playball.pitchmanager import PitchManager
+from blaseball.util.messenger import CountStore, Printer
 
 
 class TestPitchManager:
@@ -54,6 +55,21 @@ class TestPitchManager:
         assert isinstance(base_summary, BaseSummary)
         assert base_summary.bases == [None, None, None, None]
 
+    def test_foul(self, ballgame_2, force_foul, patcher):
+        fielded = []
+        patcher.patch('blaseball.playball.pitchmanager.FieldBall', lambda *args: fielded.append(args))
+        PitchManager(ballgame_2.state, ballgame_2.messenger)
+        count_store = CountStore(ballgame_2.messenger, list(GameTags))
+
+        ballgame_2.messenger.send(ballgame_2.state, GameTags.state_ticks)
+
+        inventory = count_store.tag_inventory()
+        assert inventory[GameTags.hit_ball] == 1
+        assert inventory[GameTags.foul] == 1
+        assert inventory[GameTags.bases_update] == 0
+        assert fielded == []
+        assert ballgame_2.messenger.listener_errors == 0
+
     def test_player_walked(self, messenger_1, pitch_manager_1, count_store_all, gamestate_1, batters_4):
         gamestate_1.bases[3] = batters_4[0]
         gamestate_1.bases[1] = batters_4[1]
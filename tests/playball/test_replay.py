@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from blaseball.playball.eventlog import EventLog, EventKind
+from blaseball.playball.gamestate import GameTags, GameRules, GameState
+from blaseball.playball.replay import Replay
+from blaseball.playball.simulation import build_lineup, run_game
+from blaseball.util.messenger import Messenger
+
+
+def summarize(state: GameState) -> tuple:
+    return (
+        state.inning, state.inning_half, state.outs, state.balls, state.strikes,
+        list(state.scores), list(state.at_bat_numbers), list(state.bases), state.batter()
+    )
+
+
+@pytest.fixture(scope='class')
+def replayed_game(generate_league_2, stadium_a):
+    home = build_lineup("Home Lineup", generate_league_2[0].players)
+    away = build_lineup("Away Lineup", generate_league_2[1].players)
+    messenger = Messenger()
+    event_log = EventLog(messenger)
+    ticks = []
+    messenger.subscribe(lambda state: ticks.append(summarize(state)), GameTags.pre_tick)
+    game = run_game(home, away, stadium_a, GameRules(), np.random.default_rng(383), messenger)
+    replay = Replay(event_log.events.copy(), home, away, stadium_a, GameRules())
+    return game, replay, ticks
+
+
+class TestReplay:
+    def test_state_at(self, replayed_game):
+        game, replay, ticks = replayed_game
+        assert len(replay) == game.tick_count
+        for pitch_number in range(len(replay)):
+            tick = replay.pitch(pitch_number)['tick']
+            assert summarize(replay.state_at(pitch_number)) == ticks[tick - 1]
+
+        final = replay.state_at(len(replay))
+        assert final.scores == game.state.scores
+        assert final.inning == game.state.inning
+        with pytest.raises(IndexError):
+            replay.state_at(len(replay) + 1)
+
+    def test_seek_inning(self, replayed_game):
+        game, replay, ticks = replayed_game
+        assert replay.seek_inning(1) == 0
+        bottom_first = replay.seek_inning(1, 0)
+        assert replay.state_at(bottom_first).inning_half == 0
+        assert replay.state_at(bottom_first - 1).inning_half == 1
+
+        seventh = replay.state_at(replay.seek_inning(7))
+        assert (seventh.inning, seventh.inning_half, seventh.outs) == (7, 1, 0)
+        with pytest.raises(ValueError):
+            replay.seek_inning(game.state.inning + 5)
+
+    def test_events_for(self, replayed_game):
+        game, replay, ticks = replayed_game
+        events = replay.events_for(3)
+        assert (events['tick'] == replay.pitch(3)['tick']).all()
+        assert EventKind.pitch in events['kind']
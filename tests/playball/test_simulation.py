@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from blaseball.playball import simulation
+from blaseball.playball.eventlog import EventKind, to_tenths
+from blaseball.playball.gamestate import GameTags
+from blaseball.stats import statclasses
+from blaseball.stats import stats as s
+from blaseball.util.messenger import Messenger
+
+
+@pytest.fixture(scope='class')
+def schedule_2(generate_league_2):
+    return simulation.round_robin(generate_league_2)
+
+
+def performance_snapshot():
+    return s.pb.df[[stat.name for stat in s.pb.get_stats_with_kind(statclasses.Kinds.performance)]].copy()
+
+
+class TestSimulation:
+    def test_round_robin(self, generate_league_2, schedule_2):
+        assert len(schedule_2) == 2
+        assert {(matchup.home, matchup.away) for matchup in schedule_2} == {
+            (generate_league_2[0].name, generate_league_2[1].name),
+            (generate_league_2[1].name, generate_league_2[0].name),
+        }
+        assert schedule_2[1].home_rotation == 1
+
+    def test_run_schedule(self, generate_league_2, schedule_2):
+        s.pb.save_all_players_to_pb()
+        before = performance_snapshot()
+
+        results = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=5, workers=1)
+        assert len(results) == 2
+        for box_score, matchup in zip(results, schedule_2):
+            assert box_score.matchup is matchup
+            assert box_score.ticks > 0
+            assert box_score.stat_deltas
+
+        s.pb.save_all_players_to_pb()
+        assert (performance_snapshot() == before).all().all()
+
+        repeat = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=5, workers=1)
+        assert [box_score.scores for box_score in repeat] == [box_score.scores for box_score in results]
+        assert [box_score.stat_deltas for box_score in repeat] == [box_score.stat_deltas for box_score in results]
+
+    def test_merge_results(self, generate_league_2, schedule_2):
+        results = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=5, workers=1)
+        cid, player_deltas = next(iter(results[0].stat_deltas.items()))
+        stat_name, delta = next(iter(player_deltas.items()))
+        total_delta = sum(box_score.stat_deltas.get(cid, {}).get(stat_name, 0) for box_score in results)
+        old_value = s.pb.players[cid][stat_name]
+
+        simulation.merge_results(s.pb, results)
+        assert s.pb.players[cid][stat_name] == pytest.approx(old_value + total_delta)
+        assert s.pb.df.at[cid, stat_name] == pytest.approx(old_value + total_delta)
+
+        table = simulation.standings(results)
+        assert table['wins'].sum() + table['ties'].sum() / 2 == len(results)
+
+    def test_listener_errors(self, generate_league_2, stadium_a):
+        home = simulation.build_lineup("Home Lineup", generate_league_2[0].players)
+        away = simulation.build_lineup("Away Lineup", generate_league_2[1].players)
+        messenger = Messenger()
+
+        def broken_listener(hit_ball):
+            raise ZeroDivisionError("a listener with a bug in it")
+
+        messenger.subscribe(broken_listener, GameTags.hit_ball)
+        with pytest.raises(simulation.SimulationError, match="ZeroDivisionError"):
+            simulation.run_game(home, away, stadium_a, generator=np.random.default_rng(5), messenger=messenger)
+
+    def test_workers_match(self, generate_league_2, schedule_2):
+        in_process = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=9, workers=1)
+        pooled = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=9, workers=2)
+        assert [box_score.scores for box_score in pooled] == [box_score.scores for box_score in in_process]
+        assert [box_score.stat_deltas for box_score in pooled] == [box_score.stat_deltas for box_score in in_process]
+
+    def test_record_events(self, generate_league_2, schedule_2):
+        results = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=5, workers=1, record_events=True)
+        events = simulation.season_events(results)
+        assert set(events['game']) == {0, 1}
+        game_over = events[events['kind'] == EventKind.game_over]
+        assert [[row['home_score'], row['away_score']] for row in game_over] == [
+            [to_tenths(score) for score in box_score.scores] for box_score in results
+        ]
+
+        unrecorded = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=5, workers=1)
+        assert unrecorded[0].events is None
+        assert [box_score.scores for box_score in unrecorded] == [box_score.scores for box_score in results]
+
+    @pytest.mark.parametrize('seed, expected_scores', [
+        (5, [['10.0', '6.0'], ['7.0', '8.0']]),
+        (9, [['3.0', '1.0'], ['3.0', '5.0']]),
+        (383, [['4.0', '0.0'], ['2.0', '4.0']]),
+    ])
+    def test_seeded_scores(self, generate_league_2, schedule_2, seed, expected_scores):
+        """Final scores for these seeds under the current game rules: balls in play are rolled and fielded, and
+        anything landing outside the foul lines is a foul - it adds to the count and the batter stays up. They were
+        pinned from the same rules with scores still added up as Decimals, and integer tenths have to reproduce them
+        exactly."""
+        results = simulation.run_schedule(s.pb, generate_league_2, schedule_2, seed=seed, workers=1,
+                                          record_events=True)
+        assert (simulation.season_events(results)['kind'] == EventKind.hit_ball).any()
+        assert [box_score.scores for box_score in results] == [
+            [Decimal(score) for score in scores] for scores in expected_scores
+        ]
+        assert [str(score) for score in results[0].scores] == expected_scores[0]
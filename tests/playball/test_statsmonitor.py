@@ -3,12 +3,15 @@ import pytest
 from blaseball.playball.statsmonitor import StatsMonitor
 from blaseball.playball.gamestate import GameState
 from blaseball.playball.hitting import Swing
+from blaseball.playball.liveball import HitBall
 from blaseball.stats import stats as s
+from blaseball.util.messenger import Messenger
 
 
 class TestStatsMonitor:
     def test_stats_init(self, ballgame_1):
-        stats_monitor = StatsMonitor(ballgame_1.messenger, ballgame_1.state)
+        stats_monitor = ballgame_1.stats_monitor
+        assert isinstance(stats_monitor, StatsMonitor)
         assert stats_monitor.current_state is ballgame_1.state
 
     def test_new_game_state(self, stats_monitor_1, gamestate_1):
@@ -49,6 +52,15 @@ class TestStatsMonitor:
         assert batter[s.pitches_seen] == 1
         assert batter[s.strike_rate] == pytest.approx(0)
 
+    def test_update_foul(self, ballgame_2, force_foul):
+        batter = ballgame_2.state.batter()
+        fouls = batter[s.total_fouls]
+        hits = batter[s.total_hits]
+
+        ballgame_2.stats_monitor.update_liveball(HitBall(ballgame_2.state, 2, 0, batter, Messenger()))
+        assert batter[s.total_fouls] == fouls + 1
+        assert batter[s.total_hits] == hits + 1
+
 
 class TestStatsMonitorIntegrated:
     def test_state_update_state(self, ballgame_1, stats_monitor_1, patcher):
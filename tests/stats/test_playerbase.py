@@ -1,7 +1,7 @@
 import pytest
 
 from blaseball.stats import statclasses, players
-from blaseball.stats.playerbase import PlayerBase
+from blaseball.stats.playerbase import PlayerBase, StatRow
 from blaseball.stats import stats as s
 
 
@@ -43,6 +43,43 @@ class TestPlayerBasePlayers:
         del playerbase_10[del_player_2.cid]
         assert len(playerbase_10) == 8
 
+    def test_create_players(self, empty_all_base):
+        new_players = s.pb.create_players(20)
+        assert len(new_players) == 20
+        assert len(s.pb) == 20
+        s.pb.verify()
+
+        assert len({player.cid for player in new_players}) == 20
+        for player in new_players:
+            assert s.pb[player.cid] is player
+            assert not player.pb_is_stale
+            assert player[s.name] == s.pb.df.at[player.cid, s.name.name]
+            assert 0 <= player[s.power] == s.pb.df.at[player.cid, s.power.name]
+            assert player[s.batting] == pytest.approx(s.pb.df.at[player.cid, s.batting.name])
+            assert isinstance(player[s.overall_descriptor], str)
+
+        more_players = s.pb.create_players(5)
+        assert len(s.pb) == 25
+        assert more_players[0].cid > new_players[-1].cid
+        s.pb.clear_players()
+
+    def test_save_all_players(self, empty_all_base):
+        new_players = s.pb.create_players(10)
+        for i, player in enumerate(new_players[0:5]):
+            player[s.power] = i / 10
+            player[s.team] = "Test Team"
+        assert new_players[0].pb_is_stale
+        assert not new_players[6].pb_is_stale
+
+        s.pb.save_all_players_to_pb()
+        for i, player in enumerate(new_players[0:5]):
+            assert not player.pb_is_stale
+            assert s.pb.df.at[player.cid, s.power.name] == pytest.approx(i / 10)
+            assert s.pb.df.at[player.cid, s.team.name] == "Test Team"
+            assert s.pb.df.at[player.cid, s.batting.name] == pytest.approx(player[s.batting])
+        assert s.pb.df.at[new_players[6].cid, s.team.name] != "Test Team"
+        s.pb.clear_players()
+
 #
 #     def test_index_set(self, playerbase_10, player_1):
 #         player_cids = playerbase_10.df.index
@@ -90,6 +127,23 @@ class TestPlayerBaseStats:
         assert test_stat_2 not in arbitrary_pb.stats.values()
         assert test_stat_2.name not in arbitrary_pb.df.columns
 
+    def test_stat_slots(self, arbitrary_pb):
+        for slot, stat in enumerate(arbitrary_pb.stats_by_slot):
+            assert stat.slot == slot
+        test_stat = statclasses.Stat("test stat", statclasses.Kinds.test, 0.5, playerbase=arbitrary_pb)
+        last_stat = statclasses.Stat("last stat", statclasses.Kinds.test, 0.25, playerbase=arbitrary_pb)
+        arbitrary_pb.remove_stat(test_stat)
+        assert arbitrary_pb.stats_by_slot[test_stat.slot] is None
+        assert arbitrary_pb.stats_by_slot[last_stat.slot] is last_stat
+
+        player = arbitrary_pb[10]
+        assert player[last_stat] == 0.25
+        assert player._stats_cache['last stat'] == 0.25
+        assert test_stat not in list(player._stats_cache)
+        player[last_stat] = 0.75
+        assert player._slot_values[last_stat.slot] == 0.75
+        assert last_stat.slot in player._dirty_stats
+
     def test_get_stats_with(self, arbitrary_pb):
         arbitrary_len = len(arbitrary_pb.df.columns)
         assert len(arbitrary_pb.get_stats_with_kind(statclasses.Kinds.test)) == arbitrary_len
@@ -97,6 +151,33 @@ class TestPlayerBaseStats:
         assert len(arbitrary_pb.get_stats_by_name("cola")) == 1
         assert arbitrary_pb.get_stats_by_name("cola")[0] is arbitrary_pb.stats["cola"]
 
+    def test_stat_indexes(self, arbitrary_pb):
+        personality = arbitrary_pb.stats['col3']
+        category = arbitrary_pb.stats['col4']
+        rating_1 = statclasses.Rating('rating 1', personality, category, arbitrary_pb, statclasses.Kinds.test)
+        rating_2 = statclasses.Rating('rating 2', None, None, arbitrary_pb, statclasses.Kinds.test)
+        assert arbitrary_pb.get_stats_with_personality(personality) == [rating_1]
+        with pytest.raises(KeyError):
+            arbitrary_pb.get_stats_with_personality(arbitrary_pb.stats['col5'])
+
+        rating_2.personality = personality
+        rating_2.category = category
+        assert arbitrary_pb.get_stats_with_personality(personality) == [rating_1, rating_2]
+        assert arbitrary_pb.get_stats_with_category(category) == [rating_1, rating_2]
+        rating_1.personality = arbitrary_pb.stats['col5']
+        assert arbitrary_pb.get_stats_with_personality(personality) == [rating_2]
+
+        rating_2.abbreviate("RT2")
+        assert arbitrary_pb.get_stat_with_abbreviation("RT2") is rating_2
+        assert arbitrary_pb.get_stats_by_name("RT2") == [rating_2]
+        with pytest.raises(KeyError):
+            rating_1.abbreviate("RT2")
+
+        arbitrary_pb.remove_stat(rating_2)
+        assert rating_2 not in arbitrary_pb.get_stats_with_kind(statclasses.Kinds.test)
+        assert arbitrary_pb.get_stat_with_abbreviation("RT2") is None
+        assert arbitrary_pb.get_stats_with_category(category) == [rating_1]
+
     def test_default_stat_list(self, arbitrary_pb):
         for i in range(len(arbitrary_pb.stats)):
             assert arbitrary_pb._default_stat_list[i] == -1
@@ -110,10 +191,139 @@ class TestPlayerBaseStats:
             arbitrary_pb
         )
         assert list(arbitrary_pb.df["dependent stat"]) == [-1.0] * 5
-        assert arbitrary_pb.iloc(1)._stale_dict[statclasses.Kinds.test_dependent]
+        assert arbitrary_pb.iloc(1).is_stale(arbitrary_pb.stats["dependent stat"])
         arbitrary_pb.recalculate_all()
         assert list(arbitrary_pb.df["dependent stat"]) == list(arbitrary_pb.df['col3'])
-        assert not arbitrary_pb.iloc(1)._stale_dict[statclasses.Kinds.test_dependent]
+        assert not arbitrary_pb.iloc(1).is_stale(arbitrary_pb.stats["dependent stat"])
+
+    def test_stat_graph(self, arbitrary_pb):
+        col1 = arbitrary_pb.stats['col1']
+        col2 = arbitrary_pb.stats['col2']
+        # declared out of order, so only the graph can put them in order
+        total = statclasses.Calculatable(
+            "total", statclasses.Kinds.test_dependent,
+            lambda pb, cid: pb[cid]['double'] + pb[cid]['col2'], arbitrary_pb
+        )
+        double = statclasses.Calculatable(
+            "double", statclasses.Kinds.test_dependent,
+            lambda pb, cid: pb[cid]['col1'] * 2, arbitrary_pb, dependencies=[col1]
+        )
+        total.dependencies = [double, col2]
+        arbitrary_pb.invalidate_stat_graph()
+
+        graph = arbitrary_pb.get_stat_graph()
+        assert graph.order == [double, total]
+        assert graph.stale_on_write[col1.slot] == {double.slot, total.slot}
+        assert graph.stale_on_write[col2.slot] == {total.slot}
+        assert graph.stale_on_write[arbitrary_pb.stats['col3'].slot] == set()
+
+        arbitrary_pb.recalculate_all()
+        player = arbitrary_pb[10]
+        assert player['total'] == 1 * 2 + 6
+        player['col2'] = 10
+        assert player.is_stale(total)
+        assert not player.is_stale(double)
+        assert player['total'] == 1 * 2 + 10
+        player.recalculate()
+        assert player._stats_cache['total'] == 1 * 2 + 10
+
+        double.dependencies = [total]
+        arbitrary_pb.invalidate_stat_graph()
+        with pytest.raises(RuntimeError):
+            arbitrary_pb.get_stat_graph()
+
+    def test_recalculate_all_vectorized(self, generate_league_2):
+        s.pb.recalculate_all(vectorized=False)
+        per_player = s.pb.df.copy()
+        s.pb.recalculate_all(vectorized=True)
+        for stat in [s.batting, s.total_offense, s.total_defense, s.thrown_strike_rate]:
+            assert list(s.pb.df[stat.name]) == pytest.approx(list(per_player[stat.name]))
+        assert list(s.pb.df[s.overall_descriptor.name]) == list(per_player[s.overall_descriptor.name])
+        player = generate_league_2[0].players[0]
+        assert player[s.total_defense] == pytest.approx(s.pb.df.at[player.cid, s.total_defense.name])
+
+
+class TestArrayStore:
+    def test_use_array_store(self, arbitrary_pb):
+        player = arbitrary_pb[11]
+        player[arbitrary_pb.stats['col3']] = 0.25
+        player[arbitrary_pb.stats['cola']] = "z"
+        arbitrary_pb.use_array_store()
+
+        assert isinstance(player._stats_cache, StatRow)
+        assert player['col3'] == pytest.approx(0.25)
+        assert player['cola'] == "z"
+        player['col3'] = 0.75
+        assert arbitrary_pb.array_store.columns[arbitrary_pb.stats['col3']][player._stats_cache.row] == 0.75
+        assert arbitrary_pb[12]['col3'] == pytest.approx(arbitrary_pb.df.at[12, 'col3'])
+
+    def test_array_store_stats(self, arbitrary_pb):
+        arbitrary_pb.use_array_store()
+        int_stat = statclasses.Stat("int stat", statclasses.Kinds.test, 3, playerbase=arbitrary_pb)
+        string_stat = statclasses.Stat("string stat", statclasses.Kinds.test, "a", playerbase=arbitrary_pb)
+        assert arbitrary_pb[10][int_stat] == 3
+        assert arbitrary_pb[10][string_stat] == "a"
+        assert int_stat.name in arbitrary_pb.array_store.values.dtype.names
+        assert string_stat in arbitrary_pb.array_store.objects
+
+        arbitrary_pb.remove_stat(int_stat)
+        assert int_stat not in arbitrary_pb.array_store.columns
+        assert arbitrary_pb[10][string_stat] == "a"
+
+    def test_array_store_growth(self):
+        pb = PlayerBase(statclasses.RECALCULATION_ORDER_TEST, statclasses.BASE_DEPENDENCIES_TEST)
+        test_stat = statclasses.Stat("test stat", statclasses.Kinds.test, 1.0, playerbase=pb)
+        pb.use_array_store()
+        new_players = [players.Player(pb) for __ in range(100)]
+        for i, player in enumerate(new_players):
+            player[test_stat] = i
+        assert pb.array_store.capacity >= 100
+        assert [player[test_stat] for player in new_players] == list(range(100))
+
+    def test_recalculate_all_array_store(self, arbitrary_pb):
+        arbitrary_pb.use_array_store()
+        statclasses.Calculatable(
+            "dependent stat",
+            statclasses.Kinds.test_dependent,
+            lambda pb, cid: pb.df.at[cid, 'col3'],
+            arbitrary_pb
+        )
+        arbitrary_pb.recalculate_all()
+        assert [player['dependent stat'] for player in arbitrary_pb] == pytest.approx(list(arbitrary_pb.df['col3']))
+
+    @pytest.mark.parametrize('array_store', [False, True])
+    def test_delete_player(self, arbitrary_pb, array_store):
+        if array_store:
+            arbitrary_pb.use_array_store()
+        dependent = statclasses.Calculatable(
+            "dependent stat",
+            statclasses.Kinds.test_dependent,
+            lambda pb, cid: pb.df.at[cid, 'col3'] * 2,
+            arbitrary_pb
+        )
+        deleted = arbitrary_pb[11]
+        deleted['col3'] = 0.9
+        del arbitrary_pb[11]
+        assert 11 not in arbitrary_pb.players
+        assert deleted['col3'] == 0.9
+
+        new_player = players.Player(arbitrary_pb)
+        arbitrary_pb.df.loc[new_player.cid] = arbitrary_pb.df.loc[10]
+        if array_store:
+            assert 11 not in arbitrary_pb.array_store.rows
+            assert len(arbitrary_pb.array_store) == len(arbitrary_pb.players)
+            # the new player reuses the deleted player's row, which is no longer the deleted player's business
+            assert new_player._stats_cache.row == 1
+        deleted['col3'] = 0.4
+        new_player['col3'] = 0.6
+        assert deleted['col3'] == 0.4
+
+        arbitrary_pb.save_all_players_to_pb()
+        arbitrary_pb.recalculate_all()
+        assert [player[dependent] for player in arbitrary_pb] == pytest.approx(list(arbitrary_pb.df['col3'] * 2))
+        assert new_player[dependent] == pytest.approx(1.2)
+        arbitrary_pb.load_dataframe(arbitrary_pb.df)
+        assert arbitrary_pb[12]['col3'] == pytest.approx(0.3)
 
 
 class TestPlayerBase:
@@ -128,8 +338,8 @@ class TestPlayerBase:
         assert isinstance(repr(s.pb), str)
 
     @pytest.mark.parametrize("state", [True, False])
-    def test_create_blank_stale_dict(self, state):
-        test_dict = s.pb.create_blank_stale_dict(state)
-        assert len(test_dict) > 5
-        assert not test_dict[statclasses.Kinds.personality]
-        assert test_dict[statclasses.Kinds.weight] == state
+    def test_create_blank_stale_set(self, state):
+        test_set = s.pb.create_blank_stale_set(state)
+        assert s.insight.slot not in test_set
+        assert (s.batting.slot in test_set) == state
+        assert (s.average_pitch_difficulty.slot in test_set) == state
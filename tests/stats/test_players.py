@@ -33,7 +33,7 @@ class TestPlayerIndexing:
 
     def test_index_fresh(self, player_1):
         p1_insight = s.pb.df.at[player_1.cid, "insight"]
-        assert not player_1._stale_dict[s.insight.kind]
+        assert not player_1.is_stale(s.insight)
         assert player_1[s.insight] == p1_insight
 
     def test_index_cid(self, player_1):
@@ -45,10 +45,17 @@ class TestPlayerIndexing:
     def test_set(self, player_1):
         player_1[s.insight] = 1.33
         assert player_1[s.insight] == 1.33
-        for kind in s.pb.dependents[s.insight.kind]:
-            assert player_1._stale_dict[kind]
-            player_1._stale_dict[kind] = False  # reset this
-        assert not any(player_1._stale_dict.values())  # make sure no others got set
+        # make sure only the dependents of insight got set
+        assert player_1._stale_stats == s.pb.get_stat_graph().stale_on_write[s.insight.slot]
+
+    def test_set_stales_dependents_only(self, player_1):
+        player_1[s.pitches_thrown] += 1
+        assert player_1.is_stale(s.average_pitch_difficulty)
+        assert player_1.is_stale(s.thrown_strike_rate)
+        assert not player_1.is_stale(s.hit_rate)
+        assert not player_1.is_stale(s.at_bats)
+        player_1.recalculate()
+        assert not player_1._stale_stats
 
     def test_index_calculatable(self, player_dependent):
         assert player_dependent['independent'] == pytest.approx(0.5)
@@ -57,7 +64,7 @@ class TestPlayerIndexing:
     def test_index_stale(self, player_dependent):
         assert player_dependent['dependent'] == pytest.approx(1.0)
         player_dependent['independent'] = 1.0
-        assert player_dependent._stale_dict[statclasses.Kinds.weight]
+        assert player_dependent.is_stale(s.pb.stats['dependent'])
         assert player_dependent['dependent'] == pytest.approx(2.0)
         assert player_dependent._stats_cache['dependent'] == pytest.approx(1.0)
 
@@ -1,3 +1,7 @@
+import dataclasses
+import pickle
+
+import numpy as np
 import pytest
 
 from blaseball.util import geometry
@@ -17,9 +21,9 @@ class TestStadiumGeo:
         assert stadium_a.polygon.length == pytest.approx(1256, abs=1)
 
     def test_stadium_contains(self, stadium_a):
-        assert not stadium_a.polygon.contains(geometry.Coord(550, 200))
-        assert not stadium_a.polygon.contains(geometry.Coord(360, 100))
-        assert stadium_a.polygon.contains(geometry.Coord(100, 100))
+        assert not stadium_a.polygon.contains(geometry.Coord(550, 200).to_point())
+        assert not stadium_a.polygon.contains(geometry.Coord(360, 100).to_point())
+        assert stadium_a.polygon.contains(geometry.Coord(100, 100).to_point())
 
 
 class TestStadium:
@@ -40,4 +44,65 @@ class TestStadium:
         coords = geometry.Coord(x_coord, y_coord)
         home_run, wall = stadium_cut_lf.check_home_run(coords)
         assert home_run == is_home_run
-        assert wall == is_wall
\ No newline at end of file
+        assert wall == is_wall
+
+    @pytest.mark.parametrize(
+        "x_coord, y_coord, is_foul",
+        [
+            (100, 100, False),
+            (1, 1, False),
+            (300, 5, False),
+            (100, 0, True),
+            (0, 100, True),
+            (50, -10, True),
+            (-10, 50, True),
+            (-50, -50, True),
+        ]
+    )
+    def test_check_foul(self, stadium_a, x_coord, y_coord, is_foul):
+        assert stadium_a.check_foul(geometry.Coord(x_coord, y_coord)) == is_foul
+        assert stadium_a.check_fouls(np.array([x_coord]), np.array([y_coord]))[0] == is_foul
+
+    def test_wall_distance(self, stadium_a, stadium_cut_lf):
+        assert stadium_a.wall_distance(0) == pytest.approx(330)
+        assert stadium_a.wall_distance(45) == pytest.approx(396)
+        assert stadium_a.wall_distance(90) == pytest.approx(330)
+        assert stadium_cut_lf.wall_distance(22.5) == pytest.approx(400)
+
+    def test_check_home_runs(self, stadium_a):
+        """The lookup table and the array version should match checking against the stadium polygon."""
+        generator = np.random.default_rng(383)
+        distances = generator.uniform(0, 500, 2000)
+        angles = np.radians(generator.uniform(-20, 110, 2000))
+        x, y = distances * np.cos(angles), distances * np.sin(angles)
+        home_runs, walls = stadium_a.check_home_runs(x, y)
+
+        for x_coord, y_coord, home_run, wall in zip(x, y, home_runs, walls):
+            location = geometry.Coord(x_coord, y_coord)
+            outside = not stadium_a.polygon.contains(location.to_point())
+            expected_wall = outside and stadium_a.polygon.contains(
+                location.move_towards(stadium_a.HOME_PLATE, stadium_a.walls).to_point()
+            )
+            expected = (outside and not expected_wall, expected_wall)
+            assert stadium_a.check_home_run(location) == expected
+            assert (home_run, wall) == expected
+        assert walls.any() and home_runs.any()
+
+    def test_shared_geometry(self, stadium_a):
+        same_stadium = stadium.Stadium(list(stadium.ANGELS_STADIUM))
+        assert same_stadium.geometry is stadium_a.geometry
+        assert stadium.Stadium([300, 400, 400, 400, 400]).geometry is not stadium_a.geometry
+        assert pickle.loads(pickle.dumps(stadium_a)).geometry is stadium_a.geometry
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stadium_a.geometry.mound = geometry.Coord(0, 0)
+        with pytest.raises(ValueError):
+            stadium_a.geometry.base_distances[0, 1] = 0
+
+    def test_base_distances(self, stadium_a):
+        distances = stadium_a.geometry.base_distances
+        assert distances.shape == (stadium_a.NUMBER_OF_BASES + 2,) * 2
+        for base in range(stadium_a.NUMBER_OF_BASES + 1):
+            assert distances[base, base + 1] == stadium_a.BASEPATH_LENGTH
+        assert distances[0, 2] == pytest.approx(stadium_a.BASEPATH_LENGTH * np.sqrt(2))
+        assert distances[0, 4] == 0
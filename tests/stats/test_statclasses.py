@@ -1,4 +1,5 @@
 import pytest
+import numpy
 
 from blaseball.stats import statclasses, playerbase
 from blaseball.stats import stats as s
@@ -106,6 +107,75 @@ class TestWeight:
 
         assert test_weight.calculate_value(10) == pytest.approx((0.5 * 2 + 1) / 3)
 
+    def test_weight_column(self, arbitrary_pb):
+        test_weight = statclasses.Weight("test weight", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        arbitrary_pb.stats['col1'].weight(test_weight, 2)
+        arbitrary_pb.stats['col5'].weight(test_weight, 0.5)
+        test_weight.extra_weight = 0.5
+
+        column = test_weight.calculate_column()
+        assert len(column) == len(arbitrary_pb.df.index)
+        for cid, value in zip(arbitrary_pb.df.index, column):
+            assert value == pytest.approx(test_weight.calculate_value(cid))
+
+    def test_weight_matrix(self, arbitrary_pb):
+        weight_1 = statclasses.Weight("test weight 1", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        weight_2 = statclasses.Weight("test weight 2", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        arbitrary_pb.stats['col1'].weight(weight_1, 2)
+        arbitrary_pb.stats['col3'].weight(weight_1, 1)
+        arbitrary_pb.stats['col3'].weight(weight_2, 0.5)
+        arbitrary_pb.stats['col5'].weight(weight_2, 1)
+
+        weight_matrix = arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent)
+        assert weight_matrix.weights == [weight_1, weight_2]
+        assert len(weight_matrix.inputs) == 3
+
+        columns = weight_matrix.calculate_columns(arbitrary_pb.df)
+        assert columns.shape == (len(arbitrary_pb.df.index), 2)
+        for i, cid in enumerate(arbitrary_pb.df.index):
+            assert columns[i, 0] == pytest.approx(weight_1.calculate_value(cid))
+            assert columns[i, 1] == pytest.approx(weight_2.calculate_value(cid))
+
+    def test_weight_matrix_invalidation(self, arbitrary_pb):
+        test_weight = statclasses.Weight("test weight", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        arbitrary_pb.stats['col1'].weight(test_weight, 1)
+        weight_matrix = arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent)
+        assert arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent) is weight_matrix
+
+        arbitrary_pb.stats['col3'].weight(test_weight, 1)
+        new_matrix = arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent)
+        assert new_matrix is not weight_matrix
+        assert len(new_matrix.inputs) == 2
+
+        test_weight.extra_weight = 2
+        assert arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent) is not new_matrix
+        cid = arbitrary_pb.df.index[1]
+        expected = (arbitrary_pb.df.at[cid, 'col1'] + arbitrary_pb.df.at[cid, 'col3']) / 4
+        assert test_weight.calculate_value(cid) == pytest.approx(expected)
+
+    def test_weight_matrix_same_kind(self, arbitrary_pb):
+        weight_1 = statclasses.Weight("test weight 1", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        weight_2 = statclasses.Weight("test weight 2", kind=statclasses.Kinds.test_dependent, playerbase=arbitrary_pb)
+        arbitrary_pb.stats['col1'].weight(weight_1, 1)
+        weight_1.weight(weight_2, 1)
+        assert arbitrary_pb.get_weight_matrix(statclasses.Kinds.test_dependent) is None
+
+
+class TestAveraging:
+    def test_averaging_column(self, arbitrary_pb):
+        average_stat, total_stat = statclasses.build_averaging(
+            arbitrary_pb.stats['col1'], 'test average', None,
+            statclasses.Kinds.test_dependent, statclasses.Kinds.test, arbitrary_pb
+        )
+        arbitrary_pb.df[total_stat.name] = [2, 2, 6, 2, 0]
+        assert list(average_stat.calculate_column()) == pytest.approx([2, 1, 2, 0.5, 0])
+
+        empty_average, __ = statclasses.build_averaging(
+            arbitrary_pb.stats['col0'], 'empty average', None,
+            statclasses.Kinds.test_dependent, statclasses.Kinds.test, arbitrary_pb
+        )
+        assert list(empty_average.calculate_column()) == [0.0] * 5
+
 
 @pytest.fixture
 def test_descriptor(arbitrary_pb):
@@ -327,6 +397,13 @@ class TestRating:
         test_rating = statclasses.Rating('test rating', personality, None, arbitrary_pb, statclasses.Kinds.test)
         assert test_rating.calculate_initial(cid) == pytest.approx(result)
 
+    def test_initial_column(self, arbitrary_pb, patcher):
+        patcher.patch('blaseball.stats.statclasses.rand', lambda count: numpy.full(count, 0.5))
+        personality = arbitrary_pb.stats['col5']
+        test_rating = statclasses.Rating('test rating', personality, None, arbitrary_pb, statclasses.Kinds.test)
+        results = test_rating.calculate_initial_column(arbitrary_pb.df)
+        assert list(results) == pytest.approx([0.25, 0.25, 0.4, 1.1, 1.5])
+
 
 def test_averaging(arbitrary_pb):
     count = statclasses.Stat(
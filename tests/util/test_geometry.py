@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
 from blaseball.util import geometry
 from blaseball.stats import lineup
+from blaseball.playball.simulation import build_lineup
 
 
 @pytest.fixture(scope='class')
@@ -36,6 +38,23 @@ class TestCoord:
         assert two_one.x == pytest.approx(2)
         assert two_one.y == pytest.approx(1)
 
+    def test_move_toward_bounds(self, zero_point):
+        one_zero = geometry.Coord(1, 0)
+        assert one_zero.move_towards(zero_point, 3) == zero_point
+        assert one_zero.move_towards(one_zero, 3) == one_zero
+        assert one_zero.move_towards(zero_point, -0.25).x == pytest.approx(0.25)
+        assert isinstance(one_zero.move_towards(zero_point, 0.5), geometry.Coord)
+
+    def test_slots(self, zero_point):
+        assert geometry.Coord(3, 4) == geometry.Coord(3, 4)
+        assert len({geometry.Coord(3, 4), geometry.Coord(3, 4), zero_point}) == 2
+        with pytest.raises(AttributeError):
+            zero_point.z = 1
+
+        polygon = geometry.to_polygon([zero_point, geometry.Coord(10, 0), geometry.Coord(0, 10)])
+        assert polygon.area == pytest.approx(50)
+        assert polygon.contains(geometry.Coord(2, 2).to_point())
+
 
 class TestDefenseGeo:
     # these tests are far from comprehensive.
@@ -91,3 +110,45 @@ class TestDefenseGeo:
 
             if i == len(nearest) - 1:
                 break
+
+
+@pytest.fixture(scope='class')
+def defense_2(generate_league_2):
+    return build_lineup("Test Lineup", generate_league_2[0].players).defense
+
+
+class TestDefenseLookups:
+    def test_closest_matches_search(self, defense_2):
+        generator = np.random.default_rng(383)
+        for x, y in generator.uniform(-50, 400, (50, 2)):
+            landing = geometry.Coord(x, y)
+            expected = min(
+                (position.location.distance(landing), position.position)
+                for position in defense_2.positions.values() if position.location is not None
+            )
+            position, distance = defense_2.closest(landing)
+            assert (distance, position.position) == expected
+            assert defense_2.rank_closest(landing, 1) == [(position, distance)]
+
+    def test_rank_closest_count(self, defense_2):
+        ranked = defense_2.rank_closest(geometry.Coord(100, 100))
+        assert [distance for __, distance in ranked] == sorted(distance for __, distance in ranked)
+        assert defense_2.rank_closest(geometry.Coord(100, 100), 3) == ranked[:3]
+
+    def test_closest_to_base(self, defense_2, stadium_a):
+        for base, location in enumerate(stadium_a.base_coords):
+            assert defense_2.closest_to_base(stadium_a.base_coords, base) == defense_2.closest(location)
+        assert len(defense_2._base_tables) == 1
+
+        defense_2.reset_layout()
+        assert not defense_2._base_tables
+        assert defense_2.closest_to_base(stadium_a.base_coords, 1) == defense_2.closest(stadium_a.FIRST_BASE)
+
+    def test_closest_to_many(self, defense_2):
+        x = np.array([0, 90, 300, -20])
+        y = np.array([0, 90, 250, 40])
+        positions, distances = defense_2.closest_to_many(x, y)
+        for i in range(len(x)):
+            position, distance = defense_2.closest(geometry.Coord(x[i], y[i]))
+            assert positions[i] is position
+            assert distances[i] == pytest.approx(distance)
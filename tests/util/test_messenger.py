@@ -1,7 +1,15 @@
 from enum import Enum
+from time import perf_counter
 
-from blaseball.util.messenger import Messenger, CircuitBreaker, BreakerError, CountStore, ReceivedArgument
+from blaseball.util.messenger import (
+    Messenger, CircuitBreaker, BreakerError, CountStore, ReceivedArgument, QueueOverflowError
+)
+from blaseball.playball.ballgame import BallGame
+from blaseball.playball.gamestate import GameRules
+from blaseball.playball.pitchmanager import PitchManager
+from blaseball.playball.simulation import build_lineup
 
+import numpy as np
 import pytest
 
 
@@ -128,6 +136,8 @@ class TestMessenger:
         counter = Receiver(m)
         m.send("this will throw an error", TestTags.count)
         assert "TypeError" in logger_store
+        assert m.listener_errors == 1
+        assert isinstance(m.last_listener_error, TypeError)
 
     def test_null_priority(self):
         Receiver.reset()
@@ -198,6 +208,46 @@ class TestQueues:
         # and thus slow_fn triggers before fast_fn
         assert TestQueues.global_list == [1, 2, 3]
 
+    def test_queue_burst(self):
+        m = Messenger()
+        received = []
+        m.subscribe(received.append, TestTags.count_2)
+
+        def burst(size):
+            for i in range(size):
+                m.queue(i, TestTags.count_2)
+
+        m.subscribe(burst, TestTags.count)
+        m.queue(5000, TestTags.count)
+
+        assert received == list(range(5000))
+        assert m.queue_metrics.messages == 5001
+        assert m.queue_metrics.peak_depth == 5000
+        assert m.queue_metrics.drains == 1
+        assert m.queue_metrics.drain_time > 0
+        assert isinstance(str(m.queue_metrics), str)
+
+    def test_queue_overflow(self):
+        m = Messenger(max_queue_depth=10)
+        received = []
+        m.subscribe(received.append, TestTags.count_2)
+
+        def burst(size):
+            for i in range(size):
+                m.queue(i, TestTags.count_2)
+
+        m.subscribe(burst, TestTags.count)
+        m.queue(10, TestTags.count)
+        assert received == list(range(10))
+
+        with pytest.raises(QueueOverflowError):
+            m.queue(11, TestTags.count)
+
+        # the queue was emptied, so the messenger still works afterwards
+        received.clear()
+        m.queue(3, TestTags.count)
+        assert received == [0, 1, 2]
+
 
 def fake_messenger_send(argument=None, tags=""):
     if not isinstance(tags, list):
@@ -255,6 +305,18 @@ class TestListeners:
         assert [item.argument for item in count_store_3.items] == [9, 8, 7]
         assert len(count_store_3) == 3
 
+    def test_countstore_caller(self):
+        m = Messenger()
+        count_store = CountStore(m, [TestTags.count, TestTags.count_2], -1)
+        m.send(1, TestTags.count)
+        m.queue(2, [TestTags.count_2])
+
+        assert count_store.items[1].tags == [TestTags.count]
+        assert count_store.items[1].great_grand_caller.function == "test_countstore_caller"
+        assert count_store.items[0].tags == [TestTags.count_2]
+        assert count_store.items[0].great_grand_caller.function == "queue"
+        assert "test_messenger.py" in repr(count_store.items[1].great_grand_caller)
+
     def test_countstore_clear(self):
         m = Messenger()
         count_store_3 = CountStore(m, TestTags.count, 3)
@@ -282,3 +344,67 @@ class TestListeners:
         assert inventory[TestTags.count] == 4
         assert inventory[TestTags.count_2] == 1
         assert inventory[TestTags.count_3] == 0
+
+    def test_has_listeners(self):
+        m = Messenger()
+        assert not m.has_listeners(TestTags.count)
+        r = Receiver(m)
+        assert m.has_listeners(TestTags.count)
+        assert m.has_listeners([TestTags.count_2, TestTags.count])
+        assert not m.has_listeners([TestTags.count_2, TestTags.count_3])
+        m.unsubscribe(r.increment, TestTags.count)
+        assert not m.has_listeners(TestTags.count)
+
+    def test_subscriptions_change_after_send(self):
+        m = Messenger()
+        r1 = Receiver(m)
+        m.send(1, [TestTags.count, TestTags.count_2])
+        assert r1.count == 1
+
+        r2 = Receiver()
+        m.subscribe(r2.increment, TestTags.count_2)
+        m.send(1, [TestTags.count, TestTags.count_2])
+        assert (r1.count, r2.count) == (2, 1)
+
+        m.unsubscribe(r1.increment, TestTags.count)
+        m.send(1, [TestTags.count, TestTags.count_2])
+        assert (r1.count, r2.count) == (2, 2)
+
+
+class TestMessengerThroughput:
+    def test_game_traffic(self, generate_league_2, stadium_a):
+        """Play a game, then replay everything it sent through a messenger with the same listeners
+        (doing nothing) to see how quickly messenger itself gets through a whole game."""
+        home = build_lineup("Home Lineup", generate_league_2[0].players)
+        away = build_lineup("Away Lineup", generate_league_2[1].players)
+        game = BallGame(Messenger(), home, away, stadium_a, GameRules(), generator=np.random.default_rng(383))
+        PitchManager(game.state, game.messenger)
+
+        traffic = []
+        live_send = game.messenger.send
+
+        def record(argument=None, tags=""):
+            traffic.append((argument, tags))
+            live_send(argument, tags)
+
+        game.messenger.send = record
+        game.start_game()
+        while game.live_game:
+            game.send_tick()
+
+        replay = Messenger()
+        for tag, priority_tuples in list(game.messenger.listeners.items()):
+            for priority, __ in priority_tuples:
+                replay.subscribe(lambda argument=None: None, tag, priority)
+
+        durations = []
+        for __ in range(5):
+            start = perf_counter()
+            for argument, tags in traffic:
+                replay.send(argument, tags)
+            durations += [perf_counter() - start]
+        duration = min(durations)
+
+        print(f"{len(traffic)} messages over {game.tick_count} ticks: "
+              f"{len(traffic) / duration:,.0f} messages/s")
+        assert len(traffic) > game.tick_count
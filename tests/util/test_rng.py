@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from blaseball.util import rng
+
+
+class TestRNG:
+    def test_seed(self):
+        rng.seed(383)
+        first = [rng.rand(), rng.normal(100, 5), rng.integers(10)]
+        rng.seed(383)
+        assert [rng.rand(), rng.normal(100, 5), rng.integers(10)] == first
+
+    def test_using(self):
+        outer = rng.get_stream()
+        stream = rng.RandomStream(np.random.default_rng(5))
+        with rng.using(stream):
+            assert rng.get_stream() is stream
+            assert rng.get_generator() is stream.generator
+            rolled = [rng.rand() for __ in range(3)]
+        assert rng.get_stream() is outer
+        assert rolled == list(np.random.default_rng(5).random(3))
+
+    def test_stream_blocks(self):
+        stream = rng.RandomStream(np.random.default_rng(5), block_size=4)
+        uniforms = [stream.uniform() for __ in range(10)]
+        normals = [stream.standard_normal() for __ in range(10)]
+        assert all(isinstance(roll, float) for roll in uniforms + normals)
+
+        generator = np.random.default_rng(5)
+        expected_uniforms = []
+        for __ in range(3):
+            expected_uniforms += list(generator.random(4))
+        assert uniforms == expected_uniforms[:10]
+        assert normals[:4] == list(generator.standard_normal(4))
+
+    def test_normal(self):
+        rng.seed(5)
+        rolls = [rng.normal(100, 5) for __ in range(1000)]
+        assert sum(rolls) / len(rolls) == pytest.approx(100, abs=1)
+        with pytest.raises(ValueError):
+            rng.normal(0, -1)
+        assert rng.normal(0, 1, size=3).shape == (3,)
+
+    def test_flavour(self):
+        def stream():
+            return rng.RandomStream(np.random.default_rng(5), flavour=np.random.default_rng(6))
+
+        quiet = stream()
+        quiet_rolls = [quiet.uniform(), quiet.standard_normal(), quiet.uniform()]
+        assert quiet._flavour is None
+
+        chatty = stream()
+        chatty_rolls = [chatty.uniform(), chatty.flavour.standard_normal(), chatty.standard_normal(), chatty.uniform()]
+        assert chatty_rolls[0:1] + chatty_rolls[2:] == quiet_rolls
+        assert chatty_rolls[1] == np.random.default_rng(6).standard_normal()
+
+        rng.seed(383)
+        first = [rng.get_stream().flavour.uniform(), rng.rand()]
+        rng.seed(383)
+        assert [rng.get_stream().flavour.uniform(), rng.rand()] == first
+
+    def test_spawn(self):
+        generators = rng.spawn(383, 3)
+        rolls = [generator.random() for generator in generators]
+        assert len(set(rolls)) == 3
+        assert [generator.random() for generator in rng.spawn(383, 3)] == rolls
+
+        seeds = rng.spawn_seeds(383, 3)
+        assert len(set(seeds)) == 3
+        assert rng.spawn_seeds(383, 3) == seeds
+        assert all(isinstance(seed, int) for seed in seeds)
+
+    def test_choice(self):
+        rng.seed(383)
+        names = ["Wyatt", "Mason"]
+        assert type(rng.choice(names)) is str
+        assert set(rng.choice(names, 10)) <= set(names)
+        assert rng.choice(range(-20, 20, 2)) in range(-20, 20, 2)
+
+    def test_shuffle(self):
+        items = list(range(20))
+        rng.shuffle(items)
+        assert sorted(items) == list(range(20))
+
+    def test_inverse_normal_cdf(self):
+        probabilities = np.concatenate([np.geomspace(1e-12, 0.5, 500), 1 - np.geomspace(1e-12, 0.5, 500)])
+        expected = norm.ppf(probabilities)
+        assert [rng.inverse_normal_cdf(p) for p in probabilities] == pytest.approx(list(expected), abs=1e-9)
+        assert rng.inverse_normal_cdf(probabilities) == pytest.approx(expected, abs=1e-9)
+
+        assert isinstance(rng.inverse_normal_cdf(0.6), float)
+        assert rng.inverse_normal_cdf(0.5) == 0
+        assert rng.inverse_normal_cdf(0) == -np.inf
+        assert rng.inverse_normal_cdf(1) == np.inf
+        assert np.isnan(rng.inverse_normal_cdf(1.2))
+        assert np.isnan(rng.inverse_normal_cdf(-0.1))
+
+    def test_inverse_normal_cdf_array(self):
+        probabilities = np.concatenate([
+            np.linspace(0, 1, 1001), np.geomspace(1e-300, 1e-3, 100), [-0.1, 1.2, np.nan]
+        ]).reshape(-1, 4)
+        assert probabilities.size >= rng.SMALL_ARRAY
+        results = rng.inverse_normal_cdf(probabilities)
+        assert results.shape == probabilities.shape
+        expected = [rng.inverse_normal_cdf(p) for p in probabilities.ravel()]
+        assert list(results.ravel()) == pytest.approx(expected, rel=1e-14, abs=1e-14, nan_ok=True)
+
+        small = probabilities[:3]
+        assert rng.inverse_normal_cdf(small) == pytest.approx(rng.inverse_normal_cdf(np.tile(small, (100, 1)))[:3])